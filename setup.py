@@ -65,11 +65,10 @@ setup(
         "Operating System :: MacOS",
 
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
     ],
     packages=packages,
+    python_requires=">=3.7",
     package_data=package_data,
     install_requires=['SpiNNUtilities >= 1!5.1.1, < 1!6.0.0',
                       'six'],
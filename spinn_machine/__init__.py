@@ -79,19 +79,45 @@ from spinn_machine._version import __version_year__  # NOQA
 from .chip import Chip
 from .core_subset import CoreSubset
 from .core_subsets import CoreSubsets
+from .data_load_scheduler import DataLoadScheduler
+from .ethernet_distances import EthernetDistances
+from .io_capacity_analyser import IOCapacityAnalyser
 from .link import Link
 from .machine import Machine
 from .multicast_routing_entry import MulticastRoutingEntry
+from .multicast_routing_entry_pool import MulticastRoutingEntryPool
+from .multicast_routing_table import MulticastRoutingTable
+from .multicast_routing_tables import MulticastRoutingTables
+from .multicast_tree_builder import MulticastTreeBuilder
+from .packet_flow_simulator import PacketFlowSimulator
 from .processor import Processor
 from .router import Router
+from .routing_table_conflicts import (
+    find_conflicting_entries, find_routing_table_conflicts,
+    find_shadowed_entries)
+from .routing_table_lookup import RoutingTableLookup
+from .routing_tracer import RoutingTracer
 from .sdram import SDRAM
 from .spinnaker_triad_geometry import SpiNNakerTriadGeometry
+from .traffic_load_estimator import TrafficLoadEstimator
+from .triad_geometry_registry import TriadGeometryRegistry
 from .virtual_machine import virtual_machine
 from .fixed_route_entry import FixedRouteEntry
-from .machine_factory import machine_from_chips, machine_from_size
-
-
-__all__ = ["Chip", "CoreSubset", "CoreSubsets", "FixedRouteEntry",
-           "Link", "Machine", "MulticastRoutingEntry",
-           "Processor", "Router", "SDRAM", "SpiNNakerTriadGeometry",
-           "virtual_machine", "machine_from_chips", "machine_from_size"]
+from .fixed_route_tables import FixedRouteTables
+from .fixed_route_trees import build_fixed_routes
+from .machine_factory import (
+    apply_ignores, machine_from_chips, machine_from_size)
+
+
+__all__ = ["Chip", "CoreSubset", "CoreSubsets", "DataLoadScheduler",
+           "EthernetDistances", "FixedRouteEntry", "FixedRouteTables",
+           "IOCapacityAnalyser",
+           "Link", "Machine", "MulticastRoutingEntry", "MulticastRoutingTable",
+           "MulticastRoutingEntryPool", "MulticastRoutingTables",
+           "MulticastTreeBuilder", "PacketFlowSimulator",
+           "Processor", "Router", "RoutingTableLookup", "RoutingTracer",
+           "SDRAM", "SpiNNakerTriadGeometry", "TrafficLoadEstimator",
+           "TriadGeometryRegistry",
+           "virtual_machine", "machine_from_chips", "machine_from_size",
+           "apply_ignores", "build_fixed_routes", "find_conflicting_entries",
+           "find_routing_table_conflicts", "find_shadowed_entries"]
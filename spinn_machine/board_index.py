@@ -0,0 +1,125 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+
+
+class BoardIndex(object):
+    """ The chips of one board of a machine, by their position in the local\
+        coordinates of the board, kept up to date as chips are added to the\
+        machine.
+    """
+
+    __slots__ = (
+        # The global (x, y) of each potential chip on the board
+        "_xys",
+        # The local (x, y) on the board of each potential chip
+        "_local_xys",
+        # The chip at each position, or None if there is no chip there
+        "_chips",
+        # The number of user processors of the chip at each position
+        "_user_cores"
+    )
+
+    def __init__(self, xys, local_xys):
+        """
+        :param xys: The global (x, y) of each potential chip on the board
+        :type xys: iterable(tuple(int,int))
+        :param local_xys: The local (x, y) on the board of each potential\
+            chip, in the same order as xys
+        :type local_xys: iterable(tuple(int,int))
+        """
+        self._xys = tuple(xys)
+        self._local_xys = tuple(local_xys)
+        self._chips = [None] * len(self._xys)
+        self._user_cores = array("H", bytes(2 * len(self._xys)))
+
+    def set_chip(self, position, chip):
+        """ Records the chip at a position on the board
+
+        :param position: The index of the chip in :py:attr:`xys`
+        :type position: int
+        :param chip: The chip at the position
+        :type chip: ~spinn_machine.Chip
+        :rtype: None
+        """
+        self._chips[position] = chip
+        self._user_cores[position] = chip.n_user_processors
+
+    @property
+    def xys(self):
+        """ The global (x, y) of each potential chip on the board
+
+        :rtype: tuple(tuple(int,int))
+        """
+        return self._xys
+
+    @property
+    def local_xys(self):
+        """ The local (x, y) on the board of each potential chip, in the\
+            order of :py:attr:`xys`
+
+        :rtype: tuple(tuple(int,int))
+        """
+        return self._local_xys
+
+    @property
+    def chips(self):
+        """ The chips that exist on the board
+
+        :rtype: list(~spinn_machine.Chip)
+        """
+        return [chip for chip in self._chips if chip is not None]
+
+    @property
+    def existing_xys(self):
+        """ The global (x, y) of the chips that exist on the board
+
+        :rtype: list(tuple(int,int))
+        """
+        return [xy for xy, chip in zip(self._xys, self._chips)
+                if chip is not None]
+
+    @property
+    def down_xys(self):
+        """ The global (x, y) of the potential chips that do not exist
+
+        :rtype: list(tuple(int,int))
+        """
+        return [xy for xy, chip in zip(self._xys, self._chips)
+                if chip is None]
+
+    @property
+    def down_local_xys(self):
+        """ The local (x, y) on the board of the potential chips that do\
+            not exist
+
+        :rtype: list(tuple(int,int))
+        """
+        return [xy for xy, chip in zip(self._local_xys, self._chips)
+                if chip is None]
+
+    @property
+    def user_cores(self):
+        """ The number of user processors of each potential chip on the\
+            board, in the order of :py:attr:`xys`; 0 for chips that do not\
+            exist
+
+        :rtype: array(int)
+        """
+        return self._user_cores
+
+    def __len__(self):
+        return len(self._xys)
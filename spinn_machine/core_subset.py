@@ -21,7 +21,7 @@ class CoreSubset(object):
     """
 
     __slots__ = (
-        "_x", "_y", "_processor_ids"
+        "_x", "_y", "_processor_ids", "_processor_mask"
     )
 
     def __init__(self, x, y, processor_ids):
@@ -36,6 +36,7 @@ class CoreSubset(object):
         self._x = x
         self._y = y
         self._processor_ids = OrderedSet()
+        self._processor_mask = 0
         for processor_id in processor_ids:
             self.add_processor(processor_id)
 
@@ -48,6 +49,7 @@ class CoreSubset(object):
         :rtype: None
         """
         self._processor_ids.add(processor_id)
+        self._processor_mask |= 1 << processor_id
 
     def __contains__(self, processor_id):
         return processor_id in self._processor_ids
@@ -79,6 +81,16 @@ class CoreSubset(object):
         """
         return iter(self._processor_ids)
 
+    @property
+    def processor_mask(self):
+        """ The subset of processor IDs on the chip as a bit mask, with bit\
+            p set if processor p is in the subset.  This is maintained as\
+            processors are added, so is free to read.
+
+        :rtype: int
+        """
+        return self._processor_mask
+
     def __repr__(self):
         return "{}:{}:{}".format(self._x, self._y, self._processor_ids)
 
@@ -14,8 +14,10 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from collections import OrderedDict
-from six import itervalues
+import struct
+from six import iteritems, itervalues
 from .core_subset import CoreSubset
+from .exceptions import SpinnMachineInvalidParameterException
 
 
 class CoreSubsets(object):
@@ -25,6 +27,12 @@ class CoreSubsets(object):
 
     __slots__ = ("_core_subsets", )
 
+    #: The little-endian format of one (x, y, processor_mask) record
+    MASK_RECORD_FORMAT = "HHI"
+
+    #: The little-endian format of one (x, y, n_chips, processor_mask) run
+    MASK_RUN_FORMAT = "HHHI"
+
     def __init__(self, core_subsets=None):
         """
         :param core_subsets: The cores for each desired chip
@@ -188,3 +196,93 @@ class CoreSubsets(object):
         :rtype: iterable(CoreSubset)
         """
         return self._core_subsets.values()
+
+    def split_by_board(self, machine):
+        """ Splits these core subsets into one CoreSubsets per board, keyed\
+            by the (x, y) coordinates of the Ethernet chip of that board.
+
+        The split is done per chip, not per core; the CoreSubset objects are\
+        shared with this CoreSubsets rather than copied, so changes made to\
+        a chip's subset after the split are seen by both.
+
+        :param machine: The machine the cores are on
+        :type machine: :py:class:`~spinn_machine.Machine`
+        :return: Mapping of Ethernet chip (x, y) to the cores on that board
+        :rtype: dict(tuple(int,int), CoreSubsets)
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If any of the chips is not in the machine
+        """
+        by_board = OrderedDict()
+        for xy, subset in iteritems(self._core_subsets):
+            chip = machine.get_chip_at(xy[0], xy[1])
+            if chip is None:
+                raise SpinnMachineInvalidParameterException(
+                    "core_subsets", str(xy),
+                    "There is no chip at this location in the machine")
+            board_xy = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+            board = by_board.get(board_xy)
+            if board is None:
+                board = CoreSubsets()
+                by_board[board_xy] = board
+            # pylint: disable=protected-access
+            board._core_subsets[xy] = subset
+        return by_board
+
+    @property
+    def processor_masks(self):
+        """ The (x, y, processor_mask) of each chip in the subsets, in the\
+            order the chips were added.
+
+        :rtype: iterable(tuple(int,int,int))
+        """
+        for (x, y), subset in iteritems(self._core_subsets):
+            yield x, y, subset.processor_mask
+
+    def pack_processor_masks(self):
+        """ Packs the processor masks of all the chips into a single buffer\
+            of little-endian (x, y, processor_mask) records, with x and y as\
+            16-bit values and processor_mask as a 32-bit value; see\
+            :py:attr:`MASK_RECORD_FORMAT`.
+
+        :return: A view of the packed records
+        :rtype: memoryview
+        """
+        words = []
+        for (x, y), subset in iteritems(self._core_subsets):
+            words.extend((x, y, subset.processor_mask))
+        return memoryview(struct.pack(
+            "<" + self.MASK_RECORD_FORMAT * len(self._core_subsets), *words))
+
+    def processor_mask_runs(self):
+        """ Compresses the processor masks into runs of chips with the same\
+            x coordinate, consecutive y coordinates and identical processor\
+            masks.  Chips are considered in (x, y) order.
+
+        :return: A list of (x, y, n_chips, processor_mask) where the run\
+            covers chips (x, y) to (x, y + n_chips - 1)
+        :rtype: list(tuple(int,int,int,int))
+        """
+        runs = []
+        last_x = last_y = last_mask = None
+        for (x, y) in sorted(self._core_subsets):
+            mask = self._core_subsets[x, y].processor_mask
+            if x == last_x and y == last_y + 1 and mask == last_mask:
+                run_x, run_y, n_chips, _ = runs[-1]
+                runs[-1] = (run_x, run_y, n_chips + 1, mask)
+            else:
+                runs.append((x, y, 1, mask))
+            last_x, last_y, last_mask = x, y, mask
+        return runs
+
+    def pack_processor_mask_runs(self):
+        """ Packs :py:meth:`processor_mask_runs` into a single buffer of\
+            little-endian (x, y, n_chips, processor_mask) records; see\
+            :py:attr:`MASK_RUN_FORMAT`.
+
+        :return: A view of the packed runs
+        :rtype: memoryview
+        """
+        runs = self.processor_mask_runs()
+        words = [word for run in runs for word in run]
+        return memoryview(struct.pack(
+            "<" + self.MASK_RUN_FORMAT * len(runs), *words))
@@ -0,0 +1,181 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+from .exceptions import SpinnMachineInvalidParameterException
+from .machine import Machine
+
+
+class DataLoadScheduler(object):
+    """ Schedules the loading of data onto the cores of a machine through\
+        its Ethernet chips, taking account of the bandwidth of each Ethernet\
+        chip and the hops from it to each core.
+
+        The time to load the data of a core through an Ethernet chip is\
+        modelled as the size of the data over the bandwidth of the Ethernet\
+        chip, plus a cost per hop from the Ethernet chip to the core.  Each\
+        core is loaded through either its own Ethernet chip or the nearest\
+        working Ethernet chip, as given by\
+        :py:attr:`~spinn_machine.Machine.ethernet_distances`.  The cores\
+        are assigned largest first to whichever of these would finish\
+        loading them soonest, which keeps the time until every Ethernet chip\
+        is done low; each Ethernet chip then loads its cores smallest first,\
+        which keeps the total time until each core is loaded low.
+
+        The plans of different Ethernet chips share nothing, so each can be\
+        run by a thread of its own.
+    """
+
+    __slots__ = (
+        # The machine being loaded
+        "_machine",
+        # The bytes per millisecond each Ethernet chip can send
+        "_bandwidth",
+        # The milliseconds added to the load of a core per hop
+        "_hop_time"
+    )
+
+    def __init__(
+            self, machine,
+            bandwidth=Machine.MAX_BANDWIDTH_PER_ETHERNET_CONNECTED_CHIP,
+            hop_time=0.01):
+        """
+        :param machine: The machine to load data onto
+        :type machine: ~spinn_machine.Machine
+        :param bandwidth: The bytes per millisecond each Ethernet chip can\
+            send to the chips of the machine
+        :type bandwidth: float
+        :param hop_time: The milliseconds added to the time to load the\
+            data of a core for each hop from the Ethernet chip to the core
+        :type hop_time: float
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the bandwidth is not positive or the hop time is negative
+        """
+        if bandwidth <= 0:
+            raise SpinnMachineInvalidParameterException(
+                "bandwidth", str(bandwidth), "must be positive")
+        if hop_time < 0:
+            raise SpinnMachineInvalidParameterException(
+                "hop_time", str(hop_time), "must not be negative")
+        self._machine = machine
+        self._bandwidth = bandwidth
+        self._hop_time = hop_time
+
+    def _load_time(self, n_bytes, hops):
+        return n_bytes / self._bandwidth + hops * self._hop_time
+
+    def _candidates(self, x, y):
+        """ The Ethernet chips that could load the data of a chip
+
+        :return: The (x, y) and hops to the chip of each Ethernet chip
+        :rtype: list(tuple(tuple(int,int), int))
+        """
+        distances = self._machine.ethernet_distances
+        candidates = list()
+        own_hops = distances.get_own_distance(x, y)
+        if own_hops is not None:
+            chip = self._machine.get_chip_at(x, y)
+            candidates.append(
+                ((chip.nearest_ethernet_x, chip.nearest_ethernet_y),
+                 own_hops))
+        nearest = distances.get_nearest_ethernet(x, y)
+        if nearest is not None and (
+                not candidates or candidates[0][0] != nearest):
+            candidates.append((nearest, distances.get_nearest_distance(x, y)))
+        return candidates
+
+    def schedule(self, data_sizes):
+        """ Plans the loading of the data of some cores
+
+        :param data_sizes: The (x, y, processor ID) of each core and the\
+            number of bytes to load onto it
+        :type data_sizes: dict(tuple(int,int,int), int) or\
+            iterable(tuple(tuple(int,int,int), int))
+        :return: For each Ethernet chip that has data to load, the\
+            (x, y, processor ID, number of bytes) of each core it loads, in\
+            the order it should load them
+        :rtype: dict(tuple(int,int), list(tuple(int,int,int,int)))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If a core is not on a chip of the machine, or no working\
+            Ethernet chip can reach it
+        """
+        if isinstance(data_sizes, dict):
+            data_sizes = data_sizes.items()
+        distances = self._machine.ethernet_distances
+        candidates_by_chip = dict()
+        loads = list()
+        for (x, y, p), n_bytes in data_sizes:
+            candidates = candidates_by_chip.get((x, y))
+            if candidates is None:
+                if (x, y) not in distances:
+                    raise SpinnMachineInvalidParameterException(
+                        "data_sizes", str((x, y, p)),
+                        "There is no chip at this location in the machine")
+                candidates = self._candidates(x, y)
+                if not candidates:
+                    raise SpinnMachineInvalidParameterException(
+                        "data_sizes", str((x, y, p)),
+                        "No working Ethernet chip can reach this chip")
+                candidates_by_chip[x, y] = candidates
+            loads.append((x, y, p, n_bytes))
+
+        # Largest first to the Ethernet chip that would finish soonest
+        finish = dict()
+        plans = dict()
+        loads.sort(key=lambda load: (-load[3], load[:3]))
+        for load in loads:
+            best = None
+            for ethernet_xy, hops in candidates_by_chip[load[0], load[1]]:
+                end = finish.get(ethernet_xy, 0.0) + self._load_time(
+                    load[3], hops)
+                if best is None or (end, hops) < best[:2]:
+                    best = (end, hops, ethernet_xy)
+            end, hops, ethernet_xy = best
+            finish[ethernet_xy] = end
+            plans.setdefault(ethernet_xy, list()).append(
+                (self._load_time(load[3], hops), load))
+
+        # Smallest first within each Ethernet chip
+        scheduled = OrderedDict()
+        for ethernet_xy in distances.ethernet_xys:
+            if ethernet_xy in plans:
+                scheduled[ethernet_xy] = [
+                    load for _, load in sorted(plans[ethernet_xy])]
+        return scheduled
+
+    def load_times(self, plans):
+        """ Estimates the time each Ethernet chip takes to run its plan
+
+        :param plans: The plans, as returned by :py:meth:`schedule`
+        :type plans: dict(tuple(int,int), list(tuple(int,int,int,int)))
+        :return: The milliseconds each Ethernet chip takes
+        :rtype: dict(tuple(int,int), float)
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If a plan loads a core through an Ethernet chip that is neither\
+            the own nor the nearest Ethernet chip of the core
+        """
+        times = OrderedDict()
+        for ethernet_xy, plan in plans.items():
+            total = 0.0
+            for x, y, p, n_bytes in plan:
+                hops = dict(self._candidates(x, y)).get(ethernet_xy)
+                if hops is None:
+                    raise SpinnMachineInvalidParameterException(
+                        "plans", str((x, y, p)),
+                        "Ethernet chip {} does not load this chip".format(
+                            ethernet_xy))
+                total += self._load_time(n_bytes, hops)
+            times[ethernet_xy] = total
+        return times
@@ -0,0 +1,240 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+from collections import deque
+from .topology import link_adjacency
+
+#: The distance recorded for a chip that no Ethernet chip can reach
+UNREACHABLE = -1
+
+
+class EthernetDistances(object):
+    """ The hop distance over the working links of a machine from the\
+        Ethernet chips to every chip; both from the chip's own Ethernet chip\
+        (given by its nearest_ethernet_x and nearest_ethernet_y) and from\
+        whichever working Ethernet chip is nearest.
+
+    Distances are held in arrays indexed by the position of the chip in\
+    :py:attr:`chip_coordinates`, with :py:data:`UNREACHABLE` for chips that\
+    cannot be reached.  Virtual chips are left out, as packets can not pass\
+    through them.  The distances are of the machine as it was when they were\
+    computed; later changes to the machine are not seen.
+    """
+
+    __slots__ = (
+        # The (x, y) of each chip, in the order of the arrays
+        "_xys",
+        # Dict of (x, y) to index of the chip in the arrays
+        "_index",
+        # The (x, y) of each working Ethernet chip
+        "_ethernet_xys",
+        # Hops from the own Ethernet chip of each chip
+        "_own_distances",
+        # Hops from the nearest working Ethernet chip of each chip
+        "_nearest_distances",
+        # Index in _ethernet_xys of the nearest Ethernet chip of each chip
+        "_nearest_ethernets"
+    )
+
+    def __init__(self, machine):
+        """
+        :param machine: The machine to compute the distances of
+        :type machine: ~spinn_machine.Machine
+        """
+        self._xys = [
+            (chip.x, chip.y) for chip in machine.chips if not chip.virtual]
+        self._index = {xy: i for i, xy in enumerate(self._xys)}
+        self._ethernet_xys = tuple(
+            (chip.x, chip.y) for chip in machine.ethernet_connected_chips
+            if not chip.virtual)
+
+        index = self._index
+        neighbours = [None] * len(self._xys)
+        for xy, links in link_adjacency(machine).items():
+            if xy in index:
+                neighbours[index[xy]] = tuple(
+                    index[dest] for _, dest in links if dest in index)
+
+        self._nearest_distances, self._nearest_ethernets = self._search(
+            neighbours, [index[xy] for xy in self._ethernet_xys])
+        self._own_distances = self._own_search(machine, neighbours)
+
+    @staticmethod
+    def _search(neighbours, sources):
+        """ Breadth first search from all the sources at once
+
+        :param neighbours: The indices of the chips linked to from each chip
+        :param sources: The indices of the chips to search from
+        :return: The distance of each chip from the nearest source, and the\
+            position in sources of that source
+        :rtype: tuple(array, array)
+        """
+        distances = array("i", [UNREACHABLE]) * len(neighbours)
+        nearest = array("i", [UNREACHABLE]) * len(neighbours)
+        queue = deque()
+        for source_id, source in enumerate(sources):
+            distances[source] = 0
+            nearest[source] = source_id
+            queue.append(source)
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            source_id = nearest[current]
+            for neighbour in neighbours[current]:
+                if distances[neighbour] == UNREACHABLE:
+                    distances[neighbour] = distance
+                    nearest[neighbour] = source_id
+                    queue.append(neighbour)
+        return distances, nearest
+
+    def _own_search(self, machine, neighbours):
+        """ Breadth first search from each Ethernet chip, which stops once\
+            all the chips that have it as their own Ethernet chip are found
+
+        :param machine: The machine the distances are of
+        :type machine: ~spinn_machine.Machine
+        :param neighbours: The indices of the chips linked to from each chip
+        :rtype: array
+        """
+        distances = array("i", [UNREACHABLE]) * len(neighbours)
+        boards = dict()
+        for chip in machine.chips:
+            if not chip.virtual:
+                boards.setdefault(
+                    (chip.nearest_ethernet_x, chip.nearest_ethernet_y),
+                    set()).add(self._index[chip.x, chip.y])
+        for ethernet_xy in self._ethernet_xys:
+            remaining = boards.get(ethernet_xy)
+            if not remaining:
+                continue
+            source = self._index[ethernet_xy]
+            seen = {source: 0}
+            queue = deque([source])
+            remaining.discard(source)
+            distances[source] = 0
+            while queue and remaining:
+                current = queue.popleft()
+                distance = seen[current] + 1
+                for neighbour in neighbours[current]:
+                    if neighbour not in seen:
+                        seen[neighbour] = distance
+                        queue.append(neighbour)
+                        if neighbour in remaining:
+                            remaining.discard(neighbour)
+                            distances[neighbour] = distance
+        return distances
+
+    @property
+    def chip_coordinates(self):
+        """ The (x, y) coordinates of the chips, in the order of the arrays
+
+        :rtype: list(tuple(int,int))
+        """
+        return self._xys
+
+    @property
+    def ethernet_xys(self):
+        """ The (x, y) coordinates of the working Ethernet chips, in the\
+            order used by :py:attr:`nearest_ethernets`
+
+        :rtype: tuple(tuple(int,int))
+        """
+        return self._ethernet_xys
+
+    @property
+    def own_distances(self):
+        """ The hops from the own Ethernet chip of each chip
+
+        :rtype: array(int)
+        """
+        return self._own_distances
+
+    @property
+    def nearest_distances(self):
+        """ The hops from the nearest working Ethernet chip of each chip
+
+        :rtype: array(int)
+        """
+        return self._nearest_distances
+
+    @property
+    def nearest_ethernets(self):
+        """ The index in :py:attr:`ethernet_xys` of the nearest working\
+            Ethernet chip of each chip; where several are as near, this is\
+            one of them
+
+        :rtype: array(int)
+        """
+        return self._nearest_ethernets
+
+    def _value(self, values, x, y):
+        value = values[self._index[x, y]]
+        if value == UNREACHABLE:
+            return None
+        return value
+
+    def get_own_distance(self, x, y):
+        """ Get the hops from the own Ethernet chip of a chip
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :return: The hops, or None if the chip can not be reached from it
+        :rtype: int or None
+        :raise KeyError: If the chip is not in the machine
+        """
+        return self._value(self._own_distances, x, y)
+
+    def get_nearest_distance(self, x, y):
+        """ Get the hops from the nearest working Ethernet chip of a chip
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :return: The hops, or None if no Ethernet chip can reach the chip
+        :rtype: int or None
+        :raise KeyError: If the chip is not in the machine
+        """
+        return self._value(self._nearest_distances, x, y)
+
+    def get_nearest_ethernet(self, x, y):
+        """ Get the nearest working Ethernet chip of a chip
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :return: The (x, y) of the Ethernet chip, or None if no Ethernet\
+            chip can reach the chip
+        :rtype: tuple(int,int) or None
+        :raise KeyError: If the chip is not in the machine
+        """
+        ethernet_id = self._value(self._nearest_ethernets, x, y)
+        if ethernet_id is None:
+            return None
+        return self._ethernet_xys[ethernet_id]
+
+    def __len__(self):
+        return len(self._xys)
+
+    def __contains__(self, x_y_tuple):
+        return x_y_tuple in self._index
+
+    def __repr__(self):
+        return "[EthernetDistances: {} chips, {} Ethernet chips]".format(
+            len(self._xys), len(self._ethernet_xys))
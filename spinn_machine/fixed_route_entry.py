@@ -13,38 +13,99 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
 from .exceptions import SpinnMachineAlreadyExistsException
+from .multicast_routing_table import UINT32
+from .router import Router
 
 
 class FixedRouteEntry(object):
     """ Describes an entry in a SpiNNaker chip's fixed route routing table.
+
+        The entry is stored as the route word used by the machine; the sets\
+        of processor and link IDs are worked out from it when first asked\
+        for.
     """
 
     __slots__ = (
 
-        # the processors IDs for this route
+        # the route word of this route
+        "_spinnaker_route",
+
+        # the processors IDs for this route, or None if not yet worked out
         "_processor_ids",
 
-        # the link IDs for this route
+        # the link IDs for this route, or None if not yet worked out
         "_link_ids"
     )
 
     def __init__(self, processor_ids, link_ids):
+        """
+        :param processor_ids: The destination processor IDs
+        :type processor_ids: iterable(int)
+        :param link_ids: The destination link IDs
+        :type link_ids: iterable(int)
+        :raise spinn_machine.exceptions.SpinnMachineAlreadyExistsException:
+            * If processor_ids contains the same ID more than once
+            * If link_ids contains the same ID more than once
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If any of the IDs is out of range
+        """
         # Add processor IDs, checking that there is only one of each
-        self._processor_ids = set()
+        route = 0
         for processor_id in processor_ids:
-            if processor_id in self._processor_ids:
+            bit = Router.convert_routing_ids_to_spinnaker_route(
+                (processor_id, ), ())
+            if route & bit:
                 raise SpinnMachineAlreadyExistsException(
                     "processor ID", str(processor_id))
-            self._processor_ids.add(processor_id)
+            route |= bit
 
         # Add link IDs, checking that there is only one of each
-        self._link_ids = set()
         for link_id in link_ids:
-            if link_id in self._link_ids:
+            bit = Router.convert_routing_ids_to_spinnaker_route(
+                (), (link_id, ))
+            if route & bit:
                 raise SpinnMachineAlreadyExistsException(
                     "link ID", str(link_id))
-            self._link_ids.add(link_id)
+            route |= bit
+
+        self._spinnaker_route = route
+        self._processor_ids = None
+        self._link_ids = None
+
+    @staticmethod
+    def from_spinnaker_route(spinnaker_route):
+        """ Creates an entry from a route word
+
+        :param spinnaker_route: The route word
+        :type spinnaker_route: int
+        :rtype: FixedRouteEntry
+        """
+        entry = FixedRouteEntry((), ())
+        entry._spinnaker_route = spinnaker_route
+        return entry
+
+    @staticmethod
+    def from_spinnaker_routes(spinnaker_routes):
+        """ Creates an entry from each of many route words
+
+        :param spinnaker_routes: The route words
+        :type spinnaker_routes: iterable(int)
+        :rtype: list(FixedRouteEntry)
+        """
+        return [FixedRouteEntry.from_spinnaker_route(route)
+                for route in spinnaker_routes]
+
+    @staticmethod
+    def to_spinnaker_routes(entries):
+        """ Gets the route words of many entries
+
+        :param entries: The entries
+        :type entries: iterable(FixedRouteEntry)
+        :rtype: array(int)
+        """
+        return array(UINT32, (entry.spinnaker_route for entry in entries))
 
     @property
     def processor_ids(self):
@@ -53,6 +114,8 @@ class FixedRouteEntry(object):
         :return: An iterable of processor IDs
         :rtype: iterable(int)
         """
+        if self._processor_ids is None:
+            self._calc_routing_ids()
         return self._processor_ids
 
     @property
@@ -62,9 +125,36 @@ class FixedRouteEntry(object):
         :return: An iterable of link IDs
         :rtype: iterable(int)
         """
+        if self._link_ids is None:
+            self._calc_routing_ids()
         return self._link_ids
 
+    @property
+    def spinnaker_route(self):
+        """ The route word of the entry, as used by the machine
+
+        :rtype: int
+        """
+        return self._spinnaker_route
+
+    def _calc_routing_ids(self):
+        processor_ids, link_ids = Router.decode_spinnaker_route(
+            self._spinnaker_route)
+        self._processor_ids = set(processor_ids)
+        self._link_ids = set(link_ids)
+
+    def __eq__(self, other):
+        if not isinstance(other, FixedRouteEntry):
+            return False
+        return self._spinnaker_route == other._spinnaker_route
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._spinnaker_route)
+
     def __repr__(self):
         return ("{%s}:{%s}" % (
-            ", ".join(map(str, self._link_ids)),
-            ", ".join(map(str, self._processor_ids))))
+            ", ".join(map(str, sorted(self.link_ids))),
+            ", ".join(map(str, sorted(self.processor_ids)))))
@@ -0,0 +1,185 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+import struct
+from .exceptions import SpinnMachineAlreadyExistsException
+from .fixed_route_entry import FixedRouteEntry
+
+
+class FixedRouteTables(object):
+    """ The fixed route of each chip of a machine, keyed by the (x, y)\
+        coordinates of the chip, stored as route words.
+
+        The routes can be packed into a buffer of little-endian\
+        (x, y, route) records, with x and y as 16-bit values and the route\
+        as a 32-bit value; see :py:attr:`RECORD_FORMAT`.
+    """
+
+    __slots__ = (
+        # Dict of (x, y) to the route word of the chip
+        "_routes",
+    )
+
+    #: The little-endian format of one (x, y, route) record
+    RECORD_FORMAT = "HHI"
+
+    def __init__(self, fixed_routes=None):
+        """
+        :param fixed_routes: The (x, y) and entry of each chip to start with
+        :type fixed_routes:\
+            iterable(tuple(tuple(int,int), FixedRouteEntry)) or None
+        :raise spinn_machine.exceptions.SpinnMachineAlreadyExistsException:\
+            If there are two entries for the same chip
+        """
+        self._routes = OrderedDict()
+        if fixed_routes is not None:
+            for (x, y), entry in fixed_routes:
+                self.add_fixed_route(x, y, entry)
+
+    @staticmethod
+    def from_spinnaker_routes(spinnaker_routes):
+        """ Creates the tables from the route word of each chip, such as\
+            those made by :py:func:`~spinn_machine.build_fixed_routes`
+
+        :param spinnaker_routes: The route word of each chip
+        :type spinnaker_routes: dict(tuple(int,int), int)
+        :rtype: FixedRouteTables
+        """
+        tables = FixedRouteTables()
+        tables._routes.update(spinnaker_routes)
+        return tables
+
+    def add_fixed_route(self, x, y, fixed_route):
+        """ Adds the fixed route of a chip
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :param fixed_route: The route of the chip
+        :type fixed_route: FixedRouteEntry
+        :rtype: None
+        :raise spinn_machine.exceptions.SpinnMachineAlreadyExistsException:\
+            If there is already a route for the chip
+        """
+        self.add_spinnaker_route(x, y, fixed_route.spinnaker_route)
+
+    def add_spinnaker_route(self, x, y, spinnaker_route):
+        """ Adds the fixed route of a chip as a route word
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :param spinnaker_route: The route word of the chip
+        :type spinnaker_route: int
+        :rtype: None
+        :raise spinn_machine.exceptions.SpinnMachineAlreadyExistsException:\
+            If there is already a route for the chip
+        """
+        if (x, y) in self._routes:
+            raise SpinnMachineAlreadyExistsException(
+                "fixed route for chip", "{}, {}".format(x, y))
+        self._routes[x, y] = spinnaker_route
+
+    def get_fixed_route(self, x, y):
+        """ Gets the fixed route of a chip
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :return: The route, or None if the chip has no route
+        :rtype: FixedRouteEntry or None
+        """
+        route = self._routes.get((x, y))
+        if route is None:
+            return None
+        return FixedRouteEntry.from_spinnaker_route(route)
+
+    @property
+    def chip_coordinates(self):
+        """ The (x, y) coordinates of the chips that have routes
+
+        :rtype: iterable(tuple(int,int))
+        """
+        return self._routes.keys()
+
+    @property
+    def fixed_routes(self):
+        """ The (x, y) coordinates and route of each chip
+
+        :rtype: iterable(tuple(tuple(int,int), FixedRouteEntry))
+        """
+        for xy, route in self._routes.items():
+            yield xy, FixedRouteEntry.from_spinnaker_route(route)
+
+    def __iter__(self):
+        return self.fixed_routes
+
+    def __len__(self):
+        return len(self._routes)
+
+    def __contains__(self, x_y_tuple):
+        return x_y_tuple in self._routes
+
+    def __getitem__(self, x_y_tuple):
+        return FixedRouteEntry.from_spinnaker_route(self._routes[x_y_tuple])
+
+    def pack(self):
+        """ Packs the routes into a buffer of (x, y, route) records
+
+        :return: A view of the packed records
+        :rtype: memoryview
+        """
+        buffer = bytearray(struct.calcsize(
+            "<" + self.RECORD_FORMAT) * len(self._routes))
+        self.pack_into(buffer)
+        return memoryview(buffer)
+
+    def pack_into(self, buffer, offset=0):
+        """ Packs the routes into part of an existing buffer as\
+            (x, y, route) records
+
+        :param buffer: The writable buffer to pack into
+        :type buffer: bytearray or memoryview
+        :param offset: The offset in bytes into the buffer to pack at
+        :type offset: int
+        :rtype: None
+        """
+        words = list()
+        for (x, y), route in self._routes.items():
+            words.extend((x, y, route))
+        struct.pack_into(
+            "<" + self.RECORD_FORMAT * len(self._routes), buffer, offset,
+            *words)
+
+    @staticmethod
+    def unpack(buffer):
+        """ Creates the tables from a buffer of packed (x, y, route) records
+
+        :param buffer: The packed records
+        :type buffer: bytes or bytearray or memoryview
+        :rtype: FixedRouteTables
+        """
+        tables = FixedRouteTables()
+        for x, y, route in struct.iter_unpack(
+                "<" + FixedRouteTables.RECORD_FORMAT, buffer):
+            tables.add_spinnaker_route(x, y, route)
+        return tables
+
+    def __repr__(self):
+        return "[FixedRouteTables: {} chips]".format(len(self._routes))
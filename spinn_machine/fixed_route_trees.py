@@ -0,0 +1,138 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from .exceptions import SpinnMachineInvalidParameterException
+from .router import Router
+from .topology import link_adjacency
+
+
+def build_board_fixed_routes(
+        board_adjacency, ethernet_xy, destination_processor):
+    """ Builds the fixed routes of the chips of one board, forming a tree of\
+        shortest paths over the given links to a processor on the Ethernet\
+        chip of the board.
+
+    The tree is balanced by giving each chip, starting with those nearest\
+    the Ethernet chip, the parent one hop nearer in the branch of the tree\
+    with the fewest chips so far, so that the chips are spread as evenly\
+    as the links allow across the links into the Ethernet chip, which\
+    carry the most traffic.
+
+    :param board_adjacency: The links of each chip of the board that go to\
+        other chips of the board; see\
+        :py:func:`~spinn_machine.topology.link_adjacency`
+    :type board_adjacency:\
+        dict(tuple(int,int), tuple(tuple(int, tuple(int,int))))
+    :param ethernet_xy: The (x, y) of the Ethernet chip of the board
+    :type ethernet_xy: tuple(int,int)
+    :param destination_processor: The processor on the Ethernet chip that\
+        the routes end at
+    :type destination_processor: int
+    :return: The route word of each chip that can reach the Ethernet chip;\
+        chips that cannot are left out
+    :rtype: dict(tuple(int,int), int)
+    """
+    # Breadth-first search back along the links from the Ethernet chip
+    senders = dict((xy, list()) for xy in board_adjacency)
+    for xy, links in board_adjacency.items():
+        for _, other_xy in links:
+            senders[other_xy].append(xy)
+    layers = [[ethernet_xy]]
+    distances = {ethernet_xy: 0}
+    while layers[-1]:
+        layer = list()
+        for xy in layers[-1]:
+            for sender_xy in senders[xy]:
+                if sender_xy not in distances:
+                    distances[sender_xy] = len(layers)
+                    layer.append(sender_xy)
+        layers.append(layer)
+
+    # Choose parents from the inside out, each joining the branch from the
+    # Ethernet chip with the fewest chips in it so far
+    routes = {ethernet_xy: 1 << (
+        Router.MAX_LINKS_PER_ROUTER + destination_processor)}
+    branches = dict()
+    branch_sizes = dict()
+    for distance in range(1, len(layers)):
+        for xy in layers[distance]:
+            link_id, parent_xy = min(
+                ((link_id, other_xy)
+                 for link_id, other_xy in board_adjacency[xy]
+                 if distances.get(other_xy) == distance - 1),
+                key=lambda link: (
+                    branch_sizes.get(branches.get(link[1]), 0), link[0]))
+            branch = xy if distance == 1 else branches[parent_xy]
+            branches[xy] = branch
+            branch_sizes[branch] = branch_sizes.get(branch, 0) + 1
+            routes[xy] = 1 << link_id
+    return routes
+
+
+def build_fixed_routes(machine, destination_processor, n_processes=1):
+    """ Builds the fixed routes of every chip of a machine, forming a tree on\
+        each board to a processor on the Ethernet chip of that board, over\
+        only the links of the machine between chips of the same board;\
+        see :py:func:`build_board_fixed_routes`.
+
+    :param machine: The machine
+    :type machine: ~spinn_machine.Machine
+    :param destination_processor: The processor on each Ethernet chip that\
+        the routes end at
+    :type destination_processor: int
+    :param n_processes: The number of processes to build the boards' trees\
+        in parallel with; 1 builds them in this process
+    :type n_processes: int
+    :return: The route word of each chip that can reach its Ethernet chip,\
+        board by board
+    :rtype: dict(tuple(int,int), int)
+    :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+        If the destination processor is not a valid processor ID
+    """
+    if not 0 <= destination_processor < Router.MAX_CORES_PER_ROUTER:
+        raise SpinnMachineInvalidParameterException(
+            "destination_processor", str(destination_processor),
+            "Processor IDs must be between 0 and " +
+            str(Router.MAX_CORES_PER_ROUTER - 1))
+    adjacency = link_adjacency(machine)
+    jobs = list()
+    for ethernet in machine.ethernet_connected_chips:
+        board = set(machine.get_existing_xys_by_ethernet(
+            ethernet.x, ethernet.y))
+        board_adjacency = dict(
+            (xy, tuple(link for link in adjacency[xy] if link[1] in board))
+            for xy in board)
+        jobs.append((board_adjacency, (ethernet.x, ethernet.y)))
+
+    if n_processes > 1:
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            boards = list(executor.map(
+                build_board_fixed_routes,
+                [board_adjacency for board_adjacency, _ in jobs],
+                [ethernet_xy for _, ethernet_xy in jobs],
+                [destination_processor] * len(jobs),
+                chunksize=max(1, len(jobs) // (n_processes * 4))))
+    else:
+        boards = [
+            build_board_fixed_routes(
+                board_adjacency, ethernet_xy, destination_processor)
+            for board_adjacency, ethernet_xy in jobs]
+
+    routes = OrderedDict()
+    for board_routes in boards:
+        routes.update(board_routes)
+    return routes
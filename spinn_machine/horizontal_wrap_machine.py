@@ -50,30 +50,6 @@ class HorizontalWrapMachine(Machine):
         for (x, y), n_cores in self.CHIPS_PER_BOARD.items():
             yield(((x + ethernet_x) % self._width, (y + ethernet_y)), n_cores)
 
-    @overrides(Machine.get_chips_by_ethernet)
-    def get_chips_by_ethernet(self, ethernet_x, ethernet_y):
-        for (x, y) in self._local_xys:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y))
-            if (chip_xy) in self._chips:
-                yield self._chips[chip_xy]
-
-    @overrides(Machine.get_existing_xys_by_ethernet)
-    def get_existing_xys_by_ethernet(self, ethernet_x, ethernet_y):
-        for (x, y) in self._local_xys:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y))
-            if (chip_xy) in self._chips:
-                yield chip_xy
-
-    @overrides(Machine.get_down_xys_by_ethernet)
-    def get_down_xys_by_ethernet(self, ethernet_x, ethernet_y):
-        for (x, y) in self._local_xys:
-            chip_xy = ((x + ethernet_x) % self._width,
-                       (y + ethernet_y))
-            if (chip_xy) not in self._chips:
-                yield chip_xy
-
     @overrides(Machine.xy_over_link)
     def xy_over_link(self, x, y, link):
         add_x, add_y = Machine.LINK_ADD_TABLE[link]
@@ -16,5 +16,6 @@
 from .ignore_chip import IgnoreChip
 from .ignore_core import IgnoreCore
 from .ignore_link import IgnoreLink
+from .resolve_ignores import resolve_ignores
 
-__all__ = ["IgnoreChip", "IgnoreCore", "IgnoreLink"]
+__all__ = ["IgnoreChip", "IgnoreCore", "IgnoreLink", "resolve_ignores"]
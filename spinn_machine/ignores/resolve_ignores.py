@@ -0,0 +1,96 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from .ignore_chip import IgnoreChip
+from .ignore_core import IgnoreCore
+from .ignore_link import IgnoreLink
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_ignores(
+        machine, chips=None, cores=None, links=None, ethernet_xys=None):
+    """ Converts ignores, some of which may be in coordinates local to the\
+        board with a given IP address, to global coordinates on a machine.
+
+    Each ignore may be an :py:class:`IgnoreChip`, :py:class:`IgnoreCore` or\
+    :py:class:`IgnoreLink` as appropriate, or a plain tuple of global\
+    coordinates (and processor or link ID).  Cores are given by their\
+    virtual processor ID.  Ignores for an IP address with no Ethernet chip\
+    are left out with a warning.
+
+    :param machine: The machine whose coordinates are wanted
+    :type machine: ~spinn_machine.Machine
+    :param chips: The chips to ignore
+    :type chips: iterable(IgnoreChip or tuple(int,int)) or None
+    :param cores: The cores to ignore
+    :type cores: iterable(IgnoreCore or tuple(int,int,int)) or None
+    :param links: The links to ignore
+    :type links: iterable(IgnoreLink or tuple(int,int,int)) or None
+    :param ethernet_xys: The (x, y) of the Ethernet chip with each IP\
+        address; if None, the Ethernet chips of the machine are used
+    :type ethernet_xys: dict(str, tuple(int,int)) or None
+    :return: The global (x, y) of the chips, (x, y, processor ID) of the\
+        cores and (x, y, link ID) of the links to ignore
+    :rtype: tuple(set(tuple(int,int)), set(tuple(int,int,int)),\
+        set(tuple(int,int,int)))
+    """
+    if ethernet_xys is None:
+        ethernet_xys = machine.ethernet_xys_by_ip_address
+    unknown = set()
+
+    def global_xy(ignore):
+        if ignore.ip_address is None:
+            return ignore.x, ignore.y
+        ethernet_xy = ethernet_xys.get(ignore.ip_address)
+        if ethernet_xy is None:
+            unknown.add(ignore.ip_address)
+            return None
+        return machine.get_global_xy(
+            ignore.x, ignore.y, ethernet_xy[0], ethernet_xy[1])
+
+    ignored_chips = set()
+    for chip in chips or ():
+        if isinstance(chip, IgnoreChip):
+            xy = global_xy(chip)
+            if xy is not None:
+                ignored_chips.add(xy)
+        else:
+            ignored_chips.add((chip[0], chip[1]))
+
+    ignored_cores = set()
+    for core in cores or ():
+        if isinstance(core, IgnoreCore):
+            xy = global_xy(core)
+            if xy is not None:
+                ignored_cores.add((xy[0], xy[1], core.virtual_p))
+        else:
+            ignored_cores.add((core[0], core[1], core[2]))
+
+    ignored_links = set()
+    for link in links or ():
+        if isinstance(link, IgnoreLink):
+            xy = global_xy(link)
+            if xy is not None:
+                ignored_links.add((xy[0], xy[1], link.link))
+        else:
+            ignored_links.add((link[0], link[1], link[2]))
+
+    for ip_address in sorted(unknown):
+        logger.warning(
+            "Ignores for %s are not used as there is no Ethernet chip with "
+            "that address", ip_address)
+    return ignored_chips, ignored_cores, ignored_links
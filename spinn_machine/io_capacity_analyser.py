@@ -0,0 +1,224 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+from .exceptions import SpinnMachineInvalidParameterException
+from .machine import Machine
+from .topology import link_adjacency
+
+#: Roughly the bytes per millisecond one link between chips can carry; an
+#: inter-chip link carries about 250 Mbit/s, which is 250000 bits or 31250
+#: bytes per millisecond (the same units as
+#: :py:attr:`~spinn_machine.Machine.MAX_BANDWIDTH_PER_ETHERNET_CONNECTED_CHIP`)
+DEFAULT_LINK_BANDWIDTH = 250000 // 8
+
+_INFINITE = float("inf")
+
+
+class IOCapacityAnalyser(object):
+    """ Works out how much data per unit time the host can send to a set of\
+        chips of a machine, through the working Ethernet chips and over the\
+        working links between chips, as the maximum flow from the Ethernet\
+        chips to the set of chips.  The links and Ethernet chips that limit\
+        it are those of a minimum cut between them.
+
+        The link graph of the machine is built once; each analysis then\
+        finds a maximum flow with Dinic's algorithm.
+    """
+
+    __slots__ = (
+        # The (x, y) of each chip, in node order
+        "_xys",
+        # Dict of (x, y) to the node of the chip
+        "_index",
+        # The (x, y) of the working Ethernet chips
+        "_ethernet_xys",
+        # The bytes per millisecond each Ethernet chip can send
+        "_ethernet_bandwidth",
+        # The bytes per millisecond each link can carry
+        "_link_bandwidth",
+        # The (node, (x, y, link ID)) of each link of each chip node
+        "_links"
+    )
+
+    def __init__(
+            self, machine,
+            ethernet_bandwidth=(
+                Machine.MAX_BANDWIDTH_PER_ETHERNET_CONNECTED_CHIP),
+            link_bandwidth=DEFAULT_LINK_BANDWIDTH):
+        """
+        :param machine: The machine to analyse
+        :type machine: ~spinn_machine.Machine
+        :param ethernet_bandwidth: The bytes per millisecond each Ethernet\
+            chip can send into the machine
+        :type ethernet_bandwidth: float
+        :param link_bandwidth: The bytes per millisecond each link between\
+            chips can carry
+        :type link_bandwidth: float
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If either bandwidth is not positive
+        """
+        if ethernet_bandwidth <= 0:
+            raise SpinnMachineInvalidParameterException(
+                "ethernet_bandwidth", str(ethernet_bandwidth),
+                "must be positive")
+        if link_bandwidth <= 0:
+            raise SpinnMachineInvalidParameterException(
+                "link_bandwidth", str(link_bandwidth), "must be positive")
+        self._ethernet_bandwidth = ethernet_bandwidth
+        self._link_bandwidth = link_bandwidth
+        self._xys = [
+            (chip.x, chip.y) for chip in machine.chips if not chip.virtual]
+        self._index = {xy: node for node, xy in enumerate(self._xys)}
+        self._ethernet_xys = [
+            (chip.x, chip.y) for chip in machine.ethernet_connected_chips
+            if not chip.virtual]
+        adjacency = link_adjacency(machine)
+        self._links = [
+            tuple((self._index[dest], (x, y, link_id))
+                  for link_id, dest in adjacency[x, y]
+                  if dest in self._index)
+            for (x, y) in self._xys]
+
+    def analyse(self, chips):
+        """ Works out the I/O capacity to a set of chips
+
+        :param chips: The (x, y) of the chips the data is sent to
+        :type chips: iterable(tuple(int,int))
+        :return: The bytes per millisecond that can be sent to the chips in\
+            total, the (x, y, link ID) of the links of a minimum cut and the\
+            (x, y) of the Ethernet chips that are used to their full\
+            bandwidth in that cut
+        :rtype: tuple(float, list(tuple(int,int,int)), list(tuple(int,int)))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If a chip is not in the machine
+        """
+        n_chips = len(self._xys)
+        source = n_chips
+        sink = n_chips + 1
+
+        # Edges are in pairs, so the reverse of edge e is e ^ 1
+        heads = [list() for _ in range(n_chips + 2)]
+        to = list()
+        capacity = list()
+        labels = list()
+
+        def add_edge(start, end, edge_capacity, label):
+            heads[start].append(len(to))
+            to.append(end)
+            capacity.append(edge_capacity)
+            labels.append(label)
+            heads[end].append(len(to))
+            to.append(start)
+            capacity.append(0)
+            labels.append(None)
+
+        for xy in self._ethernet_xys:
+            add_edge(source, self._index[xy], self._ethernet_bandwidth, xy)
+        for node, links in enumerate(self._links):
+            for dest, label in links:
+                add_edge(node, dest, self._link_bandwidth, label)
+        targets = set()
+        for xy in chips:
+            xy = tuple(xy)
+            if xy not in self._index:
+                raise SpinnMachineInvalidParameterException(
+                    "chips", str(xy),
+                    "There is no chip at this location in the machine")
+            if xy not in targets:
+                targets.add(xy)
+                add_edge(self._index[xy], sink, _INFINITE, None)
+
+        total = 0
+        while True:
+            level = self._levels(heads, to, capacity, source)
+            if level[sink] < 0:
+                break
+            total += self._blocking_flow(
+                heads, to, capacity, level, source, sink)
+
+        # The cut is between the nodes the source can still reach and the rest
+        reached = self._levels(heads, to, capacity, source)
+        cut_links = list()
+        cut_ethernets = list()
+        for edge in range(0, len(to), 2):
+            start = to[edge ^ 1]
+            if (reached[start] >= 0 and reached[to[edge]] < 0 and
+                    labels[edge] is not None):
+                if start == source:
+                    cut_ethernets.append(labels[edge])
+                else:
+                    cut_links.append(labels[edge])
+        return total, sorted(cut_links), sorted(cut_ethernets)
+
+    @staticmethod
+    def _levels(heads, to, capacity, source):
+        """ The breadth first level of each node over edges with capacity\
+            left, or -1 for those that can not be reached
+
+        :rtype: list(int)
+        """
+        level = [-1] * len(heads)
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for edge in heads[node]:
+                if capacity[edge] > 0 and level[to[edge]] < 0:
+                    level[to[edge]] = level[node] + 1
+                    queue.append(to[edge])
+        return level
+
+    @staticmethod
+    def _blocking_flow(heads, to, capacity, level, source, sink):
+        """ Pushes flow along paths of increasing level until no more can go
+
+        :return: The flow pushed
+        :rtype: float
+        """
+        next_edge = [0] * len(heads)
+        total = 0
+        path = list()
+        node = source
+        while True:
+            if node == sink:
+                flow = min(capacity[edge] for edge in path)
+                for edge in path:
+                    capacity[edge] -= flow
+                    capacity[edge ^ 1] += flow
+                total += flow
+                # Go back to the start of the first edge now full
+                for i, edge in enumerate(path):
+                    if capacity[edge] <= 0:
+                        node = to[edge ^ 1]
+                        del path[i:]
+                        break
+                continue
+            edges = heads[node]
+            while next_edge[node] < len(edges):
+                edge = edges[next_edge[node]]
+                if capacity[edge] > 0 and level[to[edge]] == level[node] + 1:
+                    break
+                next_edge[node] += 1
+            else:
+                # Nothing more can go through this node
+                if not path:
+                    return total
+                level[node] = -1
+                node = to[path.pop() ^ 1]
+                next_edge[node] += 1
+                continue
+            path.append(edge)
+            node = to[edge]
@@ -16,6 +16,8 @@
 from __future__ import division
 from collections import OrderedDict
 from six import iteritems, iterkeys, itervalues, add_metaclass
+from .board_index import BoardIndex
+from .ethernet_distances import EthernetDistances
 from .exceptions import (SpinnMachineAlreadyExistsException,
                          SpinnMachineException)
 from spinn_machine.link_data_objects import FPGALinkData, SpinnakerLinkData
@@ -66,9 +68,17 @@ class Machine(object):
     BOARD_48_CHIPS = list(CHIPS_PER_BOARD.keys())
 
     __slots__ = (
+        # Dict of (x, y) of an Ethernet chip to the index of its board
+        "_boards",
+        # Dict of (x, y) to the (board index, position) of the chip there
+        "_board_positions",
         "_boot_ethernet_address",
         "_chips",
         "_ethernet_connected_chips",
+        # Hop distances from the Ethernet chips, or None if not yet computed
+        "_ethernet_distances",
+        # Dict of IP address to the Ethernet chip with that address
+        "_ethernets_by_ip",
         "_fpga_links",
         # Declared height of the machine excluding virtual chips
         # This can not be changed
@@ -170,6 +180,10 @@ class Machine(object):
 
         # The list of chips with Ethernet connections
         self._ethernet_connected_chips = list()
+        self._ethernets_by_ip = dict()
+
+        # The distances from the Ethernet chips; computed when first needed
+        self._ethernet_distances = None
 
         # The dictionary of SpiNNaker links by board address and "ID" (int)
         self._spinnaker_links = dict()
@@ -180,6 +194,10 @@ class Machine(object):
         # Store the boot chip information
         self._boot_ethernet_address = None
 
+        # The boards that have chips, and where each chip is on them
+        self._boards = OrderedDict()
+        self._board_positions = dict()
+
         # The dictionary of chips
         self._chips = OrderedDict()
         if chips is not None:
@@ -262,10 +280,48 @@ class Machine(object):
         :rtype: iterable(tuple(int,int))
         """
 
-    @abstractmethod
+    def _board_index(self, ethernet_x, ethernet_y):
+        """ The index of the board with this ethernet.  Boards that have a\
+            chip are kept up to date as chips are added; for any other board\
+            a new index is made.
+
+        :param ethernet_x: \
+            The x coordinate of a (local 0,0) legal ethernet chip
+        :param ethernet_y: \
+            The y coordinate of a (local 0,0) legal ethernet chip
+        :rtype: ~spinn_machine.board_index.BoardIndex
+        """
+        board = self._boards.get((ethernet_x, ethernet_y))
+        if board is None:
+            board = BoardIndex(
+                self.get_xys_by_ethernet(ethernet_x, ethernet_y),
+                self._local_xys)
+            for position, xy in enumerate(board.xys):
+                if xy in self._chips:
+                    board.set_chip(position, self._chips[xy])
+        return board
+
+    def _add_to_board(self, chip):
+        """ Records a newly added chip in the index of each board it is on,\
+            making the index of the board of its Ethernet chip if needed
+
+        :param chip: The chip added
+        :type chip: Chip
+        """
+        board_xy = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        if not chip.virtual and board_xy not in self._boards:
+            board = self._board_index(*board_xy)
+            self._boards[board_xy] = board
+            for position, xy in enumerate(board.xys):
+                self._board_positions.setdefault(xy, list()).append(
+                    (board, position))
+        for board, position in self._board_positions.get(
+                (chip.x, chip.y), ()):
+            board.set_chip(position, chip)
+
     def get_down_xys_by_ethernet(self, ethernet_x, ethernet_y):
         """
-        Yields the (x,y) coordinates of the down chips on the board with this
+        Gets the (x,y) coordinates of the down chips on the board with this
         ethernet.
 
         Note the Ethernet chip itself can not be missing if validated
@@ -278,14 +334,40 @@ class Machine(object):
             The x coordinate of a (local 0,0) legal ethernet chip
         :param ethernet_y: \
             The y coordinate of a (local 0,0) legal ethernet chip
-        :return: Yields the (x, y) of the down chips on this board.
-        :rtype: iterable(tuple(int,int))
+        :return: The (x, y) of the down chips on this board.
+        :rtype: list(tuple(int,int))
         """
+        return self._board_index(ethernet_x, ethernet_y).down_xys
+
+    def get_down_local_xys_by_ethernet(self, ethernet_x, ethernet_y):
+        """
+        Gets the local (x,y) coordinates on the board of the down chips on
+        the board with this ethernet, in the same order as
+        :py:meth:`get_down_xys_by_ethernet`.
+
+        :param ethernet_x: \
+            The x coordinate of a (local 0,0) legal ethernet chip
+        :param ethernet_y: \
+            The y coordinate of a (local 0,0) legal ethernet chip
+        :return: The local (x, y) of the down chips on this board.
+        :rtype: list(tuple(int,int))
+        """
+        return self._board_index(ethernet_x, ethernet_y).down_local_xys
+
+    def get_down_xys(self):
+        """
+        Gets the (x,y) coordinates of the down chips on every board that has
+        at least one chip, board by board.
+
+        :return: The (x, y) of the down chips of the machine.
+        :rtype: list(tuple(int,int))
+        """
+        return [xy for board in itervalues(self._boards)
+                for xy in board.down_xys]
 
-    @abstractmethod
     def get_chips_by_ethernet(self, ethernet_x, ethernet_y):
         """
-        Yields the actual chips on the board with this ethernet.
+        Gets the actual chips on the board with this ethernet.
         Including the Ethernet chip itself.
 
         Wrap-arounds are handled as appropriate.
@@ -296,14 +378,14 @@ class Machine(object):
             The x coordinate of a (local 0,0) legal ethernet chip
         :param ethernet_y: \
             The y coordinate of a (local 0,0) legal ethernet chip
-        :return: Yields the chips on this board.
-        :rtype: iterable(Chip)
+        :return: The chips on this board.
+        :rtype: list(Chip)
         """
+        return self._board_index(ethernet_x, ethernet_y).chips
 
-    @abstractmethod
     def get_existing_xys_by_ethernet(self, ethernet_x, ethernet_y):
         """
-        Yields the (x,y)s of actual chips on the board with this ethernet.
+        Gets the (x,y)s of actual chips on the board with this ethernet.
         Including the Ethernet chip itself.
 
         Wrap-arounds are handled as appropriate.
@@ -314,9 +396,25 @@ class Machine(object):
             The x coordinate of a (local 0,0) legal ethernet chip
         :param ethernet_y: \
             The y coordinate of a (local 0,0) legal ethernet chip
-        :return: Yields the (x,y)s of chips on this board.
-        :rtype: iterable(tuple(int,int))
+        :return: The (x,y)s of chips on this board.
+        :rtype: list(tuple(int,int))
+        """
+        return self._board_index(ethernet_x, ethernet_y).existing_xys
+
+    def get_user_cores_by_ethernet(self, ethernet_x, ethernet_y):
         """
+        Gets the number of user processors of each potential chip on the
+        board with this ethernet, in the order of
+        :py:meth:`get_xys_by_ethernet`; 0 for chips that do not exist.
+
+        :param ethernet_x: \
+            The x coordinate of a (local 0,0) legal ethernet chip
+        :param ethernet_y: \
+            The y coordinate of a (local 0,0) legal ethernet chip
+        :return: The user processors of each potential chip on this board.
+        :rtype: array(int)
+        """
+        return self._board_index(ethernet_x, ethernet_y).user_cores
 
     @abstractmethod
     def xy_over_link(self, x, y, link):
@@ -543,6 +641,8 @@ class Machine(object):
                 "chip", "{}, {}".format(chip.x, chip.y))
 
         self._chips[chip_id] = chip
+        self._ethernet_distances = None
+        self._add_to_board(chip)
 
         if chip.x > self._max_chip_x:
             self._max_chip_x = chip.x
@@ -551,6 +651,7 @@ class Machine(object):
 
         if chip.ip_address is not None:
             self._ethernet_connected_chips.append(chip)
+            self._ethernets_by_ip[chip.ip_address] = chip
             if (chip.x == 0) and (chip.y == 0):
                 self._boot_ethernet_address = chip.ip_address
 
@@ -741,6 +842,47 @@ class Machine(object):
         """
         return self._ethernet_connected_chips
 
+    def get_chip_by_ip_address(self, ip_address):
+        """ Get the Ethernet chip with the given IP address
+
+        :param ip_address: The IP address of the chip
+        :type ip_address: str
+        :return: The chip, or None if no chip has the address
+        :rtype: :py:class:`~spinn_machine.Chip` or None
+        """
+        return self._ethernets_by_ip.get(ip_address)
+
+    @property
+    def ethernet_xys_by_ip_address(self):
+        """ The (x, y) of the Ethernet chip with each IP address
+
+        :rtype: dict(str, tuple(int,int))
+        """
+        return {ip_address: (chip.x, chip.y)
+                for ip_address, chip in iteritems(self._ethernets_by_ip)}
+
+    @property
+    def ethernet_distances(self):
+        """ The hop distances over the links of the machine from the Ethernet\
+            chips to every chip.  These are computed when first asked for and\
+            then kept until a chip is added; changes to the links of the\
+            chips are not seen unless :py:meth:`reset_ethernet_distances` is\
+            called.
+
+        :rtype: ~spinn_machine.ethernet_distances.EthernetDistances
+        """
+        if self._ethernet_distances is None:
+            self._ethernet_distances = EthernetDistances(self)
+        return self._ethernet_distances
+
+    def reset_ethernet_distances(self):
+        """ Forgets the distances from the Ethernet chips, so that they are\
+            computed again when next asked for.
+
+        :rtype: None
+        """
+        self._ethernet_distances = None
+
     @property
     def spinnaker_links(self):
         """ The set of SpiNNaker links in the machine
@@ -1016,17 +1158,21 @@ class Machine(object):
                 removable_coords.append((x, y))
         return removable_coords
 
-    def unreachable_outgoing_local_chips(self):
+    def unreachable_outgoing_local_chips(self, chips=None):
         """
         Detects chips that can not reach any of their LOCAL neighbours
 
         Current implementation does NOT deal with group of unreachable chips
 
+        :param chips: The chips to check, or None to check all the chips
+        :type chips: iterable(Chip) or None
         :return: List (hopefully empty) if the (x,y) cooridinates of
             unreachable chips.
         """
         removable_coords = list()
-        for chip in self._chips.values():
+        if chips is None:
+            chips = self._chips.values()
+        for chip in chips:
             # If no links out of the chip work, remove it
             is_link = False
             moves = [(1, 0), (1, 1), (0, 1), (-1, 0), (-1, -1), (0, -1)]
@@ -1049,17 +1195,21 @@ class Machine(object):
                 removable_coords.append((x, y))
         return removable_coords
 
-    def unreachable_incoming_local_chips(self):
+    def unreachable_incoming_local_chips(self, chips=None):
         """
         Detects chips that are not reachable from any of their LOCAL neighbours
 
         Current implementation does NOT deal with group of unreachable chips
 
+        :param chips: The chips to check, or None to check all the chips
+        :type chips: iterable(Chip) or None
         :return: List (hopefully empty) if the (x,y) cooridinates of
             unreachable chips.
         """
         removable_coords = list()
-        for chip in self._chips.values():
+        if chips is None:
+            chips = self._chips.values()
+        for chip in chips:
             x = chip.x
             y = chip.y
             nearest_ethernet_x = chip.nearest_ethernet_x
@@ -1082,12 +1232,17 @@ class Machine(object):
                 removable_coords.append((x, y))
         return removable_coords
 
-    def one_way_links(self):
+    def one_way_links(self, chips=None):
         """
+        :param chips: The chips to check the links of, or None to check all\
+            the chips
+        :type chips: iterable(Chip) or None
         :rtype: iterable(tuple(int,int,int))
         """
         link_checks = [(0, 3), (1, 4), (2, 5), (3, 0), (4, 1), (5, 2)]
-        for chip in self.chips:
+        if chips is None:
+            chips = self.chips
+        for chip in chips:
             for out, back in link_checks:
                 link = chip.router.get_link(out)
                 if link is not None:
@@ -21,6 +21,7 @@ from .horizontal_wrap_machine import HorizontalWrapMachine
 from .vertical_wrap_machine import VerticalWrapMachine
 from .full_wrap_machine import FullWrapMachine
 from .exceptions import SpinnMachineException
+from .ignores import resolve_ignores
 
 logger = logging.getLogger(__name__)
 
@@ -90,20 +91,53 @@ def machine_from_chips(chips):
     return machine_from_size(max_x + 1, max_y + 1, chips)
 
 
-def _machine_ignore(original, dead_chips, dead_links):
+def _copy_chip(chip, dead_links, dead_cores):
+    """ Creates a copy of a chip without some of its links and cores
+
+    :param chip: The chip to copy
+    :type chip: Chip
+    :param dead_links: The IDs of the links to leave out
+    :type dead_links: set(int)
+    :param dead_cores: The IDs of the processors to leave out
+    :type dead_cores: set(int)
+    :rtype: Chip
+    """
+    links = [link for link in chip.router.links
+             if link.source_link_id not in dead_links]
+    router = Router(links, chip.router.emergency_routing_enabled,
+                    chip.router.n_available_multicast_entries)
+    processor_ids = set(
+        processor.processor_id for processor in chip.processors)
+    n_processors = max(processor_ids) + 1
+    down_cores = set(range(1, n_processors)) - processor_ids
+    down_cores.update(dead_cores & processor_ids)
+    return Chip(
+        chip.x, chip.y, n_processors, router, chip.sdram,
+        chip.nearest_ethernet_x, chip.nearest_ethernet_y,
+        chip.ip_address, chip.virtual, chip.tag_ids,
+        down_cores=down_cores or None)
+
+
+def _machine_ignore(original, dead_chips, dead_links, dead_cores=()):
     """ Creates a near copy of the machine without the dead bits.
 
     Creates a new Machine with the the Chips that where in the orginal machine
         but are not listed as dead.
 
     Each Chip will only have the links that already existed and are not listed
-        as dead.
+        as dead, or go to a dead chip, and the cores that already existed and
+        are not listed as dead.
 
     Spinnaker_links and fpga_links are readded so removing a wrap around link
         could results in and extra spinnaker or fpga link.
 
     Dead Chips or links not in the original machine are ignored.
 
+    Links that go to a dead chip are removed with it, so the copy has no
+        one way links into the dead chips; :py:func:`machine_repair` thus
+        does not find and log these as unexpected one way links when it
+        next checks the copy.
+
     Does not change the original machine!
 
     :param original: Machine to make a near copy of
@@ -111,39 +145,69 @@ def _machine_ignore(original, dead_chips, dead_links):
     :type dead_chips: Collection (int, int)
     :param dead_links: Collection of dead link x y and direction cooridnates
     :type dead_links: Collection of (int, int, int)
+    :param dead_cores: Collection of dead core x y and virtual processor ID
+    :type dead_cores: Collection of (int, int, int)
     :return: A New Machine object
     """
     new_machine = machine_from_size(original.width, original.height)
     links_map = defaultdict(set)
     for x, y, d in dead_links:
         links_map[(x, y)].add(d)
+    for x, y in dead_chips:
+        for link in range(Router.MAX_LINKS_PER_ROUTER):
+            links_map[original.xy_over_link(x, y, link)].add(
+                Router.opposite(link))
+    cores_map = defaultdict(set)
+    for x, y, p in dead_cores:
+        cores_map[(x, y)].add(p)
     for chip in original.chips:
-        if (chip.x, chip.y) in dead_chips:
+        xy = (chip.x, chip.y)
+        if xy in dead_chips:
             continue
-        if (chip.x, chip.y) in links_map:
-            links = []
-            for link in chip.router.links:
-                if link.source_link_id not in links_map[(chip.x, chip.y)]:
-                    links.append(link)
-            router = Router(links, chip.router.emergency_routing_enabled,
-                            chip.router.n_available_multicast_entries)
-            chip = Chip(
-                chip.x, chip.y, chip.n_processors, router, chip.sdram,
-                chip.nearest_ethernet_x, chip.nearest_ethernet_y,
-                chip.ip_address, chip.virtual, chip.tag_ids)
-        new_machine.add_chip(chip)
+        if xy in links_map or xy in cores_map:
+            chip = _copy_chip(
+                chip, links_map.get(xy, set()), cores_map.get(xy, set()))
+        if chip.virtual:
+            new_machine.add_virtual_chip(chip)
+        else:
+            new_machine.add_chip(chip)
     new_machine.add_spinnaker_links()
     new_machine.add_fpga_links()
     new_machine.validate()
     return new_machine
 
 
-def machine_repair(original, repair_machine=False, removed_chips=tuple()):
+def _boards_near(machine, xys):
+    """ The boards of the chips at or next to the given coordinates
+
+    :param machine: The machine the chips are on
+    :type machine: Machine
+    :param xys: The coordinates of the chips
+    :type xys: iterable(tuple(int,int))
+    :return: The (x, y) of the Ethernet chips of the boards
+    :rtype: set(tuple(int,int))
+    """
+    boards = set()
+    for x, y in xys:
+        near = [(x, y)] + [machine.xy_over_link(x, y, link)
+                           for link in range(Router.MAX_LINKS_PER_ROUTER)]
+        for near_x, near_y in near:
+            chip = machine.get_chip_at(near_x, near_y)
+            if chip is not None and not chip.virtual:
+                boards.add((chip.nearest_ethernet_x, chip.nearest_ethernet_y))
+    return boards
+
+
+def machine_repair(original, repair_machine=False, removed_chips=tuple(),
+                   ethernet_xys=None):
     """ Remove chips that can't be reached or that can't reach other chips\
         due to missing links.
 
         Also remove any one way links.
 
+        The links to any chip removed go with it, so are not reported as\
+        one way links.
+
     :param original: the original machine
     :type original: Machine
     :param repair_machine: A flag to say if the machine requires unexpected
@@ -157,14 +221,21 @@ def machine_repair(original, repair_machine=False, removed_chips=tuple()):
         Oneway links to these chip are expected repairs so always done and
         never logged
     :type removed_chips: list(tuple(int,int))
+    :param ethernet_xys: The Ethernet chips of the boards to check, or None\
+        to check every board
+    :type ethernet_xys: iterable(tuple(int,int)) or None
     :raises SpinnMachineException: if repair_machine is false and an unexpected
         repair is needed.
     :return: Either the original machine or a repaired replacement
     :rtype: Machine
     """
+    chips = None
+    if ethernet_xys is not None:
+        chips = [chip for (x, y) in ethernet_xys
+                 for chip in original.get_chips_by_ethernet(x, y)]
     dead_chips = set()
     dead_links = set()
-    for xy in original.unreachable_incoming_local_chips():
+    for xy in original.unreachable_incoming_local_chips(chips):
         chip = original.get_chip_at(xy[0], xy[1])
         error_xy = original.get_local_xy(chip)
         ethernet = original.get_chip_at(
@@ -176,7 +247,7 @@ def machine_repair(original, repair_machine=False, removed_chips=tuple()):
             logger.warning(msg)
         else:
             raise SpinnMachineException(msg)
-    for xy in original.unreachable_outgoing_local_chips():
+    for xy in original.unreachable_outgoing_local_chips(chips):
         chip = original.get_chip_at(xy[0], xy[1])
         error_xy = original.get_local_xy(chip)
         ethernet = original.get_chip_at(
@@ -188,7 +259,7 @@ def machine_repair(original, repair_machine=False, removed_chips=tuple()):
             logger.warning(msg)
         else:
             raise SpinnMachineException(msg)
-    for xyd in original.one_way_links():
+    for xyd in original.one_way_links(chips):
         target = original.xy_over_link(xyd[0], xyd[1], xyd[2])
         if target in removed_chips:
             dead_links.add(xyd)
@@ -208,4 +279,80 @@ def machine_repair(original, repair_machine=False, removed_chips=tuple()):
     if len(dead_chips) == 0 and len(dead_links) == 0:
         return original
     new_machine = _machine_ignore(original, dead_chips, dead_links)
-    return machine_repair(new_machine, repair_machine)
+    if ethernet_xys is not None:
+        ethernet_xys = set(ethernet_xys) | _boards_near(
+            original, dead_chips | set((x, y) for x, y, _ in dead_links))
+    return machine_repair(new_machine, repair_machine,
+                          ethernet_xys=ethernet_xys)
+
+
+def apply_ignores(
+        machine, chips=None, cores=None, links=None, repair_machine=False):
+    """ Applies ignores to an existing machine in a single pass, giving a\
+        near copy of the machine without the ignored chips, cores and links.
+
+    The ignores are resolved by\
+    :py:func:`~spinn_machine.ignores.resolve_ignores`, so may be local to\
+    the board with a given IP address, and cores are given by their virtual\
+    processor ID.  The link back over each ignored link is removed too, as\
+    are links to ignored chips.  Ignores of things not in the machine have\
+    no effect, and ignores of monitor cores are not used, with a warning.\
+    Only the boards of, and next to, the ignored chips, cores and links\
+    are then repaired as by :py:func:`machine_repair`.
+
+    Does not change the original machine!
+
+    :param machine: The machine to apply the ignores to
+    :type machine: Machine
+    :param chips: The chips to ignore
+    :type chips: iterable(IgnoreChip or tuple(int,int)) or None
+    :param cores: The cores to ignore
+    :type cores: iterable(IgnoreCore or tuple(int,int,int)) or None
+    :param links: The links to ignore
+    :type links: iterable(IgnoreLink or tuple(int,int,int)) or None
+    :param repair_machine: A flag to say if the machine may be given\
+        unexpected repairs, as for :py:func:`machine_repair`
+    :type repair_machine: bool
+    :raises SpinnMachineException: if repair_machine is false and an unexpected
+        repair is needed.
+    :return: Either the original machine, if nothing is ignored, or a new\
+        machine
+    :rtype: Machine
+    """
+    dead_chips, dead_cores, dead_links = resolve_ignores(
+        machine, chips, cores, links)
+    dead_chips = set(xy for xy in dead_chips if xy in machine)
+    dead_cores = set(
+        (x, y, p) for (x, y, p) in dead_cores
+        if (x, y) in machine and (x, y) not in dead_chips and
+        machine.get_chip_at(x, y).is_processor_with_id(p))
+
+    # A chip cannot work without its monitor, so monitors are never removed
+    monitors = set(
+        (x, y, p) for (x, y, p) in dead_cores
+        if machine.get_chip_at(x, y).get_processor_with_id(p).is_monitor)
+    for (x, y, p) in sorted(monitors):
+        logger.warning(
+            "Ignore of core {} on chip {}, {} is not used as it is the "
+            "monitor; ignore the chip instead".format(p, x, y))
+    dead_cores -= monitors
+    dead_links = set(
+        (x, y, link) for (x, y, link) in dead_links
+        if machine.is_link_at(x, y, link) and (x, y) not in dead_chips)
+    if not dead_chips and not dead_cores and not dead_links:
+        return machine
+
+    # Links back over ignored links go too, so none are left one way
+    for (x, y, link_id) in list(dead_links):
+        link = machine.get_chip_at(x, y).router.get_link(link_id)
+        back = Router.opposite(link_id)
+        if machine.is_link_at(link.destination_x, link.destination_y, back):
+            dead_links.add((link.destination_x, link.destination_y, back))
+
+    affected = set(dead_chips)
+    affected.update((x, y) for (x, y, _) in dead_links)
+    affected.update((x, y) for (x, y, _) in dead_cores)
+    ethernet_xys = _boards_near(machine, affected)
+    new_machine = _machine_ignore(machine, dead_chips, dead_links, dead_cores)
+    return machine_repair(
+        new_machine, repair_machine, dead_chips, ethernet_xys)
@@ -19,12 +19,16 @@ from spinn_machine.router import Router
 
 
 class MulticastRoutingEntry(object):
-    """ Represents an entry in a SpiNNaker chip's multicast routing table
+    """ Represents an entry in a SpiNNaker chip's multicast routing table.
+
+        Entries are hashable by value, so equal entries can be found with\
+        sets and dictionaries; see also\
+        :py:class:`~spinn_machine.MulticastRoutingEntryPool`.
     """
 
     __slots__ = (
         "_routing_entry_key", "_mask", "_defaultable", "_processor_ids",
-        "_link_ids", "_spinnaker_route"
+        "_link_ids", "_spinnaker_route", "_hash"
     )
 
     # pylint: disable=too-many-arguments
@@ -49,6 +53,7 @@ class MulticastRoutingEntry(object):
         self._routing_entry_key = routing_entry_key
         self._mask = mask
         self._defaultable = defaultable
+        self._hash = None
 
         if (routing_entry_key & mask) != routing_entry_key:
             raise SpinnMachineInvalidParameterException(
@@ -144,6 +149,63 @@ class MulticastRoutingEntry(object):
         :type other_entry: :py:class:`~spinn_machine.MulticastRoutingEntry`
         :return: A new multicast routing entry with merged destinations
         :rtype: :py:class:`~spinn_machine.MulticastRoutingEntry`
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the key and mask of the other entry do not match
+        """
+        self._check_mergeable(other_entry)
+
+        defaultable = self._defaultable
+        if self._defaultable != other_entry.defaultable:
+            defaultable = False
+
+        new_entry = MulticastRoutingEntry(
+            self._routing_entry_key, self._mask, defaultable=defaultable,
+            spinnaker_route=(
+                self._spinnaker_route | other_entry.spinnaker_route))
+        # If both sets of IDs are known, so are those of the new entry;
+        # IDs worked out from a route are lists, so make new sets of them
+        # pylint: disable=protected-access
+        if (self._processor_ids is not None and
+                other_entry._processor_ids is not None):
+            new_entry._processor_ids = set(self._processor_ids).union(
+                other_entry._processor_ids)
+            new_entry._link_ids = set(self._link_ids).union(
+                other_entry._link_ids)
+        return new_entry
+
+    @staticmethod
+    def merge_entries(entries):
+        """ Merges together many multicast routing entries with the same key\
+            and mask, as if by merging them one at a time with\
+            :py:meth:`merge`, but without making the entries in between.
+
+        :param entries: The entries to merge
+        :type entries:\
+            iterable(:py:class:`~spinn_machine.MulticastRoutingEntry`)
+        :return: A new multicast routing entry with merged destinations
+        :rtype: :py:class:`~spinn_machine.MulticastRoutingEntry`
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If there are no entries, or the keys and masks of the entries\
+            do not all match
+        """
+        entries = iter(entries)
+        first = next(entries, None)
+        if first is None:
+            raise SpinnMachineInvalidParameterException(
+                "entries", "[]", "There must be at least one entry to merge")
+        route = first.spinnaker_route
+        defaultable = first.defaultable
+        for entry in entries:
+            first._check_mergeable(entry)
+            route |= entry.spinnaker_route
+            defaultable = defaultable and entry.defaultable
+        return MulticastRoutingEntry(
+            first.routing_entry_key, first.mask, defaultable=defaultable,
+            spinnaker_route=route)
+
+    def _check_mergeable(self, other_entry):
+        """ Check that another entry has the same key and mask as this one
+
         :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
             If the key and mask of the other entry do not match
         """
@@ -158,16 +220,6 @@ class MulticastRoutingEntry(object):
                 "other_entry.mask", hex(other_entry.mask),
                 "The mask does not match {}".format(hex(self.mask)))
 
-        defaultable = self._defaultable
-        if self._defaultable != other_entry.defaultable:
-            defaultable = False
-
-        new_entry = MulticastRoutingEntry(
-            self.routing_entry_key, self.mask,
-            self._processor_ids.union(other_entry.processor_ids),
-            self._link_ids.union(other_entry.link_ids), defaultable)
-        return new_entry
-
     def __add__(self, other_entry):
         """ Allows overloading of `+` to merge two entries together.\
             See :py:meth:`merge`
@@ -194,6 +246,13 @@ class MulticastRoutingEntry(object):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((
+                self._routing_entry_key, self._mask, self._spinnaker_route,
+                self._defaultable))
+        return self._hash
+
     def __repr__(self):
         return "{}:{}:{}:{{{}}}:{{{}}}".format(
             self._routing_entry_key, self._mask, self._defaultable,
@@ -203,14 +262,18 @@ class MulticastRoutingEntry(object):
     def __str__(self):
         return self.__repr__()
 
-    def __getstate__(self):
-        return dict(
-            (slot, getattr(self, slot))
-            for slot in self.__slots__
-            if hasattr(self, slot)
-        )
+    def __reduce__(self):
+        """ Pickles the entry as just its key, mask, defaultable flag and\
+            route; the processor and link IDs are worked out from the route\
+            again when asked for.
+        """
+        return (MulticastRoutingEntry, (
+            self._routing_entry_key, self._mask, None, None,
+            self._defaultable, self._spinnaker_route))
 
     def __setstate__(self, state):
+        # Only used to load entries pickled as a dictionary of their slots
+        self._hash = None
         for slot, value in state.items():
             setattr(self, slot, value)
 
@@ -234,9 +297,5 @@ class MulticastRoutingEntry(object):
 
         :rtype: tuple(list(int), list(int))
         """
-        processor_ids = [pi for pi in range(0, Router.MAX_CORES_PER_ROUTER)
-                         if self._spinnaker_route & 1 <<
-                         (Router.MAX_LINKS_PER_ROUTER + pi)]
-        link_ids = [li for li in range(0, Router.MAX_LINKS_PER_ROUTER)
-                    if self._spinnaker_route & 1 << li]
-        return processor_ids, link_ids
+        return Router.convert_spinnaker_route_to_routing_ids(
+            self._spinnaker_route)
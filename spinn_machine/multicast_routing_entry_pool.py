@@ -0,0 +1,69 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .multicast_routing_entry import MulticastRoutingEntry
+
+
+class MulticastRoutingEntryPool(object):
+    """ A pool of distinct multicast routing entries, so that tools that\
+        make the same entry many times, such as for many chips, can share\
+        a single object for each distinct entry.
+    """
+
+    __slots__ = (
+        # Dict of each entry to itself
+        "_entries",
+    )
+
+    def __init__(self):
+        self._entries = dict()
+
+    def intern(self, entry):
+        """ Gets the entry of the pool that is equal to the given entry,\
+            adding the given entry if there is none
+
+        :param entry: The entry to look up
+        :type entry: ~spinn_machine.MulticastRoutingEntry
+        :return: The entry of the pool equal to the given entry
+        :rtype: ~spinn_machine.MulticastRoutingEntry
+        """
+        return self._entries.setdefault(entry, entry)
+
+    def get_entry(self, key, mask, spinnaker_route, defaultable=False):
+        """ Gets the entry of the pool with the given values, making it if\
+            there is none
+
+        :param key: The routing key
+        :type key: int
+        :param mask: The routing mask
+        :type mask: int
+        :param spinnaker_route: The route of the entry
+        :type spinnaker_route: int
+        :param defaultable: Whether the entry is defaultable
+        :type defaultable: bool
+        :rtype: ~spinn_machine.MulticastRoutingEntry
+        """
+        return self.intern(MulticastRoutingEntry(
+            key, mask, defaultable=defaultable,
+            spinnaker_route=spinnaker_route))
+
+    def __contains__(self, entry):
+        return entry in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
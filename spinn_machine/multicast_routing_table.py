@@ -0,0 +1,396 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+import sys
+from .exceptions import SpinnMachineInvalidParameterException
+from .multicast_routing_entry import MulticastRoutingEntry
+
+try:
+    from pickle import PickleBuffer
+except ImportError:  # pragma: no cover
+    # Before Python 3.8 there are no out-of-band pickle buffers
+    PickleBuffer = None
+
+# The array type code of an unsigned 32-bit integer on this platform
+UINT32 = "I" if array("I").itemsize == 4 else "L"
+
+
+def _mask_bits(mask):
+    """ The number of bits set in a mask
+    """
+    return bin(mask).count("1")
+
+
+def _pickle_buffer(column, protocol):
+    """ The contents of a column to pickle; a buffer that can be passed out\
+        of band if the pickle protocol allows it, or bytes otherwise
+    """
+    view = memoryview(column)
+    if not view.contiguous:
+        return view.tobytes()
+    if PickleBuffer is not None and protocol >= 5:
+        return PickleBuffer(view)
+    return view.tobytes()
+
+
+def _unpickle_table(keys, masks, routes, defaultables, byteorder):
+    """ Recreates a table from the pickled bytes of its columns, using the\
+        bytes as the storage of the table if they are in the byte order of\
+        this machine
+    """
+    columns = list()
+    for column in (keys, masks, routes):
+        if byteorder == sys.byteorder:
+            columns.append(memoryview(column).cast("B").cast(UINT32))
+        else:
+            words = array(UINT32)
+            words.frombytes(column)
+            words.byteswap()
+            columns.append(words)
+    columns.append(memoryview(defaultables).cast("B"))
+    return MulticastRoutingTable.from_columns(*columns)
+
+
+class MulticastRoutingTable(object):
+    """ Represents a multicast routing table of a SpiNNaker chip, stored as\
+        parallel arrays of 32-bit keys, masks and routes, plus a\
+        defaultable flag per entry.
+
+        Indexing with an int gives a\
+        :py:class:`~spinn_machine.MulticastRoutingEntry` built on demand\
+        from the stored route, and slicing gives a new table.  The table is\
+        also iterable over such entries.
+
+        The columns may be read-only buffers, such as views of a memory\
+        mapped file (see :py:meth:`from_columns`); they are copied into\
+        arrays the first time the table is changed.
+
+        A table is pickled as the raw bytes of its columns, which with\
+        pickle protocol 5 may be passed out of band, and which are used\
+        without copying by the unpickled table.
+    """
+
+    __slots__ = (
+        # The routing keys of the entries
+        "_keys",
+        # The masks of the entries
+        "_masks",
+        # The spinnaker_route words of the entries
+        "_routes",
+        # 1 where an entry is defaultable, 0 otherwise
+        "_defaultables"
+    )
+
+    def __init__(self, multicast_routing_entries=None):
+        """
+        :param multicast_routing_entries: The entries to start the table with
+        :type multicast_routing_entries:\
+            iterable(:py:class:`~spinn_machine.MulticastRoutingEntry`)
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If any entry has a key that is changed by its mask
+        """
+        self._keys = array(UINT32)
+        self._masks = array(UINT32)
+        self._routes = array(UINT32)
+        self._defaultables = array("B")
+        if multicast_routing_entries is not None:
+            self.add_multicast_routing_entries(multicast_routing_entries)
+
+    @staticmethod
+    def from_columns(keys, masks, routes, defaultables):
+        """ Creates a table that uses the given columns as its storage,\
+            without copying them.
+
+        :param keys: The routing keys of the entries
+        :type keys: array(int) or memoryview
+        :param masks: The masks of the entries
+        :type masks: array(int) or memoryview
+        :param routes: The spinnaker_route of the entries
+        :type routes: array(int) or memoryview
+        :param defaultables: 1 for each defaultable entry, 0 for others
+        :type defaultables: array(int) or memoryview
+        :rtype: MulticastRoutingTable
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the columns are of different lengths
+        """
+        if not len(keys) == len(masks) == len(routes) == len(defaultables):
+            raise SpinnMachineInvalidParameterException(
+                "keys, masks, routes and defaultables",
+                "lengths {}, {}, {}, {}".format(
+                    len(keys), len(masks), len(routes), len(defaultables)),
+                "The lengths must all be the same")
+        table = MulticastRoutingTable()
+        table._keys = keys
+        table._masks = masks
+        table._routes = routes
+        table._defaultables = defaultables
+        return table
+
+    def _make_writable(self):
+        """ Replaces any columns that are not arrays with array copies;\
+            each column is checked on its own, as they need not all be of\
+            the same kind
+        """
+        if not isinstance(self._keys, array):
+            self._keys = array(UINT32, self._keys)
+        if not isinstance(self._masks, array):
+            self._masks = array(UINT32, self._masks)
+        if not isinstance(self._routes, array):
+            self._routes = array(UINT32, self._routes)
+        if not isinstance(self._defaultables, array):
+            self._defaultables = array("B", self._defaultables)
+
+    def add_multicast_routing_entry(self, multicast_routing_entry):
+        """ Adds an entry to the end of the table
+
+        :param multicast_routing_entry: The entry to add
+        :type multicast_routing_entry:\
+            :py:class:`~spinn_machine.MulticastRoutingEntry`
+        :rtype: None
+        """
+        self._make_writable()
+        self._keys.append(multicast_routing_entry.routing_entry_key)
+        self._masks.append(multicast_routing_entry.mask)
+        self._routes.append(multicast_routing_entry.spinnaker_route)
+        self._defaultables.append(
+            1 if multicast_routing_entry.defaultable else 0)
+
+    def add_multicast_routing_entries(self, multicast_routing_entries):
+        """ Adds entries to the end of the table
+
+        :param multicast_routing_entries: The entries to add
+        :type multicast_routing_entries:\
+            iterable(:py:class:`~spinn_machine.MulticastRoutingEntry`)
+        :rtype: None
+        """
+        for entry in multicast_routing_entries:
+            self.add_multicast_routing_entry(entry)
+
+    def add_route(self, key, mask, route, defaultable=False):
+        """ Adds an entry to the end of the table without creating a\
+            :py:class:`~spinn_machine.MulticastRoutingEntry`
+
+        :param key: The routing key
+        :type key: int
+        :param mask: The routing mask
+        :type mask: int
+        :param route: The spinnaker_route of the entry
+        :type route: int
+        :param defaultable: Whether the entry is defaultable
+        :type defaultable: bool
+        :rtype: None
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the key is changed by the mask
+        """
+        if (key & mask) != key:
+            raise SpinnMachineInvalidParameterException(
+                "key and mask", "{} and {}".format(key, mask),
+                "The key is changed when masked with the mask")
+        self._make_writable()
+        self._keys.append(key)
+        self._masks.append(mask)
+        self._routes.append(route)
+        self._defaultables.append(1 if defaultable else 0)
+
+    def extend(self, keys, masks, routes, defaultables=None):
+        """ Adds many entries to the end of the table from parallel\
+            sequences of keys, masks and routes.
+
+        :param keys: The routing keys
+        :type keys: iterable(int)
+        :param masks: The routing masks
+        :type masks: iterable(int)
+        :param routes: The spinnaker_route of each entry
+        :type routes: iterable(int)
+        :param defaultables: Whether each entry is defaultable, or None if\
+            no entry is
+        :type defaultables: iterable(bool) or None
+        :rtype: None
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the sequences are of different lengths, or any key is changed\
+            by its mask
+        """
+        keys = array(UINT32, keys)
+        masks = array(UINT32, masks)
+        routes = array(UINT32, routes)
+        if defaultables is None:
+            defaultables = array("B", bytes(len(keys)))
+        else:
+            defaultables = array("B", (1 if d else 0 for d in defaultables))
+        if not len(keys) == len(masks) == len(routes) == len(defaultables):
+            raise SpinnMachineInvalidParameterException(
+                "keys, masks, routes and defaultables",
+                "lengths {}, {}, {}, {}".format(
+                    len(keys), len(masks), len(routes), len(defaultables)),
+                "The lengths must all be the same")
+        for key, mask in zip(keys, masks):
+            if (key & mask) != key:
+                raise SpinnMachineInvalidParameterException(
+                    "key and mask", "{} and {}".format(key, mask),
+                    "The key is changed when masked with the mask")
+        self._make_writable()
+        self._keys.extend(keys)
+        self._masks.extend(masks)
+        self._routes.extend(routes)
+        self._defaultables.extend(defaultables)
+
+    @property
+    def keys(self):
+        """ The routing keys of the entries.  This is the table's own\
+            storage, so must not be modified.
+
+        :rtype: array(int) or memoryview
+        """
+        return self._keys
+
+    @property
+    def masks(self):
+        """ The masks of the entries.  This is the table's own storage, so\
+            must not be modified.
+
+        :rtype: array(int) or memoryview
+        """
+        return self._masks
+
+    @property
+    def routes(self):
+        """ The spinnaker_route of the entries.  This is the table's own\
+            storage, so must not be modified.
+
+        :rtype: array(int) or memoryview
+        """
+        return self._routes
+
+    @property
+    def defaultables(self):
+        """ 1 for each defaultable entry, 0 for each other entry.  This is\
+            the table's own storage, so must not be modified.
+
+        :rtype: array(int) or memoryview
+        """
+        return self._defaultables
+
+    @property
+    def number_of_entries(self):
+        """ The number of entries in the table
+
+        :rtype: int
+        """
+        return len(self._keys)
+
+    @property
+    def number_of_defaultable_entries(self):
+        """ The number of entries in the table that are defaultable
+
+        :rtype: int
+        """
+        return sum(self._defaultables)
+
+    @property
+    def multicast_routing_entries(self):
+        """ The entries of the table, created on demand
+
+        :rtype: list(:py:class:`~spinn_machine.MulticastRoutingEntry`)
+        """
+        return list(self)
+
+    def get_entry(self, index):
+        """ Gets the entry at a given index of the table.
+
+        :param index: The index of the entry
+        :type index: int
+        :rtype: :py:class:`~spinn_machine.MulticastRoutingEntry`
+        """
+        return MulticastRoutingEntry(
+            self._keys[index], self._masks[index],
+            defaultable=bool(self._defaultables[index]),
+            spinnaker_route=self._routes[index])
+
+    def sort(self, key=None, reverse=False):
+        """ Sorts the table in place.  The sort is stable.
+
+        :param key: A function from (key, mask, route, defaultable) to the\
+            value to sort by.  By default entries are sorted by the number\
+            of bits set in the mask, most first, so that more specific\
+            entries come before more general ones.
+        :type key: callable or None
+        :param reverse: Whether to reverse the order of the sort
+        :type reverse: bool
+        :rtype: None
+        """
+        if key is None:
+            masks = self._masks
+            order = sorted(
+                range(len(masks)), key=lambda i: -_mask_bits(masks[i]),
+                reverse=reverse)
+        else:
+            rows = list(zip(self._keys, self._masks, self._routes,
+                            self._defaultables))
+            order = sorted(
+                range(len(rows)), key=lambda i: key(rows[i]),
+                reverse=reverse)
+        self._reorder(order)
+
+    def _reorder(self, order):
+        """ Rearranges the entries so that entry i is the old entry order[i]
+
+        :param order: The indices of the old entries in the new order
+        :type order: list(int)
+        """
+        self._keys = array(UINT32, [self._keys[i] for i in order])
+        self._masks = array(UINT32, [self._masks[i] for i in order])
+        self._routes = array(UINT32, [self._routes[i] for i in order])
+        self._defaultables = array(
+            "B", [self._defaultables[i] for i in order])
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MulticastRoutingTable.from_columns(
+                self._keys[index], self._masks[index], self._routes[index],
+                self._defaultables[index])
+        return self.get_entry(index)
+
+    def __iter__(self):
+        for key, mask, route, defaultable in zip(
+                self._keys, self._masks, self._routes, self._defaultables):
+            yield MulticastRoutingEntry(
+                key, mask, defaultable=bool(defaultable),
+                spinnaker_route=route)
+
+    def __eq__(self, other):
+        if not isinstance(other, MulticastRoutingTable):
+            return False
+        return (self._keys == other._keys and self._masks == other._masks and
+                self._routes == other._routes and
+                self._defaultables == other._defaultables)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __reduce_ex__(self, protocol):
+        return (_unpickle_table, (
+            _pickle_buffer(self._keys, protocol),
+            _pickle_buffer(self._masks, protocol),
+            _pickle_buffer(self._routes, protocol),
+            _pickle_buffer(self._defaultables, protocol), sys.byteorder))
+
+    def __repr__(self):
+        return "[MulticastRoutingTable: {} entries]".format(len(self._keys))
@@ -0,0 +1,312 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+from collections import OrderedDict
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from .exceptions import (
+    SpinnMachineAlreadyExistsException, SpinnMachineException)
+from .multicast_routing_table import MulticastRoutingTable, UINT32
+
+# File header: magic, version, number of chips
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"SMRT"
+_VERSION = 1
+
+# Index record per chip: x, y, number of entries, offset of entries in file
+_INDEX = struct.Struct("<HHII")
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _block_size(n_entries):
+    """ The number of bytes used to store a table of n_entries: three words\
+        per entry plus a byte per entry, padded to a whole word
+    """
+    return 12 * n_entries + ((n_entries + 3) & ~3)
+
+
+def _word_bytes(column):
+    """ The little-endian bytes of a column of 32-bit words
+    """
+    if _LITTLE_ENDIAN:
+        return memoryview(column).cast("B")
+    words = array(UINT32, column)
+    words.byteswap()
+    return words.tobytes()
+
+
+def _word_view(data, offset, n_entries):
+    """ A view of n_entries little-endian 32-bit words from the data
+    """
+    view = data[offset:offset + 4 * n_entries].cast(UINT32)
+    if _LITTLE_ENDIAN:
+        return view
+    words = array(UINT32, view)
+    words.byteswap()
+    return words
+
+
+class MulticastRoutingTables(object):
+    """ The multicast routing tables of the chips of a machine, keyed by\
+        the (x, y) coordinates of each chip.
+
+        The tables can be written to and read from a binary file, which is\
+        read by memory mapping it so that opening it only reads the index;\
+        each chip's table is then a view of the file created when first\
+        asked for.  The file is made up of, all little-endian:
+
+            * a header of the magic bytes ``SMRT``, the uint32 version and\
+              the uint32 number of chips
+            * an index record per chip of the uint16 x and y, the uint32\
+              number of entries and the uint32 offset of the chip's entries\
+              from the start of the file
+            * per chip at the given offset: the uint32 keys, then the uint32\
+              masks, then the uint32 routes of the entries, then one byte\
+              per entry which is 1 if the entry is defaultable, padded to a\
+              multiple of 4 bytes
+    """
+
+    __slots__ = (
+        # Dict of (x, y) to the table of that chip, or None if not yet read
+        "_tables",
+        # Dict of (x, y) to (n_entries, offset) of tables in _data
+        "_index",
+        # Buffer of the file the tables were read from, or None
+        "_data"
+    )
+
+    def __init__(self, routing_tables=None):
+        """
+        :param routing_tables: (x, y) and table of each chip to start with
+        :type routing_tables:\
+            iterable(tuple(tuple(int,int), MulticastRoutingTable)) or None
+        :raise spinn_machine.exceptions.SpinnMachineAlreadyExistsException:\
+            If there are two tables for the same chip
+        """
+        self._tables = OrderedDict()
+        self._index = dict()
+        self._data = None
+        if routing_tables is not None:
+            for (x, y), table in routing_tables:
+                self.add_routing_table(x, y, table)
+
+    def add_routing_table(self, x, y, routing_table):
+        """ Adds the routing table of a chip
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :param routing_table: The table to add
+        :type routing_table: MulticastRoutingTable
+        :rtype: None
+        :raise spinn_machine.exceptions.SpinnMachineAlreadyExistsException:\
+            If there is already a table for the chip
+        """
+        if (x, y) in self._tables:
+            raise SpinnMachineAlreadyExistsException(
+                "routing table for chip", "{}, {}".format(x, y))
+        self._tables[x, y] = routing_table
+
+    def get_routing_table_for_chip(self, x, y):
+        """ Gets the routing table of a chip
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :return: The table, or None if there is no table for the chip
+        :rtype: MulticastRoutingTable or None
+        """
+        if (x, y) not in self._tables:
+            return None
+        table = self._tables[x, y]
+        if table is None:
+            n_entries, offset = self._index[x, y]
+            table = MulticastRoutingTable.from_columns(
+                _word_view(self._data, offset, n_entries),
+                _word_view(self._data, offset + 4 * n_entries, n_entries),
+                _word_view(self._data, offset + 8 * n_entries, n_entries),
+                self._data[offset + 12 * n_entries:offset + 13 * n_entries])
+            self._tables[x, y] = table
+        return table
+
+    def get_packed_routing_table(self, x, y):
+        """ Gets the routing table of a chip packed as it is in the file\
+            format, which for a table read from a file is a view of the file\
+            itself.
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :return: The keys, masks, routes and defaultable bytes of the table
+        :rtype: memoryview
+        :raise KeyError: If there is no table for the chip
+        """
+        if self._tables[x, y] is None:
+            n_entries, offset = self._index[x, y]
+            return self._data[offset:offset + _block_size(n_entries)]
+        return memoryview(self._pack_table(self._tables[x, y]))
+
+    @staticmethod
+    def _pack_table(table):
+        """ Packs a table as it is in the file format
+
+        :param table: The table to pack
+        :type table: MulticastRoutingTable
+        :rtype: bytearray
+        """
+        n_entries = len(table)
+        block = bytearray(_block_size(n_entries))
+        block[0:4 * n_entries] = _word_bytes(table.keys)
+        block[4 * n_entries:8 * n_entries] = _word_bytes(table.masks)
+        block[8 * n_entries:12 * n_entries] = _word_bytes(table.routes)
+        block[12 * n_entries:13 * n_entries] = bytes(table.defaultables)
+        return block
+
+    @property
+    def chip_coordinates(self):
+        """ The (x, y) coordinates of the chips that have tables
+
+        :rtype: iterable(tuple(int,int))
+        """
+        return self._tables.keys()
+
+    @property
+    def routing_tables(self):
+        """ The (x, y) coordinates and table of each chip
+
+        :rtype: iterable(tuple(tuple(int,int), MulticastRoutingTable))
+        """
+        for (x, y) in list(self._tables):
+            yield (x, y), self.get_routing_table_for_chip(x, y)
+
+    @property
+    def max_number_of_entries(self):
+        """ The largest number of entries in any one table
+
+        :rtype: int
+        """
+        return max(
+            (self._index[xy][0] if table is None else len(table)
+             for xy, table in self._tables.items()), default=0)
+
+    def __iter__(self):
+        return self.routing_tables
+
+    def __len__(self):
+        return len(self._tables)
+
+    def __contains__(self, x_y_tuple):
+        return x_y_tuple in self._tables
+
+    def __getitem__(self, x_y_tuple):
+        x, y = x_y_tuple
+        if x_y_tuple not in self._tables:
+            raise KeyError(x_y_tuple)
+        return self.get_routing_table_for_chip(x, y)
+
+    def __reduce__(self):
+        # The tables are pickled themselves, rather than the file they were
+        # read from
+        return (MulticastRoutingTables, (list(self.routing_tables), ))
+
+    def write(self, file_path):
+        """ Writes the tables to a file in the binary format.\
+            Warning: will overwrite!  The data is written to a temporary\
+            file in the same directory which then replaces the target, so\
+            it is safe to write back to a file these tables were read from.
+
+        :param file_path: The path of the file to write
+        :type file_path: str
+        :rtype: None
+        """
+        offset = _HEADER.size + _INDEX.size * len(self._tables)
+        index = bytearray()
+        for (x, y), table in self._tables.items():
+            if table is None:
+                n_entries = self._index[x, y][0]
+            else:
+                n_entries = len(table)
+            index += _INDEX.pack(x, y, n_entries, offset)
+            offset += _block_size(n_entries)
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(file_path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, len(self._tables)))
+                f.write(index)
+                for x, y in self._tables:
+                    f.write(self.get_packed_routing_table(x, y))
+            # mkstemp makes the file readable only by its owner; give it
+            # the mode open would have given it
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+            os.replace(temp_path, file_path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def read(file_path):
+        """ Opens a file in the binary format by memory mapping it.  Only the\
+            index is read; the tables are views of the mapped file.
+
+        :param file_path: The path of the file to read
+        :type file_path: str
+        :rtype: MulticastRoutingTables
+        :raise spinn_machine.exceptions.SpinnMachineException:\
+            If the file is not in the expected format
+        """
+        with open(file_path, "rb") as f:
+            size = f.seek(0, 2)
+            if size < _HEADER.size:
+                raise SpinnMachineException(
+                    "{} is not a routing tables file".format(file_path))
+            data = memoryview(mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ))
+        magic, version, n_chips = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise SpinnMachineException(
+                "{} is not a routing tables file".format(file_path))
+        if version != _VERSION:
+            raise SpinnMachineException(
+                "{} has unsupported version {}".format(file_path, version))
+        end = _HEADER.size + _INDEX.size * n_chips
+        if size < end:
+            raise SpinnMachineException(
+                "{} is too short for the index of {} chips".format(
+                    file_path, n_chips))
+        tables = MulticastRoutingTables()
+        tables._data = data
+        for x, y, n_entries, offset in _INDEX.iter_unpack(
+                data[_HEADER.size:end]):
+            if offset + _block_size(n_entries) > size:
+                raise SpinnMachineException(
+                    "{} is too short for the table of {} entries of chip "
+                    "{}, {}".format(file_path, n_entries, x, y))
+            tables._tables[x, y] = None
+            tables._index[x, y] = (n_entries, offset)
+        return tables
+
+    def __repr__(self):
+        return "[MulticastRoutingTables: {} chips]".format(len(self._tables))
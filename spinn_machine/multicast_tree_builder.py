@@ -0,0 +1,173 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from .exceptions import SpinnMachineInvalidParameterException
+from .multicast_routing_table import MulticastRoutingTable
+from .multicast_routing_tables import MulticastRoutingTables
+from .router import Router
+from .topology import link_adjacency
+
+# The adjacency shared by the tree building of a worker process
+_worker_adjacency = None
+
+
+def build_tree_routes(adjacency, source, targets):
+    """ Builds a multicast tree over the given links from the chip of a\
+        source core to a set of target cores.
+
+    The tree is a tree of shortest paths found by a breadth-first search\
+    from the source chip, which stops as soon as all the target chips are\
+    reached; where there is a choice, lower link IDs are preferred, so\
+    paths to nearby targets tend to share links.
+
+    :param adjacency: The links of each chip; see\
+        :py:func:`~spinn_machine.topology.link_adjacency`
+    :type adjacency: dict(tuple(int,int), tuple(tuple(int, tuple(int,int))))
+    :param source: The (x, y, p) of the source core
+    :type source: tuple(int,int,int)
+    :param targets: The (x, y, p) of the target cores
+    :type targets: iterable(tuple(int,int,int))
+    :return: The spinnaker_route of each chip the tree goes through
+    :rtype: dict(tuple(int,int), int)
+    :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+        If the source chip is not in the machine, or a target chip cannot\
+        be reached from it
+    """
+    source_xy = (source[0], source[1])
+    if source_xy not in adjacency:
+        raise SpinnMachineInvalidParameterException(
+            "source", str(source),
+            "There is no chip at this location in the machine")
+    routes = dict()
+    for x, y, p in targets:
+        routes[x, y] = routes.get((x, y), 0) | (
+            1 << (Router.MAX_LINKS_PER_ROUTER + p))
+
+    # Breadth-first search until every target chip has been reached
+    parents = {source_xy: None}
+    to_find = set(routes)
+    to_find.discard(source_xy)
+    queue = deque([source_xy])
+    while to_find and queue:
+        xy = queue.popleft()
+        for link_id, next_xy in adjacency[xy]:
+            if next_xy not in parents:
+                parents[next_xy] = (xy, link_id)
+                to_find.discard(next_xy)
+                queue.append(next_xy)
+    if to_find:
+        raise SpinnMachineInvalidParameterException(
+            "targets", str(sorted(to_find)),
+            "These chips cannot be reached from {}".format(source_xy))
+
+    # Add the links of the path back from each target until the tree is met
+    for xy in list(routes):
+        while parents[xy] is not None:
+            parent_xy, link_id = parents[xy]
+            in_tree = parent_xy in routes
+            routes[parent_xy] = routes.get(parent_xy, 0) | (1 << link_id)
+            if in_tree:
+                break
+            xy = parent_xy
+    return routes
+
+
+class MulticastTreeBuilder(object):
+    """ Builds multicast trees over the working chips and links of a\
+        machine, and the routing entries to send packets along them.
+    """
+
+    __slots__ = (
+        # The links of each chip, as given by link_adjacency
+        "_adjacency",
+    )
+
+    def __init__(self, machine):
+        """
+        :param machine: The machine to build trees over
+        :type machine: ~spinn_machine.Machine
+        """
+        self._adjacency = link_adjacency(machine)
+
+    def build_tree(self, source, targets):
+        """ Builds a multicast tree from a source core to target cores; see\
+            :py:func:`build_tree_routes`.
+
+        :param source: The (x, y, p) of the source core
+        :type source: tuple(int,int,int)
+        :param targets: The (x, y, p) of the target cores
+        :type targets: iterable(tuple(int,int,int))
+        :return: The spinnaker_route of each chip the tree goes through
+        :rtype: dict(tuple(int,int), int)
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the source chip is not in the machine, or a target chip\
+            cannot be reached from it
+        """
+        return build_tree_routes(self._adjacency, source, targets)
+
+    def build_routing_tables(self, partitions, n_processes=1):
+        """ Builds a multicast tree for each of many partitions, and the\
+            routing tables that route the keys of each along its tree.
+
+        :param partitions: The source (x, y, p), target (x, y, p)s, key and\
+            mask of each partition
+        :type partitions: iterable(tuple(tuple(int,int,int),\
+            iterable(tuple(int,int,int)), int, int))
+        :param n_processes: The number of processes to build trees in\
+            parallel with; 1 builds them in this process
+        :type n_processes: int
+        :return: The routing table of each chip that any tree goes through,\
+            with an entry per tree in the order of the partitions
+        :rtype: ~spinn_machine.MulticastRoutingTables
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If a source chip is not in the machine, a target chip cannot be\
+            reached, or a key is changed by its mask
+        """
+        partitions = [
+            (source, list(targets), key, mask)
+            for source, targets, key, mask in partitions]
+        trees = [(source, targets) for source, targets, _, _ in partitions]
+        if n_processes > 1:
+            chunk_size = max(1, len(trees) // (n_processes * 4))
+            with ProcessPoolExecutor(
+                    max_workers=n_processes, initializer=_set_worker_adjacency,
+                    initargs=(self._adjacency, )) as executor:
+                all_routes = list(executor.map(
+                    _build_worker_tree, trees, chunksize=chunk_size))
+        else:
+            all_routes = [self.build_tree(*tree) for tree in trees]
+
+        tables = OrderedDict()
+        for (_, _, key, mask), routes in zip(partitions, all_routes):
+            for xy, route in routes.items():
+                if xy not in tables:
+                    tables[xy] = MulticastRoutingTable()
+                tables[xy].add_route(key, mask, route)
+        return MulticastRoutingTables(tables.items())
+
+
+def _set_worker_adjacency(adjacency):
+    """ Stores the adjacency for the trees built in a worker process
+    """
+    global _worker_adjacency
+    _worker_adjacency = adjacency
+
+
+def _build_worker_tree(tree):
+    """ Builds a tree in a worker process
+    """
+    return build_tree_routes(_worker_adjacency, *tree)
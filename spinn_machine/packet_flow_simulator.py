@@ -0,0 +1,238 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import defaultdict
+import heapq
+from .exceptions import SpinnMachineInvalidParameterException
+from .router import Router
+from .routing_tracer import RoutingTracer
+
+
+class PacketFlowSimulator(object):
+    """ A discrete-event simulation of multicast packets flowing through\
+        the routers and links of a machine, to estimate how many packets\
+        are dropped and how long the rest take to arrive.
+
+        Each packet takes router_delay seconds to be routed at each chip.\
+        Each link then sends one packet at a time, taking\
+        1 / link_packets_per_second seconds for each.  A packet that would\
+        have to wait more than max_wait seconds for a link is dropped from\
+        that link, as is a packet routed down a link that does not exist\
+        or, where it was sent, matching no entry.  A packet arriving on a\
+        link and matching no entry is default routed out of the opposite\
+        link.
+
+        The events are processed in windows of time no longer than the\
+        shortest time a packet takes to go from one chip to the next, so\
+        the events of one window cannot cause other events in the same\
+        window.  Each chip's events in a window can then be processed\
+        together, with all their keys looked up in one go.
+    """
+
+    __slots__ = (
+        # The machine the packets go through
+        "_machine",
+        # The tracer that holds the compiled routing tables of the chips
+        "_tracer",
+        # The time taken to route a packet at a chip
+        "_router_delay",
+        # The time taken to send a packet over a link
+        "_link_time",
+        # The longest time a packet waits for a link before being dropped
+        "_max_wait",
+        # The number of packets sent
+        "_n_sent",
+        # The latency of each packet delivered to a core
+        "_latencies",
+        # Dict of (x, y, link ID or None) to the number of packets dropped
+        "_dropped"
+    )
+
+    def __init__(
+            self, machine, routing_tables, link_packets_per_second=5e6,
+            router_delay=1e-7, max_wait=1e-6):
+        """
+        :param machine: The machine the packets go through
+        :type machine: ~spinn_machine.Machine
+        :param routing_tables: The routing tables of the chips
+        :type routing_tables: ~spinn_machine.MulticastRoutingTables
+        :param link_packets_per_second: The packets a link sends per second
+        :type link_packets_per_second: float
+        :param router_delay: The seconds taken to route a packet at a chip
+        :type router_delay: float
+        :param max_wait: The longest time in seconds that a packet waits\
+            for a link before it is dropped
+        :type max_wait: float
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the time to get from one chip to the next is not positive
+        """
+        if router_delay < 0 or link_packets_per_second <= 0:
+            raise SpinnMachineInvalidParameterException(
+                "router_delay and link_packets_per_second",
+                "{} and {}".format(router_delay, link_packets_per_second),
+                "The router delay must not be negative and links must send "
+                "packets")
+        self._machine = machine
+        self._tracer = RoutingTracer(machine, routing_tables)
+        self._router_delay = router_delay
+        self._link_time = 1.0 / link_packets_per_second
+        self._max_wait = max_wait
+        self._n_sent = 0
+        self._latencies = list()
+        self._dropped = defaultdict(int)
+
+    def run(self, emissions):
+        """ Simulates the sending of packets from cores.  The results are\
+            added to those of any earlier runs.
+
+        :param emissions: The (x, y, p) of the core sending each packet,\
+            the key of the packet and the time in seconds it is sent at
+        :type emissions: iterable(tuple(int, int, int, int, float))
+        :rtype: None
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If a sending chip is not in the machine
+        """
+        # Events are (time, order, x, y, link arrived on, key, time sent,
+        # hops so far), where the link is None at the sending chip
+        events = list()
+        for x, y, _, key, time in emissions:
+            if self._machine.get_chip_at(x, y) is None:
+                raise SpinnMachineInvalidParameterException(
+                    "emissions", str((x, y)),
+                    "There is no chip at this location in the machine")
+            events.append((time, len(events), x, y, None, key, time, 0))
+        heapq.heapify(events)
+        self._n_sent += len(events)
+        order = len(events)
+
+        window = self._router_delay + self._link_time
+        max_hops = self._machine.n_chips
+        link_free = dict()
+        while events:
+            window_end = events[0][0] + window
+            by_chip = defaultdict(list)
+            while events and events[0][0] < window_end:
+                event = heapq.heappop(events)
+                by_chip[event[2], event[3]].append(event)
+            for (x, y), chip_events in by_chip.items():
+                for event in self._route_events(
+                        x, y, chip_events, link_free, max_hops):
+                    heapq.heappush(events, event[:1] + (order, ) + event[1:])
+                    order += 1
+
+    def _route_events(self, x, y, events, link_free, max_hops):
+        """ Routes the events of a chip in a window, in time order
+
+        :return: The new events, without their order
+        :rtype: list(tuple)
+        """
+        lookup = self._tracer.get_lookup(x, y)
+        if lookup is None:
+            routes = [None] * len(events)
+        else:
+            routes = lookup.get_routes(event[5] for event in events)
+        router = self._machine.get_chip_at(x, y).router
+        new_events = list()
+        for (time, _, _, _, in_link, key, sent, hops), route in zip(
+                events, routes):
+            if route is None:
+                if in_link is None:
+                    self._dropped[x, y, None] += 1
+                    continue
+                route = 1 << Router.opposite(in_link)
+            routed = time + self._router_delay
+            processor_ids, link_ids = Router.decode_spinnaker_route(route)
+            for _ in processor_ids:
+                self._latencies.append(routed - sent)
+            for link_id in link_ids:
+                link = router.get_link(link_id)
+                start = max(routed, link_free.get((x, y, link_id), routed))
+                if (link is None or start - routed > self._max_wait or
+                        hops >= max_hops):
+                    self._dropped[x, y, link_id] += 1
+                    continue
+                link_free[x, y, link_id] = start + self._link_time
+                new_events.append((
+                    start + self._link_time, link.destination_x,
+                    link.destination_y, Router.opposite(link_id), key, sent,
+                    hops + 1))
+        return new_events
+
+    @property
+    def n_sent(self):
+        """ The number of packets sent
+
+        :rtype: int
+        """
+        return self._n_sent
+
+    @property
+    def n_delivered(self):
+        """ The number of packets delivered to cores; a packet delivered to\
+            several cores is counted once per core
+
+        :rtype: int
+        """
+        return len(self._latencies)
+
+    @property
+    def n_dropped(self):
+        """ The number of packets dropped; a packet dropped from several\
+            links is counted once per link
+
+        :rtype: int
+        """
+        return sum(self._dropped.values())
+
+    @property
+    def dropped(self):
+        """ The number of packets dropped from each (x, y, link ID), where\
+            the link ID is None for packets matching no entry where they\
+            were sent
+
+        :rtype: dict(tuple(int,int,int or None), int)
+        """
+        return dict(self._dropped)
+
+    @property
+    def latencies(self):
+        """ The time in seconds from being sent to being delivered of each\
+            packet delivered to a core
+
+        :rtype: list(float)
+        """
+        return self._latencies
+
+    @property
+    def mean_latency(self):
+        """ The mean time in seconds taken to deliver a packet, or None if\
+            none were delivered
+
+        :rtype: float or None
+        """
+        if not self._latencies:
+            return None
+        return sum(self._latencies) / len(self._latencies)
+
+    @property
+    def max_latency(self):
+        """ The longest time in seconds taken to deliver a packet, or None\
+            if none were delivered
+
+        :rtype: float or None
+        """
+        if not self._latencies:
+            return None
+        return max(self._latencies)
@@ -175,24 +175,56 @@ class Router(object):
             :py:class:`~spinn_machine.MulticastRoutingEntry`
         :rtype: int
         """
+        return Router.convert_routing_ids_to_spinnaker_route(
+            routing_table_entry.processor_ids, routing_table_entry.link_ids)
+
+    @staticmethod
+    def convert_routing_ids_to_spinnaker_route(processor_ids, link_ids):
+        """ Convert lists of route IDs to a binary routing table entry\
+            usable on the machine
+
+        :param processor_ids: The IDs of the processors to route to
+        :type processor_ids: iterable(int)
+        :param link_ids: The IDs of the links to route to
+        :type link_ids: iterable(int)
+        :rtype: int
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If any of the IDs is out of range
+        """
         route_entry = 0
-        for processor_id in routing_table_entry.processor_ids:
+        for processor_id in processor_ids:
             if processor_id >= Router.MAX_CORES_PER_ROUTER or processor_id < 0:
                 raise SpinnMachineInvalidParameterException(
-                    "route.processor_ids",
-                    str(routing_table_entry.processor_ids),
+                    "route.processor_ids", str(processor_ids),
                     "Processor IDs must be between 0 and " +
                     str(Router.MAX_CORES_PER_ROUTER - 1))
-            route_entry |= (1 << (Router.MAX_LINKS_PER_ROUTER + processor_id))
-        for link_id in routing_table_entry.link_ids:
+            route_entry |= _PROCESSOR_BITS[processor_id]
+        for link_id in link_ids:
             if link_id >= Router.MAX_LINKS_PER_ROUTER or link_id < 0:
                 raise SpinnMachineInvalidParameterException(
-                    "route.link_ids", str(routing_table_entry.link_ids),
+                    "route.link_ids", str(link_ids),
                     "Link IDs must be between 0 and " +
                     str(Router.MAX_LINKS_PER_ROUTER - 1))
-            route_entry |= (1 << link_id)
+            route_entry |= _LINK_BITS[link_id]
         return route_entry
 
+    @staticmethod
+    def convert_routing_ids_to_spinnaker_routes(processor_ids, link_ids):
+        """ Convert many lists of route IDs to binary routing table entries\
+            usable on the machine
+
+        :param processor_ids: The processor IDs of each route
+        :type processor_ids: iterable(iterable(int))
+        :param link_ids: The link IDs of each route, in the same order
+        :type link_ids: iterable(iterable(int))
+        :rtype: list(int)
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If any of the IDs is out of range
+        """
+        convert = Router.convert_routing_ids_to_spinnaker_route
+        return [convert(processors, links)
+                for processors, links in zip(processor_ids, link_ids)]
+
     @staticmethod
     def convert_spinnaker_route_to_routing_ids(route):
         """ Convert a binary routing table entry usable on the machine to \
@@ -204,11 +236,39 @@ class Router(object):
         :return: The list of processor IDs, and the list of link IDs.
         :rtype: tuple(list(int), list(int))
         """
-        processor_ids = [pi for pi in range(0, Router.MAX_CORES_PER_ROUTER)
-                         if route & 1 << (Router.MAX_LINKS_PER_ROUTER + pi)]
-        link_ids = [li for li in range(0, Router.MAX_LINKS_PER_ROUTER)
-                    if route & 1 << li]
-        return processor_ids, link_ids
+        processor_ids, link_ids = Router.decode_spinnaker_route(route)
+        return list(processor_ids), list(link_ids)
+
+    @staticmethod
+    def convert_spinnaker_routes_to_routing_ids(routes):
+        """ Convert many binary routing table entries usable on the machine\
+            to the route IDs of each; see :py:meth:`decode_spinnaker_route`.
+
+        :param routes: The routing table entries
+        :type routes: iterable(int)
+        :return: The tuple of processor IDs and tuple of link IDs of each
+        :rtype: list(tuple(tuple(int), tuple(int)))
+        """
+        decode = Router.decode_spinnaker_route
+        return [decode(route) for route in routes]
+
+    @staticmethod
+    def decode_spinnaker_route(route):
+        """ Convert a binary routing table entry usable on the machine to\
+            tuples of route IDs.  The IDs are looked up in tables of every\
+            value of each 6-bit part of the route, so this takes the same\
+            time whatever the route.
+
+        :param route: The routing table entry
+        :type route: int
+        :return: The tuple of processor IDs, and the tuple of link IDs.
+        :rtype: tuple(tuple(int), tuple(int))
+        """
+        return (
+            _PROCESSOR_IDS[0][route >> 6 & 0x3F] +
+            _PROCESSOR_IDS[1][route >> 12 & 0x3F] +
+            _PROCESSOR_IDS[2][route >> 18 & 0x3F],
+            _LINK_IDS[route & 0x3F])
 
     def get_neighbouring_chips_coords(self):
         """ Utility method to convert links into x and y coordinates
@@ -247,3 +307,21 @@ class Router(object):
         """
         # Mod is faster than if
         return (link_id + Router.LINK_OPPOSITE) % Router.MAX_LINKS_PER_ROUTER
+
+
+# The route bit of each processor and each link
+_PROCESSOR_BITS = tuple(
+    1 << (Router.MAX_LINKS_PER_ROUTER + processor_id)
+    for processor_id in range(Router.MAX_CORES_PER_ROUTER))
+_LINK_BITS = tuple(
+    1 << link_id for link_id in range(Router.MAX_LINKS_PER_ROUTER))
+
+# The IDs of the bits set in each 6-bit value
+_LINK_IDS = tuple(
+    tuple(bit for bit in range(6) if value & (1 << bit))
+    for value in range(64))
+
+# The processor IDs of each value of each 6-bit part of the processor bits
+_PROCESSOR_IDS = tuple(
+    tuple(tuple(part * 6 + bit for bit in ids) for ids in _LINK_IDS)
+    for part in range(Router.MAX_CORES_PER_ROUTER // 6))
@@ -0,0 +1,24 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .m_trie import m_trie_compressor
+from .ordered_covering import ordered_covering_compressor
+from .compress_routing_tables import compress_routing_tables
+from .default_route_elision import (
+    remove_default_routes, remove_default_routes_from_table)
+
+__all__ = ["compress_routing_tables", "m_trie_compressor",
+           "ordered_covering_compressor", "remove_default_routes",
+           "remove_default_routes_from_table"]
@@ -0,0 +1,75 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ProcessPoolExecutor
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.multicast_routing_tables import MulticastRoutingTables
+from .ordered_covering import ordered_covering_compressor
+
+
+def compress_routing_tables(
+        routing_tables, machine=None, compressor=ordered_covering_compressor,
+        n_processes=1):
+    """ Compresses the routing table of every chip.
+
+    :param routing_tables: The tables to compress
+    :type routing_tables: ~spinn_machine.MulticastRoutingTables
+    :param machine: The machine the tables are for.  If given, each table\
+        is only compressed until it fits in the router of its chip, and an\
+        exception is raised if it does not.
+    :type machine: ~spinn_machine.Machine or None
+    :param compressor: The function that compresses each table; must take\
+        a table and a target length, and be picklable if n_processes > 1
+    :type compressor: callable
+    :param n_processes: The number of processes to compress tables in\
+        parallel with; 1 compresses in this process
+    :type n_processes: int
+    :return: The compressed tables
+    :rtype: ~spinn_machine.MulticastRoutingTables
+    :raise spinn_machine.exceptions.SpinnMachineException:\
+        If a table does not fit in its router after compression
+    """
+    jobs = list()
+    for (x, y), table in routing_tables:
+        target = None
+        if machine is not None:
+            chip = machine.get_chip_at(x, y)
+            if chip is None:
+                raise SpinnMachineException(
+                    "There is a routing table for chip {}, {} which is not "
+                    "in the machine".format(x, y))
+            target = chip.router.n_available_multicast_entries
+        jobs.append((x, y, table, target))
+
+    if n_processes > 1:
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+            tables = list(executor.map(
+                compressor, [table for _, _, table, _ in jobs],
+                [target for _, _, _, target in jobs]))
+    else:
+        tables = [compressor(table, target) for _, _, table, target in jobs]
+
+    compressed = MulticastRoutingTables()
+    too_big = list()
+    for (x, y, _, target), table in zip(jobs, tables):
+        if target is not None and len(table) > target:
+            too_big.append("{}, {} ({} > {})".format(
+                x, y, len(table), target))
+        compressed.add_routing_table(x, y, table)
+    if too_big:
+        raise SpinnMachineException(
+            "Routing tables could not be compressed to fit chips: {}".format(
+                "; ".join(too_big)))
+    return compressed
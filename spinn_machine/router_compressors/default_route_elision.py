@@ -0,0 +1,150 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+from collections import defaultdict
+from itertools import compress
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.multicast_routing_table import (
+    MulticastRoutingTable, UINT32)
+from spinn_machine.multicast_routing_tables import MulticastRoutingTables
+from spinn_machine.router import Router
+from .utils import KeyMaskIndex
+
+_LINK_BITS = (1 << Router.MAX_LINKS_PER_ROUTER) - 1
+
+
+def single_link(route):
+    """ The link of a route that goes out of exactly one link and to no\
+        processors, which is the only kind of route that default routing\
+        can produce.
+
+    :param route: The spinnaker_route
+    :type route: int
+    :return: The ID of the link, or None if the route is of any other kind
+    :rtype: int or None
+    """
+    if route & ~_LINK_BITS or not route or route & (route - 1):
+        return None
+    return route.bit_length() - 1
+
+
+def remove_default_routes(routing_tables, machine=None):
+    """ Removes the entries of every chip that the router would route in\
+        the same way by default routing, which sends a packet that matches\
+        no entry out of the link opposite the one it arrived on.
+
+    An entry is removed if it is defaultable, it routes to exactly one\
+    link and no processors, and no later entry that is kept shares any\
+    keys with it (as such keys would then match that entry instead).  If a\
+    machine is given, the tables of the neighbouring chips are also used\
+    to check that packets matching the entry only arrive on the link\
+    opposite (see :py:meth:`~spinn_machine.Router.opposite`) its outgoing\
+    link.
+
+    :param routing_tables: The tables of the chips
+    :type routing_tables: ~spinn_machine.MulticastRoutingTables
+    :param machine: The machine the tables are for, or None to trust the\
+        defaultable flags of the entries
+    :type machine: ~spinn_machine.Machine or None
+    :return: New tables without the removed entries
+    :rtype: ~spinn_machine.MulticastRoutingTables
+    :raise spinn_machine.exceptions.SpinnMachineException:\
+        If a machine is given and a table is for a chip not in it
+    """
+    arrivals = None
+    if machine is not None:
+        arrivals = _arrivals(routing_tables, machine)
+    elided = MulticastRoutingTables()
+    for (x, y), table in routing_tables:
+        elided.add_routing_table(x, y, remove_default_routes_from_table(
+            table, None if arrivals is None else arrivals[x, y]))
+    return elided
+
+
+def remove_default_routes_from_table(routing_table, arrivals=None):
+    """ Removes the entries of a single table that default routing would\
+        route in the same way; see :py:func:`remove_default_routes`.
+
+    :param routing_table: The table
+    :type routing_table: ~spinn_machine.MulticastRoutingTable
+    :param arrivals: For each link of the chip, the key-mask pairs of the\
+        packets that can arrive on that link, or None to trust the\
+        defaultable flags of the entries
+    :type arrivals: dict(int, KeyMaskIndex) or None
+    :return: A new table without the removed entries
+    :rtype: ~spinn_machine.MulticastRoutingTable
+    """
+    keys = routing_table.keys
+    masks = routing_table.masks
+    routes = routing_table.routes
+    defaultables = routing_table.defaultables
+    links = dict((route, single_link(route)) for route in set(routes))
+
+    # Work from the end so that the entries kept after each entry are known
+    keep = bytearray(len(keys))
+    kept_after = KeyMaskIndex()
+    for i in range(len(keys) - 1, -1, -1):
+        key, mask, link = keys[i], masks[i], links[routes[i]]
+        if (defaultables[i] and link is not None and
+                not kept_after.intersects(key, mask) and
+                _only_arrives_on(arrivals, Router.opposite(link), key, mask)):
+            continue
+        keep[i] = 1
+        kept_after.add(key, mask)
+
+    return MulticastRoutingTable.from_columns(
+        array(UINT32, compress(keys, keep)),
+        array(UINT32, compress(masks, keep)),
+        array(UINT32, compress(routes, keep)),
+        array("B", compress(defaultables, keep)))
+
+
+def _only_arrives_on(arrivals, link, key, mask):
+    """ Determine if packets matching a key and mask can only arrive on\
+        the given link
+
+    :rtype: bool
+    """
+    if arrivals is None:
+        return True
+    for arrival_link, index in arrivals.items():
+        if arrival_link != link and index.intersects(key, mask):
+            return False
+    return True
+
+
+def _arrivals(routing_tables, machine):
+    """ Find the key-mask pairs that can arrive on each link of each chip,\
+        being those of the entries of neighbouring chips that route out of\
+        the link that goes to the chip.
+
+    :rtype: dict(tuple(int,int), dict(int, KeyMaskIndex))
+    """
+    arrivals = defaultdict(lambda: defaultdict(KeyMaskIndex))
+    for (x, y), table in routing_tables:
+        chip = machine.get_chip_at(x, y)
+        if chip is None:
+            raise SpinnMachineException(
+                "There is a routing table for chip {}, {} which is not in "
+                "the machine".format(x, y))
+        for link in chip.router.links:
+            bit = 1 << link.source_link_id
+            index = arrivals[link.destination_x, link.destination_y][
+                Router.opposite(link.source_link_id)]
+            for key, mask, route in zip(table.keys, table.masks, table.routes):
+                if route & bit:
+                    index.add(key, mask)
+    return arrivals
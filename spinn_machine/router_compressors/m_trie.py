@@ -0,0 +1,111 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from .utils import intersect, rows_to_table, table_rows
+
+
+def m_trie_compressor(routing_table, target_length=None):
+    """ Compresses a routing table by merging pairs of entries with the same\
+        route whose key-mask pairs differ in exactly one bit, in the manner\
+        of an m-Trie.
+
+    Each such pair is replaced by a single entry that does not care about\
+    that bit, which matches exactly the keys of the pair, so an orthogonal\
+    table stays orthogonal and no key is matched that was not matched\
+    before.  This is repeated until no more pairs can be merged.  Entries\
+    with the same key and mask as an earlier entry are removed, as they\
+    can never match.  The\
+    merged entry takes the place of the earlier of the pair, which is only\
+    done if no entry between the two with a different route shares keys\
+    with the later of the pair.  The merged entry is defaultable only if\
+    both of the pair are.
+
+    See Mundy, Heathcote and Garside, "On-chip order-exploiting routing\
+    table minimization for a multicast supercomputer network", 2016.
+
+    :param routing_table: The table to compress
+    :type routing_table: ~spinn_machine.MulticastRoutingTable
+    :param target_length: The number of entries at which to stop\
+        compressing, or None to compress as far as possible
+    :type target_length: int or None
+    :return: A new compressed table
+    :rtype: ~spinn_machine.MulticastRoutingTable
+    """
+    rows = table_rows(routing_table)
+    merged = True
+    while merged and (target_length is None or len(rows) > target_length):
+        merged = False
+        n_rows = len(rows)
+
+        # Where to find each key, mask and route; rows changed this pass
+        # are not looked up again until the next pass.  A row with the same
+        # key and mask as an earlier row never matches so is removed.
+        index = dict()
+        seen = set()
+        removed = set()
+        changed = set()
+        for i, (key, mask, route, _) in enumerate(rows):
+            if (key, mask) in seen:
+                removed.add(i)
+                n_rows -= 1
+                merged = True
+            else:
+                seen.add((key, mask))
+                index[key, mask, route] = i
+
+        for i in range(len(rows)):
+            if i in removed or i in changed:
+                continue
+            key, mask, route, defaultable = rows[i]
+            bits = mask
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                j = index.get((key ^ bit, mask, route))
+                if j is None or j == i or j in removed or j in changed:
+                    continue
+                first, last = min(i, j), max(i, j)
+                if not _can_merge(rows, removed, first, last):
+                    continue
+                rows[first] = (key & ~bit, mask & ~bit, route,
+                               defaultable and rows[j][3])
+                removed.add(last)
+                changed.add(first)
+                merged = True
+                n_rows -= 1
+                break
+            if target_length is not None and n_rows <= target_length:
+                break
+
+        rows = [row for i, row in enumerate(rows) if i not in removed]
+
+    return rows_to_table(rows)
+
+
+def _can_merge(rows, removed, first, last):
+    """ Determine if the row at last can move up to first without any keys\
+        being taken from it by a row in between with a different route.
+
+    :rtype: bool
+    """
+    key, mask, route, _ = rows[last]
+    for k in range(first + 1, last):
+        if k in removed:
+            continue
+        other_key, other_mask, other_route, _ = rows[k]
+        if other_route != route and intersect(
+                key, mask, other_key, other_mask):
+            return False
+    return True
@@ -0,0 +1,256 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from bisect import bisect_right
+from collections import OrderedDict
+from .m_trie import m_trie_compressor
+from .utils import (
+    FULL_MASK, generality, intersect, rows_to_table, table_rows)
+
+
+def ordered_covering_compressor(routing_table, target_length=None):
+    """ Compresses a routing table using Ordered Covering.
+
+    The table is first compressed with the m-Trie compressor, which only\
+    ever replaces entries by one matching exactly the same keys; starting\
+    from those more general entries gives markedly smaller tables (and\
+    takes less time) than covering the original entries, and the result\
+    is never larger than that of m-Trie alone.
+
+    Entries are then sorted by increasing generality, unless that would\
+    change the route of a key (which is never the case for an orthogonal\
+    table, one in which no two entries share a key), and then repeatedly the\
+    largest group of entries with the same route that can be replaced by\
+    a single entry is replaced.  The new entry is placed after all entries\
+    that are no more general than it, and entries are removed from a group\
+    until it neither hides any other entry from the keys it used to match\
+    nor takes any keys from an entry with a different route.
+
+    Each entry remembers the key-mask pairs of the entries it replaces,\
+    its aliases, and only the keys of those need to keep their\
+    routes; this lets a merged entry safely overlap the unused parts of a\
+    more general entry below it.
+
+    The merged entry is defaultable only if all the entries it replaces\
+    are.  Keys that are not matched by any entry of the original table may\
+    be matched by an entry of the compressed table.
+
+    See Mundy, Heathcote and Garside, "On-chip order-exploiting routing\
+    table minimization for a multicast supercomputer network", 2016.
+
+    :param routing_table: The table to compress
+    :type routing_table: ~spinn_machine.MulticastRoutingTable
+    :param target_length: The number of entries at which to stop\
+        compressing, or None to compress as far as possible
+    :type target_length: int or None
+    :return: A new compressed table
+    :rtype: ~spinn_machine.MulticastRoutingTable
+    """
+    rows = table_rows(m_trie_compressor(routing_table, target_length))
+    order = sorted(range(len(rows)), key=lambda i: generality(rows[i][1]))
+    is_sorted = _can_reorder(rows, order)
+    if is_sorted:
+        rows = [rows[i] for i in order]
+    generalities = [generality(row[1]) for row in rows]
+    aliases = [[(row[0], row[1])] for row in rows]
+
+    while target_length is None or len(rows) > target_length:
+        best = None
+        for route, indices in _route_groups(rows).items():
+            if len(indices) < 2:
+                continue
+            if best is not None and len(indices) <= len(best[0]):
+                continue
+            merge = _refine_merge(
+                rows, aliases, generalities, is_sorted, indices, route)
+            if merge is not None and (
+                    best is None or len(merge[0]) > len(best[0])):
+                best = merge
+        if best is None:
+            break
+        merge, key, mask, insertion = best
+        defaultable = all(rows[i][3] for i in merge)
+        kept = [i for i in range(insertion) if i not in merge]
+        new_rows = [rows[i] for i in kept]
+        new_rows.append((key, mask, rows[next(iter(merge))][2], defaultable))
+        new_rows.extend(rows[insertion:])
+        new_aliases = [aliases[i] for i in kept]
+        new_aliases.append([alias for i in sorted(merge)
+                            for alias in aliases[i]])
+        new_aliases.extend(aliases[insertion:])
+        rows = new_rows
+        aliases = new_aliases
+        generalities = [generality(row[1]) for row in rows]
+
+    return rows_to_table(rows)
+
+
+def _can_reorder(rows, order):
+    """ Determine if a table can be put in a new order without changing the\
+        route of any key, which is the case if no two rows with different\
+        routes that share keys change order.
+
+    The rows are grouped by mask so that finding the rows sharing keys\
+    with a row is a lookup per distinct mask rather than a scan of the\
+    table.
+
+    :param rows: The rows in their current order
+    :param order: The indices of the rows in the new order
+    :rtype: bool
+    """
+    position = [0] * len(rows)
+    for new_index, i in enumerate(order):
+        position[i] = new_index
+    by_mask = OrderedDict()
+    for i, row in enumerate(rows):
+        by_mask.setdefault(row[1], list()).append(i)
+    for mask_a, group_a in by_mask.items():
+        for mask_b, group_b in by_mask.items():
+            common = mask_a & mask_b
+            lookup = dict()
+            for j in group_b:
+                lookup.setdefault(rows[j][0] & common, list()).append(j)
+            for i in group_a:
+                for j in lookup.get(rows[i][0] & common, ()):
+                    if (j > i and rows[j][2] != rows[i][2] and
+                            position[j] < position[i]):
+                        return False
+    return True
+
+
+def _insertion_point(generalities, is_sorted, mask):
+    """ The index after the last row that is no more general than a mask
+
+    :rtype: int
+    """
+    merged_generality = generality(mask)
+    if is_sorted:
+        return bisect_right(generalities, merged_generality)
+    for i in range(len(generalities) - 1, -1, -1):
+        if generalities[i] <= merged_generality:
+            return i + 1
+    return 0
+
+
+def _route_groups(rows):
+    """ The indices of the rows with each route
+
+    :rtype: dict(int, list(int))
+    """
+    groups = OrderedDict()
+    for i, row in enumerate(rows):
+        groups.setdefault(row[2], list()).append(i)
+    return groups
+
+
+def _merged_key_mask(rows, merge):
+    """ The key and mask of the single entry that matches all the keys of\
+        the given rows, caring only about bits that all rows care about and\
+        have the same value in.
+
+    :rtype: tuple(int, int)
+    """
+    any_ones = 0
+    all_ones = FULL_MASK
+    all_cared = FULL_MASK
+    for i in merge:
+        key, mask = rows[i][0], rows[i][1]
+        any_ones |= key
+        all_ones &= key
+        all_cared &= mask
+    all_same = all_ones | (~any_ones & FULL_MASK)
+    mask = all_cared & all_same
+    return all_ones & mask, mask
+
+
+def _refine_merge(rows, aliases, generalities, is_sorted, indices, route):
+    """ Reduce a group of rows with the same route until they can be\
+        replaced by a single row without changing the routing of any key\
+        matched by the table.
+
+    :return: The rows of the merge, the key, mask and insertion index of\
+        the merged row, or None if no merge of two or more rows is possible
+    :rtype: tuple(set(int), int, int, int) or None
+    """
+    merge = set(indices)
+    while len(merge) > 1:
+        key, mask = _merged_key_mask(rows, merge)
+        insertion = _insertion_point(generalities, is_sorted, mask)
+
+        # A merged row is no less general than those it replaces, so moves
+        # down the table; rows it moves past must not have been hiding
+        # any of its keys
+        clashes = _up_check(rows, aliases, merge, insertion, route)
+        if clashes:
+            merge -= clashes
+            continue
+
+        # The merged row must not take keys from rows below it
+        remaining = _down_check(
+            rows, aliases, merge, insertion, route, key, mask)
+        if remaining is None:
+            return merge, key, mask, insertion
+        merge = remaining
+    return None
+
+
+def _up_check(rows, aliases, merge, insertion, route):
+    """ Find rows of the merge with an alias that shares keys with a row\
+        of a different route that is between them and the insertion point.
+
+    :rtype: set(int)
+    """
+    clashes = set()
+    for i in merge:
+        for j in range(i + 1, insertion):
+            other = rows[j]
+            if other[2] != route and j not in merge and any(
+                    intersect(key, mask, other[0], other[1])
+                    for key, mask in aliases[i]):
+                clashes.add(i)
+                break
+    return clashes
+
+
+def _down_check(rows, aliases, merge, insertion, route, key, mask):
+    """ Find the first alias of a row after the insertion point with a\
+        different route that shares keys with the merged row, and reduce\
+        the merge so that it no longer does.
+
+    :return: None if there is no such row, or the largest subset of the\
+        merge which avoids the row by setting a single extra mask bit
+    :rtype: set(int) or None
+    """
+    for j in range(insertion, len(rows)):
+        if rows[j][2] == route:
+            continue
+        clash = next((alias for alias in aliases[j]
+                      if intersect(key, mask, alias[0], alias[1])), None)
+        if clash is None:
+            continue
+        other_key, other_mask = clash
+        best = set()
+        bits = ~mask & other_mask & FULL_MASK
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            keep = set(
+                i for i in merge
+                if rows[i][1] & bit and
+                (rows[i][0] & bit) != (other_key & bit))
+            if len(keep) > len(best):
+                best = keep
+        return best
+    return None
@@ -0,0 +1,140 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_machine.multicast_routing_table import MulticastRoutingTable
+
+FULL_MASK = 0xFFFFFFFF
+
+
+def intersect(key_a, mask_a, key_b, mask_b):
+    """ Determine if two key-mask pairs can match the same key.
+
+    :param key_a: The key of the first pair
+    :type key_a: int
+    :param mask_a: The mask of the first pair
+    :type mask_a: int
+    :param key_b: The key of the second pair
+    :type key_b: int
+    :param mask_b: The mask of the second pair
+    :type mask_b: int
+    :return: True if there is a key matched by both pairs
+    :rtype: bool
+    """
+    return (key_a ^ key_b) & mask_a & mask_b == 0
+
+
+def generality(mask):
+    """ The number of bits of a key that a mask does not care about; the\
+        more of these, the more keys an entry with this mask matches.
+
+    :param mask: The mask
+    :type mask: int
+    :rtype: int
+    """
+    return 32 - bin(mask & FULL_MASK).count("1")
+
+
+class KeyMaskIndex(object):
+    """ A collection of key-mask pairs that can be asked whether any of them\
+        shares keys with a given key-mask pair.  The pairs are grouped by\
+        mask, and the keys of each group are hashed on the bits cared about\
+        by both masks, so a query is a lookup per distinct mask rather than\
+        a scan of every pair.
+    """
+
+    __slots__ = (
+        # Dict of mask to the keys of the pairs with that mask
+        "_by_mask",
+        # Dict of mask to dict of query mask to the set of keys masked by
+        # both
+        "_lookups"
+    )
+
+    def __init__(self, key_masks=None):
+        """
+        :param key_masks: The pairs to start with
+        :type key_masks: iterable(tuple(int,int)) or None
+        """
+        self._by_mask = dict()
+        self._lookups = dict()
+        if key_masks is not None:
+            for key, mask in key_masks:
+                self.add(key, mask)
+
+    def add(self, key, mask):
+        """ Adds a key-mask pair
+
+        :param key: The key
+        :type key: int
+        :param mask: The mask
+        :type mask: int
+        :rtype: None
+        """
+        if mask not in self._by_mask:
+            self._by_mask[mask] = list()
+            self._lookups[mask] = dict()
+        self._by_mask[mask].append(key)
+        for query_mask, lookup in self._lookups[mask].items():
+            lookup.add(key & query_mask)
+
+    def intersects(self, key, mask):
+        """ Determine if any pair shares a key with the given pair
+
+        :param key: The key
+        :type key: int
+        :param mask: The mask
+        :type mask: int
+        :rtype: bool
+        """
+        for other_mask, keys in self._by_mask.items():
+            common = other_mask & mask
+            lookup = self._lookups[other_mask].get(common)
+            if lookup is None:
+                lookup = set(other_key & common for other_key in keys)
+                self._lookups[other_mask][common] = lookup
+            if key & common in lookup:
+                return True
+        return False
+
+    def __len__(self):
+        return sum(len(keys) for keys in self._by_mask.values())
+
+
+def table_rows(routing_table):
+    """ The (key, mask, route, defaultable) of each entry of a table
+
+    :param routing_table: The table
+    :type routing_table: MulticastRoutingTable
+    :rtype: list(tuple(int,int,int,bool))
+    """
+    return [
+        (key, mask, route, bool(defaultable))
+        for key, mask, route, defaultable in zip(
+            routing_table.keys, routing_table.masks, routing_table.routes,
+            routing_table.defaultables)]
+
+
+def rows_to_table(rows):
+    """ Make a table from a list of (key, mask, route, defaultable)
+
+    :param rows: The rows of the table
+    :type rows: iterable(tuple(int,int,int,bool))
+    :rtype: MulticastRoutingTable
+    """
+    table = MulticastRoutingTable()
+    if rows:
+        keys, masks, routes, defaultables = zip(*rows)
+        table.extend(keys, masks, routes, defaultables)
+    return table
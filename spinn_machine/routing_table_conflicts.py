@@ -0,0 +1,118 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+
+
+def _groups_by_mask(routing_table):
+    """ The indices of the entries of a table with each mask
+
+    :rtype: list(tuple(int, list(int)))
+    """
+    groups = OrderedDict()
+    for i, mask in enumerate(routing_table.masks):
+        groups.setdefault(mask, list()).append(i)
+    return list(groups.items())
+
+
+def find_conflicting_entries(routing_table):
+    """ Finds the pairs of entries of a table that share keys but have\
+        different routes, so that which of them a shared key is routed by\
+        depends on the order of the table.
+
+    The entries are grouped by mask, and for each pair of masks the keys\
+    of one group are hashed on the bits cared about by both masks, so the\
+    time taken grows with the number of entries times the number of\
+    distinct masks, plus the number of pairs found.
+
+    :param routing_table: The table to check
+    :type routing_table: ~spinn_machine.MulticastRoutingTable
+    :return: The (earlier index, later index) of each conflicting pair, in\
+        order
+    :rtype: list(tuple(int,int))
+    """
+    keys = routing_table.keys
+    routes = routing_table.routes
+    groups = _groups_by_mask(routing_table)
+    conflicts = list()
+    for a, (mask_a, group_a) in enumerate(groups):
+        for mask_b, group_b in groups[a:]:
+            common = mask_a & mask_b
+            by_key = dict()
+            for j in group_b:
+                by_key.setdefault(keys[j] & common, list()).append(j)
+            for i in group_a:
+                for j in by_key.get(keys[i] & common, ()):
+                    if mask_a == mask_b and j <= i:
+                        continue
+                    if routes[i] != routes[j]:
+                        conflicts.append((min(i, j), max(i, j)))
+    conflicts.sort()
+    return conflicts
+
+
+def find_shadowed_entries(routing_table):
+    """ Finds the entries of a table that can never be matched because an\
+        earlier entry matches every key that they match.
+
+    Only shadowing by a single earlier entry is found; an entry whose keys\
+    are only covered by several earlier entries together is not reported.
+
+    :param routing_table: The table to check
+    :type routing_table: ~spinn_machine.MulticastRoutingTable
+    :return: The index of each shadowed entry and the index of the first\
+        entry that shadows it, in order
+    :rtype: list(tuple(int,int))
+    """
+    keys = routing_table.keys
+    groups = _groups_by_mask(routing_table)
+    shadowed = dict()
+    for mask_a, group_a in groups:
+        first = dict()
+        for i in group_a:
+            first.setdefault(keys[i], i)
+        for mask_b, group_b in groups:
+            # Entries with mask_a cover those with mask_b only if mask_b
+            # cares about every bit that mask_a does
+            if mask_a & ~mask_b:
+                continue
+            for j in group_b:
+                i = first.get(keys[j] & mask_a)
+                if i is not None and i < j and (
+                        j not in shadowed or i < shadowed[j]):
+                    shadowed[j] = i
+    return sorted(shadowed.items())
+
+
+def find_routing_table_conflicts(routing_tables):
+    """ Finds the conflicting and shadowed entries in the tables of every\
+        chip; see :py:func:`find_conflicting_entries` and\
+        :py:func:`find_shadowed_entries`.
+
+    :param routing_tables: The tables to check
+    :type routing_tables: ~spinn_machine.MulticastRoutingTables
+    :return: For each chip with any conflicting or shadowed entries, the\
+        (x, y) of the chip mapped to the conflicting pairs and the shadowed\
+        entries
+    :rtype: dict(tuple(int,int),\
+        tuple(list(tuple(int,int)), list(tuple(int,int))))
+    """
+    problems = OrderedDict()
+    for xy, table in routing_tables:
+        conflicts = find_conflicting_entries(table)
+        shadowed = find_shadowed_entries(table)
+        if conflicts or shadowed:
+            problems[xy] = (conflicts, shadowed)
+    return problems
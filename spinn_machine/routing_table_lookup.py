@@ -0,0 +1,115 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+class RoutingTableLookup(object):
+    """ A compiled form of a\
+        :py:class:`~spinn_machine.MulticastRoutingTable` that finds the\
+        entry a key matches without scanning the table.
+
+        As in the router, the entry matched is the first one in the table\
+        that matches the key.  The entries are put in buckets by mask, each\
+        of which maps a masked key to the first entry with that key and\
+        mask, so a lookup is a dictionary lookup per distinct mask.  The\
+        buckets are ordered by the first entry in them, so buckets that\
+        cannot hold an earlier match than one already found are skipped.
+
+        The lookup is a snapshot; it does not see later changes to the table.
+    """
+
+    __slots__ = (
+        # List of (first index, mask, dict of key to index) per mask
+        "_buckets",
+        # The spinnaker_route of each entry
+        "_routes"
+    )
+
+    def __init__(self, routing_table):
+        """
+        :param routing_table: The table to compile
+        :type routing_table: ~spinn_machine.MulticastRoutingTable
+        """
+        by_mask = dict()
+        for index, (key, mask) in enumerate(
+                zip(routing_table.keys, routing_table.masks)):
+            bucket = by_mask.get(mask)
+            if bucket is None:
+                bucket = by_mask[mask] = (index, dict())
+            # Later entries with the same key and mask can never match
+            bucket[1].setdefault(key, index)
+        self._buckets = sorted(
+            (first, mask, keys) for mask, (first, keys) in by_mask.items())
+        self._routes = list(routing_table.routes)
+
+    def get_index(self, key):
+        """ Finds the index of the entry that a key matches
+
+        :param key: The key to look up
+        :type key: int
+        :return: The index of the first matching entry, or None if none match
+        :rtype: int or None
+        """
+        best = None
+        for first, mask, keys in self._buckets:
+            if best is not None and first >= best:
+                break
+            index = keys.get(key & mask)
+            if index is not None and (best is None or index < best):
+                best = index
+        return best
+
+    def get_route(self, key):
+        """ Finds the spinnaker_route that a key is routed with
+
+        :param key: The key to look up
+        :type key: int
+        :return: The route of the first matching entry, or None if none match
+        :rtype: int or None
+        """
+        index = self.get_index(key)
+        if index is None:
+            return None
+        return self._routes[index]
+
+    def get_indices(self, keys):
+        """ Finds the index of the entry that each of many keys matches
+
+        :param keys: The keys to look up
+        :type keys: iterable(int)
+        :return: The index of the first matching entry of each key, or None\
+            where none match
+        :rtype: list(int or None)
+        """
+        get_index = self.get_index
+        return [get_index(key) for key in keys]
+
+    def get_routes(self, keys):
+        """ Finds the spinnaker_route that each of many keys is routed with
+
+        :param keys: The keys to look up
+        :type keys: iterable(int)
+        :return: The route of each key, or None where no entry matches
+        :rtype: list(int or None)
+        """
+        routes = self._routes
+        return [None if index is None else routes[index]
+                for index in self.get_indices(keys)]
+
+    def __len__(self):
+        return len(self._routes)
+
+    def __repr__(self):
+        return "[RoutingTableLookup: {} entries, {} masks]".format(
+            len(self._routes), len(self._buckets))
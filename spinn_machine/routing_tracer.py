@@ -0,0 +1,180 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import defaultdict
+from .exceptions import SpinnMachineInvalidParameterException
+from .router import Router
+from .routing_table_lookup import RoutingTableLookup
+
+
+class RoutingTracer(object):
+    """ Follows multicast packets through the routing tables of a machine\
+        to find the cores that they are delivered to.
+
+        At each chip the packet is routed by the first entry of the chip's\
+        table that matches its key.  A packet that matches no entry is\
+        default routed out of the link opposite the one it arrived on, or\
+        dropped if it was sent from the chip itself.  Packets sent down a\
+        link that the machine does not have are dropped, as are packets\
+        that come back to a chip on a link they have already arrived on\
+        there, which would otherwise go round forever.
+
+        The tables of the chips are compiled into\
+        :py:class:`~spinn_machine.RoutingTableLookup` objects the first\
+        time they are used.
+    """
+
+    __slots__ = (
+        # The machine the packets go through
+        "_machine",
+        # The routing tables of the chips
+        "_routing_tables",
+        # Dict of (x, y) to the lookup of the table, or None if no table
+        "_lookups"
+    )
+
+    def __init__(self, machine, routing_tables):
+        """
+        :param machine: The machine the packets go through
+        :type machine: ~spinn_machine.Machine
+        :param routing_tables: The routing tables of the chips
+        :type routing_tables: ~spinn_machine.MulticastRoutingTables
+        """
+        self._machine = machine
+        self._routing_tables = routing_tables
+        self._lookups = dict()
+
+    def get_lookup(self, x, y):
+        """ Gets the compiled routing table of a chip
+
+        :param x: The x-coordinate of the chip
+        :type x: int
+        :param y: The y-coordinate of the chip
+        :type y: int
+        :return: The lookup, or None if the chip has no table
+        :rtype: ~spinn_machine.RoutingTableLookup or None
+        """
+        if (x, y) not in self._lookups:
+            table = self._routing_tables.get_routing_table_for_chip(x, y)
+            self._lookups[x, y] = (
+                None if table is None else RoutingTableLookup(table))
+        return self._lookups[x, y]
+
+    def trace(self, source_xy, key):
+        """ Finds the cores that a packet is delivered to
+
+        :param source_xy: The (x, y) coordinates of the chip sending the packet
+        :type source_xy: tuple(int,int)
+        :param key: The key of the packet
+        :type key: int
+        :return: The (x, y, processor ID) of each core the packet reaches
+        :rtype: set(tuple(int,int,int))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the source chip is not in the machine
+        """
+        return self.trace_keys(source_xy, [key])[0]
+
+    def trace_keys(self, source_xy, keys):
+        """ Finds the cores that each of many packets sent from the same chip\
+            are delivered to.  The packets are followed together, so each\
+            chip's table is only consulted once for all the packets that\
+            reach it in the same way.
+
+        :param source_xy: The (x, y) coordinates of the chip sending the\
+            packets
+        :type source_xy: tuple(int,int)
+        :param keys: The keys of the packets
+        :type keys: iterable(int)
+        :return: The (x, y, processor ID) of each core each packet reaches,\
+            in the order of the keys
+        :rtype: list(set(tuple(int,int,int)))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the source chip is not in the machine
+        """
+        keys = list(keys)
+        delivered = [set() for _ in keys]
+        for x, y, processor_ids, _, packets in self.trace_hops(
+                source_xy, keys):
+            for processor_id in processor_ids:
+                for i in packets:
+                    delivered[i].add((x, y, processor_id))
+        return delivered
+
+    def trace_hops(self, source_xy, keys):
+        """ Follows many packets sent from the same chip, giving where they\
+            go from each chip they reach.  Packets that reach a chip in the\
+            same way and take the same route from it are given together.
+
+        :param source_xy: The (x, y) coordinates of the chip sending the\
+            packets
+        :type source_xy: tuple(int,int)
+        :param keys: The keys of the packets
+        :type keys: list(int)
+        :return: The x and y of a chip, the IDs of the processors and of the\
+            existing links that the packets are sent to from that chip, and\
+            the indices in keys of the packets
+        :rtype: iterable(tuple(int, int, tuple(int), tuple(int), list(int)))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the source chip is not in the machine
+        """
+        x, y = source_xy
+        if self._machine.get_chip_at(x, y) is None:
+            raise SpinnMachineInvalidParameterException(
+                "source_xy", str(source_xy),
+                "There is no chip at this location in the machine")
+
+        # Packets waiting at each (x, y, link arrived on), where the link is
+        # None for packets sent from the chip itself
+        waiting = {(x, y, None): list(range(len(keys)))}
+        arrived = defaultdict(set)
+        while waiting:
+            next_waiting = defaultdict(list)
+            for (x, y, in_link), packets in waiting.items():
+                seen = arrived[x, y, in_link]
+                packets = [i for i in packets if i not in seen]
+                seen.update(packets)
+                router = self._machine.get_chip_at(x, y).router
+                routed = self._route_packets(x, y, in_link, keys, packets)
+                for route, group in routed.items():
+                    processor_ids, link_ids = Router.decode_spinnaker_route(
+                        route)
+                    links = [router.get_link(link_id) for link_id in link_ids]
+                    links = tuple(link for link in links if link is not None)
+                    for link in links:
+                        next_waiting[
+                            link.destination_x, link.destination_y,
+                            Router.opposite(link.source_link_id)].extend(group)
+                    yield x, y, processor_ids, tuple(
+                        link.source_link_id for link in links), group
+            waiting = next_waiting
+
+    def _route_packets(self, x, y, in_link, keys, packets):
+        """ Groups packets at a chip by the route they take from it
+
+        :rtype: dict(int, list(int))
+        """
+        lookup = self.get_lookup(x, y)
+        if lookup is None:
+            routes = [None] * len(packets)
+        else:
+            routes = lookup.get_routes(keys[i] for i in packets)
+        groups = defaultdict(list)
+        for i, route in zip(packets, routes):
+            if route is None:
+                if in_link is None:
+                    continue
+                route = 1 << Router.opposite(in_link)
+            groups[route].append(i)
+        return groups
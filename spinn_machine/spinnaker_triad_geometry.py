@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
 from spinn_machine.machine import Machine
 
 
@@ -27,7 +29,8 @@ class SpiNNakerTriadGeometry(object):
         triad
     """
     __slots__ = [
-        "_ethernet_offset",
+        "_offset_x",
+        "_offset_y",
         "_triad_height",
         "_triad_width",
         "_roots"]
@@ -50,7 +53,9 @@ class SpiNNakerTriadGeometry(object):
                     12, 12, [(0, 0), (4, 8), (8, 4)], (3.6, 3.4))
         return SpiNNakerTriadGeometry.spinn5_triad_geometry
 
-    def __init__(self, triad_width, triad_height, roots, centre):
+    def __init__(
+            self, triad_width, triad_height, roots, centre,
+            offset_table=None):
         """
 
         :param triad_width: width of a triad in chips
@@ -62,91 +67,96 @@ class SpiNNakerTriadGeometry(object):
         :param centre:\
             the distance from each Ethernet chip to the centre of the hexagon
         :type centre: (float, float)
+        :param offset_table: The x and y offsets of each chip as given by\
+            :py:attr:`offset_table` of an identical geometry, to use instead\
+            of working them out again
+        :type offset_table: tuple(iterable(int), iterable(int)) or None
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If the offset table is not the size of the triad
         """
 
         self._triad_width = triad_width
         self._triad_height = triad_height
         self._roots = roots
 
-        # Copy the Ethernet locations to surrounding triads to make the
-        # mathematics easier
-        extended_ethernet_chips = [
-            (x + x1, y + y1) for (x, y) in roots
-            for x1 in (-triad_width, 0, triad_width)
-            for y1 in (-triad_height, 0, triad_height)
-        ]
-
-        # Find the nearest Ethernet to each chip by hexagonal distance
-        nearest_ethernets = (
-            (self._locate_nearest_ethernet(
-                x, y, extended_ethernet_chips, centre)
-             for x in range(triad_width))
-            for y in range(triad_height)
-        )
-
         # SpiNN-5 Ethernet connected chip lookup.
-        # Used by :py:meth:`.local_eth_coord`. Given an x and y
+        # Used by :py:meth:`.get_local_chip_coordinate`. Given an x and y
         # chip position return the offset of the chip's position
         # from the board's bottom-left chip.
-        # Note: the order of indexes: ``_ethernet_offset[y][x]``!
-        self._ethernet_offset = [
-            [(x - vx, y - vy) for x, (vx, vy) in enumerate(row)]
-            for y, row in enumerate(nearest_ethernets)]
-
-    @staticmethod
-    def _hexagonal_metric_distance(x, y, x_centre, y_centre):
-        """ Get the hexagonal metric distance of a point from the centre of\
-            the hexagon
+        # Note: the index of x, y is ``y * triad_width + x``!
+        if offset_table is None:
+            self._offset_x, self._offset_y = self._offset_table(
+                triad_width, triad_height, roots, centre)
+        else:
+            self._offset_x = array("i", offset_table[0])
+            self._offset_y = array("i", offset_table[1])
+            n_chips = triad_width * triad_height
+            if (len(self._offset_x) != n_chips or
+                    len(self._offset_y) != n_chips):
+                raise SpinnMachineInvalidParameterException(
+                    "offset_table", "{} by {}".format(
+                        len(self._offset_x), len(self._offset_y)),
+                    "There must be {} offsets of each of x and y".format(
+                        n_chips))
 
-            Computes the max of the magnitude of the dot products with the\
-            normal vectors for the hexagon sides. The normal vectors are\
-            (1,0), (0,1) and (1,-1); we don't need to be careful with the\
-            signs of the vectors because we're about to do abs() of them\
-            anyway.
+    @property
+    def offset_table(self):
+        """ The x and y offsets of each chip of the triad from its nearest\
+            Ethernet chip, indexed by ``y * triad_width + x``; a copy, so\
+            changing it does not change the geometry
 
-        :param x: The x-coordinate of the chip to get the distance for
-        :type x: int
-        :param y: The y-coordinate of the chip to get the distance for
-        :type y: int
-        :param x_centre:\
-            The x-coordinate of the centre of the hexagon.  Note that this is\
-            the theoretical centre, it might not be an actual chip
-        :type x_centre: float
-        :param y_centre:\
-            The y-coordinate of the centre of the hexagon.  Note that this is\
-            the theoretical centre, it might not be an actual chip
-        :type y_centre: float
-        :return: how far the chip is away from the centre of the hexagon
-        :rtype: float
+        :rtype: tuple(tuple(int), tuple(int))
         """
-        dx = x - x_centre
-        dy = y - y_centre
-        return max(abs(dx), abs(dy), abs(dx - dy))
+        return tuple(self._offset_x), tuple(self._offset_y)
 
-    def _locate_nearest_ethernet(self, x, y, ethernet_chips, centre):
-        """ Get the coordinate of the nearest Ethernet chip down and left from\
-            a given chip
+    @staticmethod
+    def _offset_table(triad_width, triad_height, roots, centre):
+        """ Get the offset of each chip of a triad from its nearest Ethernet\
+            chip, which is the one whose board centre the chip is closest to\
+            by hexagonal distance.
 
-        :param x: The x-coordinate of the chip to find the nearest Ethernet to
-        :param y: The y-coordinate of the chip to find the nearest Ethernet to
-        :param ethernet_chips: The locations of the Ethernet chips
+        :param triad_width: width of a triad in chips
+        :type triad_width: int
+        :param triad_height: height of a triad in chips
+        :type triad_height: int
+        :param roots: locations of the Ethernet connected chips
+        :type roots: list of (int, int)
         :param centre:\
-            The distance from the Ethernet chip of the centre of the hexagonal\
-            board
-        :return: The nearest Ethernet coordinates as a tuple of x, y
+            the distance from each Ethernet chip to the centre of the hexagon
+        :type centre: (float, float)
+        :return: The x and y offsets of each chip, indexed by\
+            ``y * triad_width + x``
+        :rtype: tuple(array(int), array(int))
         """
         x_c, y_c = centre
+        n_chips = triad_width * triad_height
+        offset_x = array("i", [0]) * n_chips
+        offset_y = array("i", [0]) * n_chips
+        best = [float("inf")] * n_chips
 
-        # Find the coordinates of the closest Ethernet chip by measuring
-        # the distance to the nominal centre of each board; the closest
-        # Ethernet is the one that is on the same board as the one the chip
-        # is closest to the centre of
-        x1, y1, _ = min(
-            ((x0, y0, self._hexagonal_metric_distance(
-                x, y, x0 + x_c, y0 + y_c))
-             for x0, y0 in ethernet_chips),
-            key=lambda tupl: tupl[2])
-        return (x1, y1)
+        # Copy the Ethernet locations to surrounding triads to make the
+        # mathematics easier, then keep for each chip the first Ethernet
+        # chip with the least hexagonal distance from its board centre; this
+        # is the max of the magnitude of the dot products with the normal
+        # vectors (1,0), (0,1) and (1,-1) of the hexagon sides
+        for (x, y) in roots:
+            for x1 in (-triad_width, 0, triad_width):
+                for y1 in (-triad_height, 0, triad_height):
+                    eth_x = x + x1
+                    eth_y = y + y1
+                    x_centre = eth_x + x_c
+                    y_centre = eth_y + y_c
+                    for chip_y in range(triad_height):
+                        dy = chip_y - y_centre
+                        row = chip_y * triad_width
+                        for chip_x in range(triad_width):
+                            dx = chip_x - x_centre
+                            distance = max(abs(dx), abs(dy), abs(dx - dy))
+                            if distance < best[row + chip_x]:
+                                best[row + chip_x] = distance
+                                offset_x[row + chip_x] = chip_x - eth_x
+                                offset_y[row + chip_x] = chip_y - eth_y
+        return offset_x, offset_y
 
     # pylint: disable=too-many-arguments
     def get_ethernet_chip_coordinates(
@@ -182,6 +192,76 @@ class SpiNNakerTriadGeometry(object):
         dx, dy = self.get_local_chip_coordinate(x, y, root_x, root_y)
         return ((x - dx) % width), ((y - dy) % height)
 
+    # pylint: disable=too-many-arguments
+    def get_ethernet_chip_coordinates_batch(
+            self, xs, ys, width, height, root_x=0, root_y=0):
+        """ Get the coordinates of the local Ethernet connected chips of many\
+            chips according to this triad geometry object; see\
+            :py:meth:`get_ethernet_chip_coordinates`
+
+        :param xs: x-coordinates of the chips to find the nearest Ethernet of
+        :type xs: sequence(int)
+        :param ys: y-coordinates of the chips to find the nearest Ethernet of
+        :type ys: sequence(int)
+        :param width:\
+            width of the SpiNNaker machine (must be a multiple of the triad\
+            width of this geometry)
+        :type width: int
+        :param height:\
+            height of the SpiNNaker machine (must be a multiple of the triad\
+            height of this geometry)
+        :type height: int
+        :param root_x: x-coordinate of the boot chip (default 0, 0)
+        :type root_x: int
+        :param root_y: y-coordinate of the boot chip (default 0, 0)
+        :type root_y: int
+        :return: The x and y coordinates of the closest Ethernet chips
+        :rtype: tuple(array(int), array(int))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If there are not as many x-coordinates as y-coordinates
+        """
+        return self._lookup(xs, ys, root_x, root_y, True, width, height)
+
+    # pylint: disable=too-many-arguments
+    def _lookup(self, xs, ys, root_x, root_y, ethernet, width=None,
+                height=None):
+        """ Looks up the offsets of many chips from their Ethernet chips,\
+            giving either the offsets themselves or the coordinates of the\
+            Ethernet chips
+
+        :param ethernet: True to give the coordinates of the Ethernet chips\
+            in a machine of the given width and height, False to give the\
+            offsets
+        :rtype: tuple(array(int), array(int))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If there are not as many x-coordinates as y-coordinates
+        """
+        triad_width = self._triad_width
+        triad_height = self._triad_height
+        offset_x = self._offset_x
+        offset_y = self._offset_y
+        if not isinstance(xs, (list, tuple, array)):
+            xs = list(xs)
+        if not isinstance(ys, (list, tuple, array)):
+            ys = list(ys)
+        if len(xs) != len(ys):
+            raise SpinnMachineInvalidParameterException(
+                "ys", len(ys),
+                "There must be as many y-coordinates as the {} "
+                "x-coordinates".format(len(xs)))
+        indices = [
+            ((y - root_y) % triad_height) * triad_width +
+            (x - root_x) % triad_width
+            for x, y in zip(xs, ys)]
+        if not ethernet:
+            return (array("i", [offset_x[index] for index in indices]),
+                    array("i", [offset_y[index] for index in indices]))
+        return (
+            array("i", [(x - offset_x[index]) % width
+                        for x, index in zip(xs, indices)]),
+            array("i", [(y - offset_y[index]) % height
+                        for y, index in zip(ys, indices)]))
+
     def get_local_chip_coordinate(self, x, y, root_x=0, root_y=0):
         """ Get the coordinates of a chip on its board of a multi-board system\
             relative to the Ethernet chip of the board.
@@ -200,9 +280,29 @@ class SpiNNakerTriadGeometry(object):
         :return: the coordinates of the chip relative to its board
         :rtype: (int, int)
         """
-        dx = (x - root_x) % self._triad_width
-        dy = (y - root_y) % self._triad_height
-        return self._ethernet_offset[dy][dx]
+        index = (((y - root_y) % self._triad_height) * self._triad_width +
+                 (x - root_x) % self._triad_width)
+        return self._offset_x[index], self._offset_y[index]
+
+    def get_local_chip_coordinates_batch(self, xs, ys, root_x=0, root_y=0):
+        """ Get the coordinates of many chips on their boards of a\
+            multi-board system relative to the Ethernet chips of the boards.
+
+        :param xs: The x-coordinates of the chips to find the location of
+        :type xs: iterable(int)
+        :param ys: The y-coordinates of the chips to find the location of
+        :type ys: iterable(int)
+        :param root_x: The x-coordinate of the boot chip (default 0, 0)
+        :type root_x: int
+        :param root_y: The y-coordinate of the boot chip (default 0, 0)
+        :type root_y: int
+        :return: the x and y coordinates of the chips relative to their\
+            boards
+        :rtype: tuple(array(int), array(int))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If there are not as many x-coordinates as y-coordinates
+        """
+        return self._lookup(xs, ys, root_x, root_y, False)
 
     def get_potential_ethernet_chips(self, width, height):
         """ Get the coordinates of chips that should be Ethernet chips
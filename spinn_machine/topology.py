@@ -0,0 +1,33 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+def link_adjacency(machine):
+    """ The links of each chip of a machine that go to another chip of the\
+        machine.
+
+    :param machine: The machine
+    :type machine: ~spinn_machine.Machine
+    :return: For each chip (x, y), the (link ID, (x, y) of the chip at the\
+        other end) of each of its links, in link ID order
+    :rtype: dict(tuple(int,int), tuple(tuple(int, tuple(int,int))))
+    """
+    adjacency = dict()
+    for chip in machine.chips:
+        adjacency[chip.x, chip.y] = tuple(sorted(
+            (link.source_link_id, (link.destination_x, link.destination_y))
+            for link in chip.router.links
+            if machine.is_chip_at(link.destination_x, link.destination_y)))
+    return adjacency
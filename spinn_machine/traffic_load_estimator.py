@@ -0,0 +1,93 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import defaultdict, OrderedDict
+from .routing_tracer import RoutingTracer
+
+
+class TrafficLoadEstimator(object):
+    """ Estimates the number of multicast packets per second that go over\
+        each link and reach each core of a machine, from the routing tables\
+        of the machine and the rate at which each key is sent.
+
+        Packets are followed as by :py:class:`~spinn_machine.RoutingTracer`;\
+        the packets from each chip are followed together, so the tables of\
+        a chip are consulted once for all the packets that reach it in the\
+        same way, and the rate of a group of packets is added to a link in\
+        one go.
+    """
+
+    __slots__ = (
+        # The tracer that follows the packets
+        "_tracer",
+    )
+
+    def __init__(self, machine, routing_tables):
+        """
+        :param machine: The machine the packets go through
+        :type machine: ~spinn_machine.Machine
+        :param routing_tables: The routing tables of the chips
+        :type routing_tables: ~spinn_machine.MulticastRoutingTables
+        """
+        self._tracer = RoutingTracer(machine, routing_tables)
+
+    def estimate(self, packet_rates):
+        """ Estimates the load on each link and core
+
+        :param packet_rates: The (x, y) of the chip that sends each key, the\
+            key, and the packets per second it is sent at
+        :type packet_rates: iterable(tuple(tuple(int,int), int, float))
+        :return: The packets per second sent over each (x, y, link ID) and\
+            received by each (x, y, processor ID) that has any
+        :rtype: tuple(dict(tuple(int,int,int), float),\
+            dict(tuple(int,int,int), float))
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If a sending chip is not in the machine
+        """
+        by_source = OrderedDict()
+        for source_xy, key, rate in packet_rates:
+            keys, rates = by_source.setdefault(tuple(source_xy), ([], []))
+            keys.append(key)
+            rates.append(rate)
+
+        link_loads = defaultdict(float)
+        core_loads = defaultdict(float)
+        for source_xy, (keys, rates) in by_source.items():
+            for x, y, processor_ids, link_ids, packets in \
+                    self._tracer.trace_hops(source_xy, keys):
+                rate = sum(rates[i] for i in packets)
+                for link_id in link_ids:
+                    link_loads[x, y, link_id] += rate
+                for processor_id in processor_ids:
+                    core_loads[x, y, processor_id] += rate
+        return dict(link_loads), dict(core_loads)
+
+    @staticmethod
+    def hotspots(loads, capacity):
+        """ Finds the links or cores with more load than they can carry
+
+        :param loads: The load of each link or core, as given by\
+            :py:meth:`estimate`
+        :type loads: dict(tuple(int,int,int), float)
+        :param capacity: The packets per second that each can carry
+        :type capacity: float
+        :return: The (x, y, ID) and load of each link or core with a load\
+            over the capacity, most loaded first
+        :rtype: list(tuple(tuple(int,int,int), float))
+        """
+        return sorted(
+            ((item, load) for item, load in loads.items()
+             if load > capacity),
+            key=lambda item_load: (-item_load[1], item_load[0]))
@@ -0,0 +1,211 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+from .exceptions import SpinnMachineInvalidParameterException
+from .spinnaker_triad_geometry import SpiNNakerTriadGeometry
+
+logger = logging.getLogger(__name__)
+
+# File header: magic, version, triad width, triad height, key length
+_HEADER = struct.Struct("<4sIIII")
+_MAGIC = b"SMTG"
+_VERSION = 1
+
+
+class TriadGeometryRegistry(object):
+    """ A cache of :py:class:`~spinn_machine.SpiNNakerTriadGeometry`\
+        objects, keyed by the arguments they are made with.
+
+        At most max_size geometries are kept, with the least recently used\
+        ones dropped first.  If a cache directory is given, the offset table\
+        of each geometry made is also written there, and read back rather\
+        than worked out again when the same geometry is next asked for, even\
+        by another registry or process.  Each file is made up of, all\
+        little-endian:
+
+            * a header of the magic bytes ``SMTG``, the uint32 version, the\
+              uint32 triad width and height, and the uint32 length of the key
+            * the key, as the UTF-8 text of its repr
+            * the int32 x offsets then the int32 y offsets of the table
+    """
+
+    __slots__ = (
+        # The geometries by key, least recently used first
+        "_geometries",
+        # The most geometries kept
+        "_max_size",
+        # The directory the offset tables are kept in, or None
+        "_cache_dir"
+    )
+
+    def __init__(self, max_size=16, cache_dir=None):
+        """
+        :param max_size: The most geometries to keep in memory
+        :type max_size: int
+        :param cache_dir: The directory to keep offset tables in, or None to\
+            keep them only in memory
+        :type cache_dir: str or None
+        :raise spinn_machine.exceptions.SpinnMachineInvalidParameterException:\
+            If max_size is less than 1
+        """
+        if max_size < 1:
+            raise SpinnMachineInvalidParameterException(
+                "max_size", str(max_size), "must be at least 1")
+        self._geometries = OrderedDict()
+        self._max_size = max_size
+        self._cache_dir = cache_dir
+
+    @staticmethod
+    def _key(triad_width, triad_height, roots, centre):
+        return (int(triad_width), int(triad_height),
+                tuple((int(x), int(y)) for (x, y) in roots),
+                (float(centre[0]), float(centre[1])))
+
+    def get_geometry(self, triad_width, triad_height, roots, centre):
+        """ Get the geometry with the given arguments, making it only if it\
+            is neither in memory nor in the cache directory
+
+        :param triad_width: width of a triad in chips
+        :type triad_width: int
+        :param triad_height: height of a triad in chips
+        :type triad_height: int
+        :param roots: locations of the Ethernet connected chips
+        :type roots: list of (int, int)
+        :param centre:\
+            the distance from each Ethernet chip to the centre of the hexagon
+        :type centre: (float, float)
+        :rtype: ~spinn_machine.SpiNNakerTriadGeometry
+        """
+        key = self._key(triad_width, triad_height, roots, centre)
+        geometry = self._geometries.get(key)
+        if geometry is not None:
+            self._geometries.move_to_end(key)
+            return geometry
+
+        offset_table = self._read(key)
+        geometry = SpiNNakerTriadGeometry(
+            key[0], key[1], list(key[2]), key[3], offset_table)
+        if offset_table is None:
+            self._write(key, geometry)
+
+        self._geometries[key] = geometry
+        if len(self._geometries) > self._max_size:
+            self._geometries.popitem(last=False)
+        return geometry
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(
+            self._cache_dir, "triad_geometry_{}.bin".format(digest))
+
+    def _read(self, key):
+        """ Reads the offset table of a geometry from the cache directory
+
+        :return: The x and y offsets, or None if there is no usable file
+        :rtype: tuple(tuple(int), tuple(int)) or None
+        """
+        if self._cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except (IOError, OSError):
+            return None
+        key_bytes = repr(key).encode("utf-8")
+        n_chips = key[0] * key[1]
+        if len(data) != _HEADER.size + len(key_bytes) + 8 * n_chips:
+            return None
+        magic, version, width, height, key_length = _HEADER.unpack_from(data)
+        if (magic != _MAGIC or version != _VERSION or
+                (width, height) != key[:2] or
+                data[_HEADER.size:_HEADER.size + key_length] != key_bytes):
+            return None
+        offsets = struct.unpack_from(
+            "<{}i".format(2 * n_chips), data, _HEADER.size + key_length)
+        return offsets[:n_chips], offsets[n_chips:]
+
+    def _write(self, key, geometry):
+        """ Writes the offset table of a geometry to the cache directory,\
+            replacing any file that is there
+        """
+        if self._cache_dir is None:
+            return
+        key_bytes = repr(key).encode("utf-8")
+        offset_x, offset_y = geometry.offset_table
+        data = _HEADER.pack(
+            _MAGIC, _VERSION, key[0], key[1], len(key_bytes)) + key_bytes
+        data += struct.pack(
+            "<{}i".format(len(offset_x) + len(offset_y)),
+            *(list(offset_x) + list(offset_y)))
+        # Written to a temporary file first so that no one reads half a file
+        temp_path = None
+        try:
+            handle, temp_path = tempfile.mkstemp(dir=self._cache_dir)
+            with os.fdopen(handle, "wb") as f:
+                f.write(data)
+            # mkstemp makes the file readable only by its owner; give it
+            # the mode open would have given it, so others can share it
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+            os.replace(temp_path, self._path(key))
+        except (IOError, OSError) as e:
+            logger.warning(
+                "Could not save triad geometry to %s: %s", self._cache_dir, e)
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @property
+    def max_size(self):
+        """ The most geometries kept in memory
+
+        :rtype: int
+        """
+        return self._max_size
+
+    @property
+    def cache_dir(self):
+        """ The directory offset tables are kept in, or None
+
+        :rtype: str or None
+        """
+        return self._cache_dir
+
+    def clear(self):
+        """ Forgets the geometries kept in memory; the files in the cache\
+            directory are kept
+
+        :rtype: None
+        """
+        self._geometries.clear()
+
+    def __len__(self):
+        return len(self._geometries)
+
+    def __contains__(self, key):
+        """ True if the geometry with the given (triad width, triad height,\
+            roots, centre) is kept in memory
+        """
+        return self._key(*key) in self._geometries
+
+    def __repr__(self):
+        return "[TriadGeometryRegistry: {} of {} geometries]".format(
+            len(self._geometries), self._max_size)
@@ -22,7 +22,7 @@ from .sdram import SDRAM
 from .link import Link
 from .spinnaker_triad_geometry import SpiNNakerTriadGeometry
 from .machine_factory import machine_from_size
-from spinn_machine.ignores import IgnoreChip, IgnoreCore, IgnoreLink
+from spinn_machine.ignores import resolve_ignores
 
 logger = logging.getLogger(__name__)
 
@@ -121,46 +121,22 @@ class _VirtualMachine(object):
         # Store the details
         self._sdram_per_chip = sdram_per_chip
 
-        # Store the down items
-        unused_chips = []
-        if down_chips is not None:
-            for down_chip in down_chips:
-                if isinstance(down_chip, IgnoreChip):
-                    if down_chip.ip_address is None:
-                        unused_chips.append((down_chip.x, down_chip.y))
-                else:
-                    unused_chips.append((down_chip[0], down_chip[1]))
+        # Calculate the Ethernet connections in the machine, assuming 48-node
+        # boards
+        geometry = SpiNNakerTriadGeometry.get_spinn5_geometry()
+        ethernet_chips = geometry.get_potential_ethernet_chips(width, height)
 
+        # Store the down items, with those local to a board made global
+        unused_chips, unused_cores, self._unused_links = resolve_ignores(
+            self._machine, down_chips, down_cores, down_links,
+            {self._ip_address(x, y): (x, y) for (x, y) in ethernet_chips})
         self._unused_cores = defaultdict(set)
-        if down_cores is not None:
-            for down_core in down_cores:
-                if isinstance(down_core, IgnoreCore):
-                    if down_core.ip_address is None:
-                        self._unused_cores[(down_core.x, down_core.y)].add(
-                            down_core.virtual_p)
-                else:
-                    self._unused_cores[(down_core[0], down_core[1])].add(
-                        down_core[2])
-
-        self._unused_links = set()
-        if down_links is not None:
-            for down_link in down_links:
-                if isinstance(down_link, IgnoreLink):
-                    if down_link.ip_address is None:
-                        self._unused_links.add(
-                            (down_link.x, down_link.y, down_link.link))
-                else:
-                    self._unused_links.add(
-                        (down_link[0], down_link[1], down_link[2]))
+        for (x, y, p) in unused_cores:
+            self._unused_cores[x, y].add(p)
 
         if width == 2:  # Already checked height is now also 2
             self._unused_links.update(_VirtualMachine._4_chip_down_links)
 
-        # Calculate the Ethernet connections in the machine, assuming 48-node
-        # boards
-        geometry = SpiNNakerTriadGeometry.get_spinn5_geometry()
-        ethernet_chips = geometry.get_potential_ethernet_chips(width, height)
-
         # Compute list of chips that are possible based on configuration
         # If there are no wrap arounds, and the the size is not 2 * 2,
         # the possible chips depend on the 48 chip board's gaps
@@ -186,7 +162,7 @@ class _VirtualMachine(object):
             x, y = x_y
             if x_y in ethernet_chips:
                 new_chip = self._create_chip(
-                    x, y, configured_chips, "127.0.{}.{}".format(x, y))
+                    x, y, configured_chips, self._ip_address(x, y))
             else:
                 new_chip = self._create_chip(x, y, configured_chips)
             self._machine.add_chip(new_chip)
@@ -200,6 +176,12 @@ class _VirtualMachine(object):
     def machine(self):
         return self._machine
 
+    @staticmethod
+    def _ip_address(x, y):
+        """ The IP address given to the Ethernet chip at x, y
+        """
+        return "127.0.{}.{}".format(x, y)
+
     def _create_chip(self, x, y, configured_chips, ip_address=None):
         chip_links = self._calculate_links(x, y, configured_chips)
         chip_router = Router(
@@ -0,0 +1,53 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+from spinn_machine import MulticastRoutingTable
+
+
+def first_match(table, key):
+    """ The route of the first entry of the table that matches the key, or\
+        None if no entry does
+    """
+    for entry_key, mask, route in zip(table.keys, table.masks, table.routes):
+        if key & mask == entry_key:
+            return route
+    return None
+
+
+def check_equivalent(original, compressed, n_key_bits):
+    """ Check that every key matched by the original table is routed the\
+        same by the compressed table
+    """
+    for key in range(1 << n_key_bits):
+        route = first_match(original, key)
+        if route is not None:
+            assert first_match(compressed, key) == route, hex(key)
+
+
+def random_table(seed, n_entries, n_key_bits=8, n_routes=3, n_xs=3):
+    """ A table of random entries with keys of n_key_bits bits, each not\
+        caring about up to n_xs of them
+    """
+    rng = random.Random(seed)
+    table = MulticastRoutingTable()
+    top = 0xFFFFFFFF ^ ((1 << n_key_bits) - 1)
+    for _ in range(n_entries):
+        mask = (1 << n_key_bits) - 1
+        for _ in range(rng.randint(0, n_xs)):
+            mask &= ~(1 << rng.randrange(n_key_bits))
+        key = rng.randrange(1 << n_key_bits) & mask
+        table.add_route(key, mask | top, 1 << rng.randrange(n_routes))
+    return table
@@ -0,0 +1,62 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from spinn_machine import (
+    MulticastRoutingTable, MulticastRoutingTables, virtual_machine)
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.router_compressors import (
+    compress_routing_tables, m_trie_compressor)
+from .routing_check import check_equivalent, random_table
+
+
+def _tables():
+    return MulticastRoutingTables(
+        ((x, y), random_table(x * 8 + y, 40)) for x in range(2)
+        for y in range(2))
+
+
+def test_compress():
+    tables = _tables()
+    compressed = compress_routing_tables(tables)
+    assert list(compressed.chip_coordinates) == \
+        list(tables.chip_coordinates)
+    for xy, table in tables:
+        check_equivalent(table, compressed[xy], 8)
+
+
+def test_compress_parallel():
+    tables = _tables()
+    serial = compress_routing_tables(tables, compressor=m_trie_compressor)
+    parallel = compress_routing_tables(
+        tables, compressor=m_trie_compressor, n_processes=2)
+    for xy, table in serial:
+        assert parallel[xy] == table
+
+
+def test_compress_to_fit():
+    machine = virtual_machine(
+        2, 2, router_entries_per_chip=38, validate=False)
+    compressed = compress_routing_tables(_tables(), machine)
+    for _, table in compressed:
+        assert len(table) <= 38
+
+    machine = virtual_machine(2, 2, router_entries_per_chip=1)
+    with pytest.raises(SpinnMachineException):
+        compress_routing_tables(_tables(), machine)
+
+    tables = MulticastRoutingTables([((5, 5), MulticastRoutingTable())])
+    with pytest.raises(SpinnMachineException):
+        compress_routing_tables(tables, machine)
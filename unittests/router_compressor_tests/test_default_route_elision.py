@@ -0,0 +1,77 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from spinn_machine import (
+    MulticastRoutingTable, MulticastRoutingTables, virtual_machine)
+from spinn_machine.exceptions import SpinnMachineException
+from spinn_machine.router_compressors import (
+    remove_default_routes, remove_default_routes_from_table)
+from spinn_machine.router_compressors.default_route_elision import (
+    single_link)
+
+
+def test_single_link():
+    assert single_link(1 << 4) == 4
+    assert single_link(0) is None
+    assert single_link(0b11) is None
+    assert single_link(1 << 6) is None
+    assert single_link((1 << 6) | 1) is None
+
+
+def test_remove_from_table():
+    table = MulticastRoutingTable()
+    table.add_route(0x10, 0xFFFFFFF0, 1 << 0, True)
+    table.add_route(0x20, 0xFFFFFFF0, 1 << 0, False)
+    table.add_route(0x30, 0xFFFFFFF0, (1 << 0) | (1 << 6), True)
+    table.add_route(0x140, 0xFFFFFFF0, 1 << 2, True)
+    table.add_route(0x100, 0xFFFFFF00, 1 << 1, False)
+    table.add_route(0x50, 0xFFFFFFF0, 1 << 2, True)
+    elided = remove_default_routes_from_table(table)
+    assert list(elided.keys) == [0x20, 0x30, 0x140, 0x100]
+    assert list(elided.masks) == [
+        0xFFFFFFF0, 0xFFFFFFF0, 0xFFFFFFF0, 0xFFFFFF00]
+    assert list(elided.defaultables) == [0, 1, 1, 0]
+    assert len(table) == 6
+
+
+def test_remove_with_machine():
+    machine = virtual_machine(8, 8)
+    east, north_east, south = 0, 1, 5
+
+    # (0, 1) sends 0x10 and 0x20 east to (1, 1); (1, 2) sends 0x20 south
+    # to (1, 1), so only 0x10 arrives only from the west
+    sender = MulticastRoutingTable()
+    sender.add_route(0x10, 0xFFFFFFF0, 1 << east)
+    sender.add_route(0x20, 0xFFFFFFF0, 1 << east)
+    north = MulticastRoutingTable()
+    north.add_route(0x20, 0xFFFFFFF0, 1 << south)
+    middle = MulticastRoutingTable()
+    middle.add_route(0x10, 0xFFFFFFF0, 1 << east, True)
+    middle.add_route(0x20, 0xFFFFFFF0, 1 << east, True)
+    middle.add_route(0x30, 0xFFFFFFF0, 1 << north_east, True)
+    tables = MulticastRoutingTables([
+        ((0, 1), sender), ((1, 2), north), ((1, 1), middle)])
+
+    elided = remove_default_routes(tables, machine)
+    assert list(elided[1, 1].keys) == [0x20]
+    assert len(elided[0, 1]) == 2
+
+    # Without a machine the flags are trusted
+    assert len(remove_default_routes(tables)[1, 1]) == 0
+
+    tables.add_routing_table(20, 20, MulticastRoutingTable())
+    with pytest.raises(SpinnMachineException):
+        remove_default_routes(tables, machine)
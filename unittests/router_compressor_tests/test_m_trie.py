@@ -0,0 +1,78 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_machine import MulticastRoutingTable
+from spinn_machine.router_compressors import m_trie_compressor
+from .routing_check import check_equivalent, first_match, random_table
+
+TOP = 0xFFFFFF00
+
+
+def test_merge_siblings():
+    table = MulticastRoutingTable()
+    for key in range(8):
+        table.add_route(key, TOP | 0xFF, 1 << 7)
+    table.add_route(8, TOP | 0xFF, 1 << 8)
+    compressed = m_trie_compressor(table)
+    assert len(compressed) == 2
+    assert (compressed.keys[0], compressed.masks[0]) == (0, TOP | 0xF8)
+    check_equivalent(table, compressed, 8)
+
+
+def test_matches_no_new_keys():
+    table = MulticastRoutingTable()
+    table.add_route(0b0000, TOP | 0xFF, 1)
+    table.add_route(0b0011, TOP | 0xFF, 1)
+    compressed = m_trie_compressor(table)
+    assert len(compressed) == 2
+    for key in range(256):
+        assert (first_match(compressed, key) is None) == \
+            (first_match(table, key) is None)
+
+
+def test_duplicates_removed():
+    table = MulticastRoutingTable()
+    table.add_route(0b0100, TOP | 0xFF, 1)
+    table.add_route(0b0100, TOP | 0xFF, 2)
+    compressed = m_trie_compressor(table)
+    assert len(compressed) == 1
+    assert compressed.routes[0] == 1
+
+
+def test_defaultable():
+    table = MulticastRoutingTable()
+    table.add_route(0, TOP | 0xFF, 1, True)
+    table.add_route(1, TOP | 0xFF, 1, True)
+    table.add_route(2, TOP | 0xFF, 2, True)
+    table.add_route(3, TOP | 0xFF, 2, False)
+    compressed = m_trie_compressor(table)
+    assert list(compressed.defaultables) == [1, 0]
+
+
+def test_target_length():
+    table = MulticastRoutingTable()
+    for key in range(16):
+        table.add_route(key, TOP | 0xFF, 1)
+    compressed = m_trie_compressor(table, target_length=12)
+    assert len(compressed) == 12
+    check_equivalent(table, compressed, 8)
+
+
+def test_random_tables():
+    for seed in range(20):
+        table = random_table(seed, 60, n_xs=1)
+        compressed = m_trie_compressor(table)
+        assert len(compressed) <= len(table)
+        check_equivalent(table, compressed, 8)
@@ -0,0 +1,108 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+from spinn_machine import MulticastRoutingTable
+from spinn_machine.router_compressors import (
+    m_trie_compressor, ordered_covering_compressor)
+from .routing_check import check_equivalent, random_table
+
+TOP = 0xFFFFFF00
+
+
+def test_merge_same_route():
+    table = MulticastRoutingTable()
+    for key in range(8):
+        table.add_route(key, TOP | 0xFF, 1 << 7)
+    compressed = ordered_covering_compressor(table)
+    assert len(compressed) == 1
+    assert compressed.keys[0] == 0
+    assert compressed.masks[0] == TOP | 0xF8
+    check_equivalent(table, compressed, 8)
+
+
+def test_does_not_steal_keys():
+    table = MulticastRoutingTable()
+    table.add_route(0b0000, TOP | 0xFF, 1)
+    table.add_route(0b0011, TOP | 0xFF, 1)
+    table.add_route(0b0000, TOP | 0xF8, 2)
+    compressed = ordered_covering_compressor(table)
+    check_equivalent(table, compressed, 8)
+    assert len(compressed) == 3
+
+
+def test_unsortable():
+    table = MulticastRoutingTable()
+    table.add_route(0b0000, TOP | 0xF3, 2)
+    table.add_route(0b0000, TOP | 0xFD, 1)
+    table.add_route(0b1000, TOP | 0xFD, 1)
+    compressed = ordered_covering_compressor(table)
+    check_equivalent(table, compressed, 8)
+    assert compressed.routes[0] == 2
+
+
+def test_order_exploited():
+    table = MulticastRoutingTable()
+    table.add_route(0b0001, TOP | 0xFF, 2)
+    for key in (0b0000, 0b0010, 0b0011):
+        table.add_route(key, TOP | 0xFF, 1)
+    compressed = ordered_covering_compressor(table)
+    check_equivalent(table, compressed, 8)
+    assert len(compressed) == 2
+    assert compressed.routes[0] == 2
+
+
+def test_defaultable():
+    table = MulticastRoutingTable()
+    table.add_route(0, TOP | 0xFF, 1, True)
+    table.add_route(1, TOP | 0xFF, 1, True)
+    table.add_route(4, TOP | 0xFF, 1, True)
+    table.add_route(5, TOP | 0xFF, 1, False)
+    table.add_route(8, TOP | 0xFF, 1 << 3, True)
+    table.add_route(9, TOP | 0xFF, 1 << 3, True)
+    compressed = ordered_covering_compressor(table)
+    assert len(compressed) == 2
+    by_route = dict(zip(compressed.routes, compressed.defaultables))
+    assert by_route == {1: 0, 1 << 3: 1}
+
+
+def test_target_length():
+    table = random_table(1, 60)
+    smallest = len(ordered_covering_compressor(table))
+    target = (smallest + len(table)) // 2
+    compressed = ordered_covering_compressor(table, target_length=target)
+    assert smallest <= len(compressed) <= target
+    check_equivalent(table, compressed, 8)
+
+
+def test_random_tables():
+    for seed in range(20):
+        table = random_table(seed, 50)
+        compressed = ordered_covering_compressor(table)
+        assert len(compressed) <= len(table)
+        check_equivalent(table, compressed, 8)
+
+
+def test_dense_tables():
+    # Orthogonal tables of many exact keys with few routes; these are
+    # first merged by m-Trie, which ordered covering then improves on
+    for seed in range(5):
+        rng = random.Random(seed)
+        table = MulticastRoutingTable()
+        for key in sorted(rng.sample(range(1 << 9), 300)):
+            table.add_route(key, 0xFFFFFFFF, 1 << rng.randrange(4))
+        compressed = ordered_covering_compressor(table)
+        assert len(compressed) < len(m_trie_compressor(table))
+        check_equivalent(table, compressed, 9)
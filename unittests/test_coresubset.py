@@ -53,3 +53,13 @@ def test_in_dict():
     d[cs4] = 4
     d[cs5] = 4
     assert len(d) == 4
+
+
+def test_processor_mask():
+    core_subset = CoreSubset(0, 0, [1, 2, 17])
+    assert core_subset.processor_mask == 0b100000000000000110
+    core_subset.add_processor(2)
+    core_subset.add_processor(0)
+    assert core_subset.processor_mask == 0b100000000000000111
+    assert core_subset.intersect(CoreSubset(0, 0, [2, 5])).processor_mask \
+        == 0b100
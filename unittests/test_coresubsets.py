@@ -13,7 +13,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from spinn_machine import CoreSubsets, CoreSubset
+import struct
+import pytest
+from spinn_machine import CoreSubsets, CoreSubset, virtual_machine
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
 
 
 def test_coresubsets():
@@ -94,3 +97,58 @@ def test_values():
     css = CoreSubsets([cs1, cs2, cs3, cs4, cs5])
 
     assert len(css.values()) == 2
+
+
+def test_split_by_board():
+    machine = virtual_machine(width=12, height=12)
+    css = CoreSubsets()
+    css.add_processor(0, 0, 1)
+    css.add_processor(1, 1, 2)
+    css.add_processor(8, 4, 1)
+    css.add_processor(9, 4, 3)
+    css.add_processor(4, 8, 5)
+    by_board = css.split_by_board(machine)
+    assert set(by_board.keys()) == {(0, 0), (8, 4), (4, 8)}
+    assert len(by_board[0, 0]) == 2
+    assert (1, 1, 2) in by_board[0, 0]
+    assert len(by_board[8, 4]) == 2
+    assert (9, 4, 3) in by_board[8, 4]
+    assert by_board[4, 8][4, 8] is css[4, 8]
+    assert sum(len(board) for board in by_board.values()) == len(css)
+
+
+def test_split_by_board_missing_chip():
+    machine = virtual_machine(width=8, height=8)
+    css = CoreSubsets([CoreSubset(7, 0, [1])])
+    with pytest.raises(SpinnMachineInvalidParameterException):
+        css.split_by_board(machine)
+
+
+def test_pack_processor_masks():
+    css = CoreSubsets([CoreSubset(1, 2, [1, 3]), CoreSubset(0, 0, [17])])
+    assert list(css.processor_masks) == [(1, 2, 0b1010), (0, 0, 1 << 17)]
+    packed = css.pack_processor_masks()
+    assert isinstance(packed, memoryview)
+    assert packed.nbytes == 16
+    assert list(struct.iter_unpack(
+        "<" + CoreSubsets.MASK_RECORD_FORMAT, packed)) == \
+        list(css.processor_masks)
+    assert CoreSubsets().pack_processor_masks().nbytes == 0
+
+
+def test_processor_mask_runs():
+    css = CoreSubsets()
+    for y in range(4):
+        css.add_processor(0, y, 1)
+    css.add_processor(0, 5, 1)
+    css.add_processor(1, 0, 1)
+    css.add_processor(1, 1, 1)
+    css.add_processor(1, 1, 2)
+    css.add_processor(0, 4, 2)
+    assert css.processor_mask_runs() == [
+        (0, 0, 4, 0b10), (0, 4, 1, 0b100), (0, 5, 1, 0b10),
+        (1, 0, 1, 0b10), (1, 1, 1, 0b110)]
+    packed = css.pack_processor_mask_runs()
+    assert list(struct.iter_unpack(
+        "<" + CoreSubsets.MASK_RUN_FORMAT, packed)) == \
+        css.processor_mask_runs()
@@ -0,0 +1,74 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import DataLoadScheduler, virtual_machine
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+
+class TestDataLoadScheduler(unittest.TestCase):
+
+    def test_one_board(self):
+        scheduler = DataLoadScheduler(
+            virtual_machine(8, 8), bandwidth=100.0, hop_time=1.0)
+        plans = scheduler.schedule({
+            (0, 0, 1): 300, (1, 0, 1): 100, (2, 1, 3): 200})
+        self.assertEqual(list(plans), [(0, 0)])
+        # Times are 3 for (0, 0, 1), 1 + 1 for (1, 0, 1), 2 + 2 for (2, 1, 3)
+        self.assertEqual(plans[0, 0], [
+            (1, 0, 1, 100), (0, 0, 1, 300), (2, 1, 3, 200)])
+        self.assertEqual(scheduler.load_times(plans), {(0, 0): 9.0})
+
+    def test_balance(self):
+        scheduler = DataLoadScheduler(virtual_machine(12, 12))
+        plans = scheduler.schedule([
+            ((7, 3, 1), 100000), ((8, 4, 1), 200000)])
+        # (7, 3) is on the board of (0, 0) but next to (8, 4), which is busy
+        self.assertEqual(plans, {
+            (0, 0): [(7, 3, 1, 100000)], (8, 4): [(8, 4, 1, 200000)]})
+        plans = scheduler.schedule([
+            ((7, 3, 1), 100000), ((8, 4, 1), 10)])
+        self.assertEqual(plans, {
+            (8, 4): [(8, 4, 1, 10), (7, 3, 1, 100000)]})
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            scheduler.load_times({(4, 8): [(7, 3, 1, 10)]})
+
+    def test_down_ethernet(self):
+        machine = virtual_machine(
+            12, 12, down_chips=[(4, 8)], validate=False)
+        scheduler = DataLoadScheduler(machine)
+        sizes = {(chip.x, chip.y, 1): 1000 for chip in machine.chips}
+        plans = scheduler.schedule(sizes)
+        self.assertEqual(list(plans), [(0, 0), (8, 4)])
+        self.assertEqual(sum(len(plan) for plan in plans.values()),
+                         len(sizes))
+        times = list(scheduler.load_times(plans).values())
+        self.assertLess(max(times) - min(times), 1.0)
+
+    def test_bad(self):
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            DataLoadScheduler(virtual_machine(8, 8), bandwidth=0)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            DataLoadScheduler(virtual_machine(8, 8), hop_time=-1)
+        scheduler = DataLoadScheduler(virtual_machine(
+            8, 8, down_chips=[(1, 0), (1, 1), (0, 1)]))
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            scheduler.schedule({(0, 7, 1): 10})
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            scheduler.schedule({(2, 2, 1): 10})
+
+
+if __name__ == '__main__':
+    unittest.main()
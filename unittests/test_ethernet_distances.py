@@ -0,0 +1,86 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import virtual_machine
+from spinn_machine.ethernet_distances import UNREACHABLE, EthernetDistances
+
+
+class TestEthernetDistances(unittest.TestCase):
+
+    def test_one_board(self):
+        machine = virtual_machine(8, 8)
+        distances = EthernetDistances(machine)
+        self.assertEqual(len(distances), 48)
+        self.assertEqual(distances.ethernet_xys, ((0, 0), ))
+        self.assertEqual(distances.get_own_distance(0, 0), 0)
+        self.assertEqual(distances.get_own_distance(1, 1), 1)
+        self.assertEqual(distances.get_own_distance(4, 0), 4)
+        self.assertEqual(distances.get_own_distance(7, 7), 7)
+        self.assertEqual(distances.get_nearest_distance(7, 3), 7)
+        self.assertEqual(distances.get_nearest_ethernet(3, 6), (0, 0))
+        self.assertEqual(list(distances.own_distances),
+                         list(distances.nearest_distances))
+        self.assertEqual(set(distances.nearest_ethernets), {0})
+        self.assertIn((2, 5), distances)
+        self.assertNotIn((0, 7), distances)
+        with self.assertRaises(KeyError):
+            distances.get_own_distance(0, 7)
+
+    def test_down_chip(self):
+        machine = virtual_machine(8, 8, down_chips=[(1, 0), (1, 1), (0, 1)])
+        distances = EthernetDistances(machine)
+        for xy in distances.chip_coordinates:
+            if xy != (0, 0):
+                self.assertIsNone(distances.get_own_distance(*xy))
+                self.assertIsNone(distances.get_nearest_ethernet(*xy))
+        self.assertEqual(
+            set(distances.nearest_distances), {0, UNREACHABLE})
+
+    def test_down_ethernet(self):
+        machine = virtual_machine(12, 12)
+        distances = EthernetDistances(machine)
+        self.assertEqual(len(distances.ethernet_xys), 3)
+        self.assertEqual(distances.get_own_distance(7, 3), 7)
+        self.assertEqual(distances.get_nearest_ethernet(7, 3), (8, 4))
+        self.assertEqual(distances.get_nearest_distance(7, 3), 1)
+        for xy in distances.chip_coordinates:
+            self.assertLessEqual(distances.get_nearest_distance(*xy),
+                                 distances.get_own_distance(*xy))
+
+        machine = virtual_machine(
+            12, 12, down_chips=[(4, 8)], validate=False)
+        distances = EthernetDistances(machine)
+        self.assertEqual(len(distances.ethernet_xys), 2)
+        for chip in machine.chips:
+            xy = (chip.x, chip.y)
+            if (chip.nearest_ethernet_x, chip.nearest_ethernet_y) == (4, 8):
+                self.assertIsNone(distances.get_own_distance(*xy))
+                self.assertIsNotNone(distances.get_nearest_ethernet(*xy))
+            else:
+                self.assertIsNotNone(distances.get_own_distance(*xy))
+
+    def test_machine_cache(self):
+        machine = virtual_machine(8, 8)
+        distances = machine.ethernet_distances
+        self.assertIs(machine.ethernet_distances, distances)
+        machine.reset_ethernet_distances()
+        self.assertIsNot(machine.ethernet_distances, distances)
+        self.assertEqual(list(machine.ethernet_distances.own_distances),
+                         list(distances.own_distances))
+
+
+if __name__ == '__main__':
+    unittest.main()
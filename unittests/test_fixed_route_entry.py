@@ -15,7 +15,8 @@
 
 import unittest
 from spinn_machine import FixedRouteEntry
-from spinn_machine.exceptions import SpinnMachineAlreadyExistsException
+from spinn_machine.exceptions import (
+    SpinnMachineAlreadyExistsException, SpinnMachineInvalidParameterException)
 
 
 class TestingFixedRouteEntries(unittest.TestCase):
@@ -35,6 +36,23 @@ class TestingFixedRouteEntries(unittest.TestCase):
         self.assertEqual(e.exception.item, "link ID")
         self.assertEqual(e.exception.value, "2")
 
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            FixedRouteEntry([18], [])
+
+    def test_fixed_route_words(self):
+        fre = FixedRouteEntry([1, 2, 3], [2, 3, 4])
+        self.assertEqual(fre.spinnaker_route, 0b1110011100)
+        copy = FixedRouteEntry.from_spinnaker_route(0b1110011100)
+        self.assertEqual(copy, fre)
+        self.assertEqual(hash(copy), hash(fre))
+        self.assertEqual(copy.processor_ids, {1, 2, 3})
+        self.assertEqual(copy.link_ids, {2, 3, 4})
+        self.assertNotEqual(copy, FixedRouteEntry([1], []))
+        entries = FixedRouteEntry.from_spinnaker_routes([1, 1 << 6, 0])
+        self.assertEqual(entries[1].processor_ids, {0})
+        self.assertEqual(list(FixedRouteEntry.to_spinnaker_routes(entries)),
+                         [1, 1 << 6, 0])
+
 
 if __name__ == '__main__':
     unittest.main()
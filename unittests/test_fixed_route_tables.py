@@ -0,0 +1,55 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import (
+    FixedRouteEntry, FixedRouteTables, build_fixed_routes, virtual_machine)
+from spinn_machine.exceptions import SpinnMachineAlreadyExistsException
+
+
+class TestFixedRouteTables(unittest.TestCase):
+
+    def test_tables(self):
+        tables = FixedRouteTables([
+            ((0, 0), FixedRouteEntry([1], [])),
+            ((1, 0), FixedRouteEntry([], [3]))])
+        tables.add_spinnaker_route(2, 0, 1 << 3)
+        self.assertEqual(len(tables), 3)
+        self.assertIn((2, 0), tables)
+        self.assertEqual(tables[2, 0], FixedRouteEntry([], [3]))
+        self.assertEqual(tables.get_fixed_route(0, 0).processor_ids, {1})
+        self.assertIsNone(tables.get_fixed_route(5, 5))
+        self.assertEqual(list(tables.chip_coordinates),
+                         [(0, 0), (1, 0), (2, 0)])
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            tables.add_fixed_route(0, 0, FixedRouteEntry([], [1]))
+
+    def test_pack(self):
+        machine = virtual_machine(12, 12)
+        tables = FixedRouteTables.from_spinnaker_routes(
+            build_fixed_routes(machine, 1))
+        self.assertEqual(len(tables), 144)
+        packed = tables.pack()
+        self.assertEqual(len(packed), 144 * 8)
+        buffer = bytearray(len(packed) + 4)
+        tables.pack_into(buffer, 4)
+        self.assertEqual(bytes(buffer[4:]), bytes(packed))
+        unpacked = FixedRouteTables.unpack(packed)
+        self.assertEqual(list(unpacked), list(tables))
+        self.assertEqual(str(unpacked), "[FixedRouteTables: 144 chips]")
+
+
+if __name__ == '__main__':
+    unittest.main()
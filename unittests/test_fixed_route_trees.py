@@ -0,0 +1,88 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import Router, build_fixed_routes, virtual_machine
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+
+class TestFixedRouteTrees(unittest.TestCase):
+
+    def _check_routes(self, machine, routes, processor):
+        """ Follows the route of every chip to its Ethernet chip
+        """
+        for chip in machine.chips:
+            xy = (chip.x, chip.y)
+            ethernet_xy = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+            for _ in range(machine.n_chips):
+                processor_ids, link_ids = Router.decode_spinnaker_route(
+                    routes[xy])
+                if xy == ethernet_xy:
+                    break
+                self.assertEqual(processor_ids, ())
+                self.assertEqual(len(link_ids), 1)
+                link = machine.get_chip_at(*xy).router.get_link(link_ids[0])
+                xy = (link.destination_x, link.destination_y)
+            self.assertEqual(xy, ethernet_xy)
+            self.assertEqual(processor_ids, (processor, ))
+            self.assertEqual(link_ids, ())
+
+    def test_one_board(self):
+        machine = virtual_machine(8, 8)
+        routes = build_fixed_routes(machine, 3)
+        self.assertEqual(len(routes), 48)
+        self._check_routes(machine, routes, 3)
+        # The chips are spread over the links into the Ethernet chip as
+        # evenly as shortest paths allow
+        through = dict()
+        for chip in machine.chips:
+            xy = (chip.x, chip.y)
+            while xy != (0, 0):
+                last_xy = xy
+                link_id = Router.decode_spinnaker_route(routes[xy])[1][0]
+                link = machine.get_chip_at(*xy).router.get_link(link_id)
+                xy = (link.destination_x, link.destination_y)
+            if (chip.x, chip.y) != (0, 0):
+                through[last_xy] = through.get(last_xy, 0) + 1
+        self.assertEqual(sorted(through), [(0, 1), (1, 0), (1, 1)])
+        self.assertEqual(sum(through.values()), 47)
+        self.assertLessEqual(max(through.values()), 18)
+
+    def test_down_links(self):
+        machine = virtual_machine(
+            8, 8, down_links=[(1, 0, 3), (1, 1, 4), (0, 1, 5)],
+            validate=False)
+        routes = build_fixed_routes(machine, 0)
+        # Only the Ethernet chip itself is left
+        self.assertEqual(list(routes), [(0, 0)])
+
+        machine = virtual_machine(8, 8, down_links=[(1, 0, 3), (1, 1, 4)])
+        routes = build_fixed_routes(machine, 0)
+        self.assertEqual(len(routes), 48)
+        self._check_routes(machine, routes, 0)
+
+    def test_many_boards(self):
+        machine = virtual_machine(12, 12)
+        routes = build_fixed_routes(machine, 1)
+        self.assertEqual(len(routes), 144)
+        self._check_routes(machine, routes, 1)
+        self.assertEqual(build_fixed_routes(machine, 1, n_processes=2),
+                         routes)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            build_fixed_routes(machine, 18)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import IOCapacityAnalyser, virtual_machine
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+
+class TestIOCapacityAnalyser(unittest.TestCase):
+
+    def test_ethernet_limited(self):
+        analyser = IOCapacityAnalyser(virtual_machine(8, 8))
+        self.assertEqual(analyser.analyse([(7, 7)]), (2560, [], [(0, 0)]))
+
+        machine = virtual_machine(12, 12)
+        analyser = IOCapacityAnalyser(machine, link_bandwidth=1000)
+        throughput, links, ethernets = analyser.analyse(
+            (chip.x, chip.y) for chip in machine.chips)
+        self.assertEqual(throughput, 3 * 2560)
+        self.assertEqual(links, [])
+        self.assertEqual(ethernets, [(0, 0), (4, 8), (8, 4)])
+
+    def test_link_limited(self):
+        analyser = IOCapacityAnalyser(
+            virtual_machine(8, 8), link_bandwidth=100)
+        # Only the three links out of the Ethernet chip go anywhere
+        self.assertEqual(analyser.analyse([(4, 4), (5, 5), (4, 4)]), (
+            300, [(0, 0, 0), (0, 0, 1), (0, 0, 2)], []))
+
+    def test_broken_links(self):
+        machine = virtual_machine(
+            8, 8, down_links=[(0, 0, 0), (0, 0, 1)])
+        analyser = IOCapacityAnalyser(machine, link_bandwidth=1000)
+        self.assertEqual(analyser.analyse([(3, 0)]), (
+            1000, [(0, 0, 2)], []))
+        machine = virtual_machine(
+            8, 8, down_links=[(0, 0, 0), (0, 0, 1), (0, 0, 2)])
+        analyser = IOCapacityAnalyser(machine)
+        self.assertEqual(analyser.analyse([(3, 0)]), (0, [], []))
+        self.assertEqual(analyser.analyse([(0, 0)]), (2560, [], [(0, 0)]))
+
+    def test_bad(self):
+        machine = virtual_machine(8, 8)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            IOCapacityAnalyser(machine, ethernet_bandwidth=0)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            IOCapacityAnalyser(machine, link_bandwidth=-1)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            IOCapacityAnalyser(machine).analyse([(7, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
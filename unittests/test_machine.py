@@ -18,7 +18,8 @@ test for testing the python representation of a spinnaker machine
 """
 import unittest
 from spinn_machine import (
-    Link, SDRAM, Router, Chip, machine_from_chips, machine_from_size)
+    Link, SDRAM, Router, Chip, machine_from_chips, machine_from_size,
+    virtual_machine)
 from spinn_machine.exceptions import SpinnMachineAlreadyExistsException
 
 
@@ -236,6 +237,51 @@ class SpinnMachineTestCase(unittest.TestCase):
         self.assertIsNone(new_machine.get_spinnaker_link_with_id(1))
         self.assertIsNone(new_machine.get_fpga_link_with_id(1, 0))
 
+    def test_board_index(self):
+        new_machine = machine_from_size(8, 8)
+        self.assertEqual(new_machine.get_down_xys(), [])
+        chips = self._create_chips()
+        for chip in chips[:10]:
+            new_machine.add_chip(chip)
+        self.assertEqual(len(new_machine.get_down_xys_by_ethernet(0, 0)), 39)
+        for chip in chips[10:]:
+            new_machine.add_chip(chip)
+        # (0, 4) is not on the board, so is in no index
+        down = new_machine.get_down_xys()
+        self.assertEqual(len(down), 24)
+        self.assertNotIn((0, 4), down)
+        self.assertEqual(down, new_machine.get_down_xys_by_ethernet(0, 0))
+        self.assertEqual(
+            down, new_machine.get_down_local_xys_by_ethernet(0, 0))
+        self.assertEqual(
+            new_machine.get_chips_by_ethernet(0, 0),
+            [new_machine[xy]
+             for xy in new_machine.get_existing_xys_by_ethernet(0, 0)])
+        cores = new_machine.get_user_cores_by_ethernet(0, 0)
+        self.assertEqual(len(cores), 48)
+        self.assertEqual(sum(1 for n_cores in cores if n_cores), 24)
+
+    def test_board_index_wrapped(self):
+        new_machine = virtual_machine(12, 12, down_chips=[(3, 11), (11, 3)])
+        self.assertEqual(
+            sorted(new_machine.get_down_xys()), [(3, 11), (11, 3)])
+        self.assertEqual(new_machine.get_down_xys_by_ethernet(4, 8),
+                         [(11, 3)])
+        self.assertEqual(new_machine.get_down_xys_by_ethernet(8, 4),
+                         [(3, 11)])
+        self.assertEqual(new_machine.get_down_local_xys_by_ethernet(4, 8),
+                         [(7, 7)])
+        self.assertEqual(new_machine.get_down_local_xys_by_ethernet(8, 4),
+                         [(7, 7)])
+        self.assertEqual(new_machine.get_down_local_xys_by_ethernet(0, 0),
+                         [])
+        self.assertEqual(
+            len(new_machine.get_existing_xys_by_ethernet(4, 8)), 47)
+        self.assertEqual(
+            sum(new_machine.get_user_cores_by_ethernet(0, 0)),
+            sum(chip.n_user_processors
+                for chip in new_machine.get_chips_by_ethernet(0, 0)))
+
     def test_x_y_over_link(self):
         """
         Test the x_y with each wrap around.
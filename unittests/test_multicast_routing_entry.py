@@ -45,6 +45,24 @@ class TestMulticastRoutingEntry(unittest.TestCase):
             a_multicast,
             pickle.loads(pickle.dumps(a_multicast, pickle.HIGHEST_PROTOCOL)))
 
+    def test_pickle_from_route(self):
+        entry = MulticastRoutingEntry(
+            0x10, 0xF0, defaultable=True, spinnaker_route=(1 << 7) | 1)
+        copy = pickle.loads(pickle.dumps(entry, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(copy, entry)
+        self.assertEqual(copy.processor_ids, [1])
+        self.assertEqual(copy.link_ids, [0])
+        self.assertTrue(copy.defaultable)
+
+    def test_hash(self):
+        a = MulticastRoutingEntry(0x10, 0xF0, [1, 2], [0], True)
+        b = MulticastRoutingEntry(
+            0x10, 0xF0, defaultable=True, spinnaker_route=a.spinnaker_route)
+        c = MulticastRoutingEntry(0x10, 0xF0, [1, 2], [0], False)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b, c}), 2)
+        self.assertEqual({a: 1}[b], 1)
+
     def test_duplicate_processors_ids(self):
         link_ids = list()
         proc_ids = list()
@@ -163,6 +181,51 @@ class TestMulticastRoutingEntry(unittest.TestCase):
         self.assertNotEqual(result_multicast, a_multicast)
         self.assertNotEqual(result_multicast, b_multicast)
 
+    def test_merger_from_routes(self):
+        a = MulticastRoutingEntry(1, 1, spinnaker_route=(1 << 6) | 1)
+        b = MulticastRoutingEntry(1, 1, [1, 2], [1])
+        merged = a.merge(b)
+        self.assertEqual(merged.spinnaker_route, (0b111 << 6) | 0b11)
+        self.assertEqual(list(merged.processor_ids), [0, 1, 2])
+        self.assertEqual(list(merged.link_ids), [0, 1])
+        self.assertEqual(b.merge(a), merged)
+
+    def test_merger_after_reading_ids(self):
+        a = MulticastRoutingEntry(1, 1, spinnaker_route=(1 << 6) | 1)
+        b = MulticastRoutingEntry(1, 1, spinnaker_route=(1 << 8) | 2)
+        c = MulticastRoutingEntry(1, 1, [1, 2], [1])
+
+        # Reading the IDs of entries made from routes works them out
+        self.assertEqual(list(a.processor_ids), [0])
+        self.assertEqual(list(b.link_ids), [1])
+        for merged in (a.merge(b), a + b, a | b):
+            self.assertEqual(merged.spinnaker_route, (0b101 << 6) | 0b11)
+            self.assertEqual(sorted(merged.processor_ids), [0, 2])
+            self.assertEqual(sorted(merged.link_ids), [0, 1])
+        for merged in (a.merge(c), c + a, a | c):
+            self.assertEqual(sorted(merged.processor_ids), [0, 1, 2])
+            self.assertEqual(sorted(merged.link_ids), [0, 1])
+        self.assertEqual(sorted((a + b + c).processor_ids), [0, 1, 2])
+
+    def test_merge_entries(self):
+        entries = [
+            MulticastRoutingEntry(1, 1, [p], [], True) for p in range(18)]
+        entries.append(MulticastRoutingEntry(
+            1, 1, defaultable=True, spinnaker_route=0b111111))
+        merged = MulticastRoutingEntry.merge_entries(entries)
+        self.assertEqual(merged.spinnaker_route, (1 << 24) - 1)
+        self.assertTrue(merged.defaultable)
+        self.assertEqual(merged, MulticastRoutingEntry(
+            1, 1, range(18), range(6), True))
+        entries.append(MulticastRoutingEntry(1, 1, [0], [], False))
+        self.assertFalse(
+            MulticastRoutingEntry.merge_entries(entries).defaultable)
+        entries.append(MulticastRoutingEntry(3, 3, [0], []))
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            MulticastRoutingEntry.merge_entries(entries)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            MulticastRoutingEntry.merge_entries([])
+
     def test_merger_with_invalid_parameter_key(self):
         link_ids = list()
         link_ids2 = list()
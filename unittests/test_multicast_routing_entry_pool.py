@@ -0,0 +1,38 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import MulticastRoutingEntry, MulticastRoutingEntryPool
+
+
+class TestMulticastRoutingEntryPool(unittest.TestCase):
+
+    def test_intern(self):
+        pool = MulticastRoutingEntryPool()
+        a = MulticastRoutingEntry(0x10, 0xF0, [1, 2], [0])
+        b = MulticastRoutingEntry(0x10, 0xF0, [2, 1], [0])
+        self.assertIs(pool.intern(a), a)
+        self.assertIs(pool.intern(b), a)
+        self.assertIs(pool.get_entry(0x10, 0xF0, a.spinnaker_route), a)
+        c = pool.get_entry(0x10, 0xF0, a.spinnaker_route, True)
+        self.assertIsNot(c, a)
+        self.assertTrue(c.defaultable)
+        self.assertEqual(len(pool), 2)
+        self.assertIn(b, pool)
+        self.assertEqual(set(pool), {a, c})
+
+
+if __name__ == '__main__':
+    unittest.main()
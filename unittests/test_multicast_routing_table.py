@@ -0,0 +1,134 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from array import array
+import pickle
+import sys
+import unittest
+from spinn_machine import MulticastRoutingEntry, MulticastRoutingTable
+from spinn_machine.multicast_routing_table import UINT32, _unpickle_table
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+
+class TestMulticastRoutingTable(unittest.TestCase):
+
+    def _entries(self):
+        return [
+            MulticastRoutingEntry(0x100, 0xFFFFFF00, [1, 2], [0]),
+            MulticastRoutingEntry(0x200, 0xFFFFFFFF, [], [3, 4], True),
+            MulticastRoutingEntry(0x0, 0xFFFF0000, [17], [])]
+
+    def test_create(self):
+        entries = self._entries()
+        table = MulticastRoutingTable(entries)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.number_of_entries, 3)
+        self.assertEqual(table.number_of_defaultable_entries, 1)
+        self.assertEqual(list(table.keys), [0x100, 0x200, 0x0])
+        self.assertEqual(list(table.masks),
+                         [0xFFFFFF00, 0xFFFFFFFF, 0xFFFF0000])
+        self.assertEqual(list(table.routes),
+                         [e.spinnaker_route for e in entries])
+        self.assertEqual(list(table.defaultables), [0, 1, 0])
+        self.assertEqual(table.multicast_routing_entries, entries)
+        self.assertEqual(list(table), entries)
+        self.assertEqual(table[1], entries[1])
+        self.assertEqual(table[-1].processor_ids, [17])
+        self.assertEqual(table.keys.itemsize, 4)
+        self.assertEqual(str(table), "[MulticastRoutingTable: 3 entries]")
+
+    def test_add_route_and_extend(self):
+        table = MulticastRoutingTable()
+        table.add_route(0x10, 0xF0, 1 << 6, True)
+        table.extend([0x20, 0x30], [0xF0, 0xF0], [1, 2])
+        table.extend([0x40], [0xF0], [4], [True])
+        self.assertEqual(list(table.keys), [0x10, 0x20, 0x30, 0x40])
+        self.assertEqual(list(table.defaultables), [1, 0, 0, 1])
+        self.assertEqual(table[0].processor_ids, [0])
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            table.add_route(0x11, 0xF0, 1)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            table.extend([0x11], [0xF0], [1])
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            table.extend([0x10, 0x20], [0xF0], [1])
+        self.assertEqual(len(table), 4)
+
+    def test_slice(self):
+        entries = self._entries()
+        table = MulticastRoutingTable(entries)
+        part = table[1:]
+        self.assertIsInstance(part, MulticastRoutingTable)
+        self.assertEqual(list(part), entries[1:])
+        self.assertEqual(table[::-1], MulticastRoutingTable(entries[::-1]))
+        self.assertNotEqual(part, table)
+
+    def test_sort(self):
+        entries = self._entries()
+        table = MulticastRoutingTable(entries)
+        table.sort()
+        self.assertEqual(list(table), [entries[1], entries[0], entries[2]])
+        table.sort(key=lambda row: row[0])
+        self.assertEqual(list(table), [entries[2], entries[0], entries[1]])
+        table.sort(reverse=True)
+        self.assertEqual(list(table), [entries[2], entries[0], entries[1]])
+
+    def test_pickle(self):
+        table = MulticastRoutingTable(self._entries())
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            copy = pickle.loads(pickle.dumps(table, protocol))
+            self.assertEqual(copy, table)
+            self.assertEqual(list(copy), list(table))
+        empty = pickle.loads(pickle.dumps(MulticastRoutingTable()))
+        self.assertEqual(len(empty), 0)
+
+        # Unpickled tables copy themselves when changed
+        copy.add_route(0x800, 0xF00, 7)
+        self.assertEqual(len(copy), 4)
+        self.assertEqual(len(table), 3)
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "needs pickle protocol 5")
+    def test_pickle_out_of_band(self):
+        table = MulticastRoutingTable(self._entries())
+        buffers = list()
+        data = pickle.dumps(table, 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 4)
+        self.assertLess(len(data), 100)
+        copy = pickle.loads(data, buffers=buffers)
+        self.assertEqual(copy, table)
+        self.assertEqual(copy[1].link_ids, [3, 4])
+
+    def test_unpickle_other_byte_order(self):
+        table = MulticastRoutingTable(self._entries())
+        other = "big" if sys.byteorder == "little" else "little"
+        columns = list()
+        for column in (table.keys, table.masks, table.routes):
+            words = array(UINT32, column)
+            words.byteswap()
+            columns.append(words.tobytes())
+        copy = _unpickle_table(
+            *columns, defaultables=bytes(bytearray(table.defaultables)),
+            byteorder=other)
+        self.assertEqual(copy, table)
+
+        # Swapped columns are arrays already, the defaultables are not
+        copy.add_route(0x800, 0xF00, 7, True)
+        self.assertEqual(len(copy), 4)
+        self.assertEqual(copy[3].routing_entry_key, 0x800)
+        self.assertTrue(copy[3].defaultable)
+        self.assertEqual(list(copy)[:3], list(table))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+import unittest
+from spinn_machine import (
+    MulticastRoutingEntry, MulticastRoutingTable, MulticastRoutingTables)
+from spinn_machine.exceptions import (
+    SpinnMachineAlreadyExistsException, SpinnMachineException)
+
+
+class TestMulticastRoutingTables(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, "tables.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def _tables(self):
+        table_0 = MulticastRoutingTable([
+            MulticastRoutingEntry(0x100, 0xFFFFFF00, [1, 2], [0]),
+            MulticastRoutingEntry(0x200, 0xFFFFFFFF, [], [3], True),
+            MulticastRoutingEntry(0x300, 0xFFFFFF00, [17], [5])])
+        table_1 = MulticastRoutingTable([
+            MulticastRoutingEntry(0x400, 0xFFFFFC00, [3], [])])
+        return MulticastRoutingTables([
+            ((0, 0), table_0), ((1, 0), table_1),
+            ((2, 3), MulticastRoutingTable())])
+
+    def test_tables(self):
+        tables = self._tables()
+        self.assertEqual(len(tables), 3)
+        self.assertIn((1, 0), tables)
+        self.assertNotIn((1, 1), tables)
+        self.assertEqual(list(tables.chip_coordinates),
+                         [(0, 0), (1, 0), (2, 3)])
+        self.assertEqual(len(tables[0, 0]), 3)
+        self.assertIsNone(tables.get_routing_table_for_chip(1, 1))
+        self.assertEqual(tables.max_number_of_entries, 3)
+        self.assertEqual(MulticastRoutingTables().max_number_of_entries, 0)
+        with self.assertRaises(KeyError):
+            tables[5, 5]
+        with self.assertRaises(SpinnMachineAlreadyExistsException):
+            tables.add_routing_table(0, 0, MulticastRoutingTable())
+
+    def test_write_read(self):
+        tables = self._tables()
+        tables.write(self._path)
+        self.assertEqual(os.path.getsize(self._path),
+                         12 + 3 * 12 + (3 * 12 + 4) + (12 + 4))
+        read = MulticastRoutingTables.read(self._path)
+        self.assertEqual(len(read), 3)
+        self.assertEqual(read.max_number_of_entries, 3)
+        self.assertEqual(list(read.chip_coordinates),
+                         list(tables.chip_coordinates))
+        for (xy, table) in tables:
+            self.assertEqual(read[xy], table)
+            self.assertEqual(list(read[xy]), list(table))
+        self.assertEqual(read[0, 0][1].link_ids, [3])
+        self.assertTrue(read[0, 0][1].defaultable)
+
+        # Tables read from file copy themselves when changed
+        read[1, 0].add_route(0x800, 0xF00, 7)
+        self.assertEqual(len(read[1, 0]), 2)
+
+        # Writing what was read gives the same file
+        path_2 = os.path.join(self._dir, "tables_2.bin")
+        MulticastRoutingTables.read(self._path).write(path_2)
+        with open(self._path, "rb") as f1, open(path_2, "rb") as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_write_same_path(self):
+        tables = self._tables()
+        tables.write(self._path)
+        with open(self._path, "rb") as f:
+            original = f.read()
+
+        # Write back over the mapped file, changing one table on the way
+        read = MulticastRoutingTables.read(self._path)
+        read[1, 0].add_route(0x800, 0xF00, 7)
+        read.write(self._path)
+        for (xy, table) in tables:
+            if xy != (1, 0):
+                self.assertEqual(read[xy], table)
+        self.assertEqual(os.listdir(self._dir), ["tables.bin"])
+
+        again = MulticastRoutingTables.read(self._path)
+        self.assertEqual(again[0, 0], tables[0, 0])
+        self.assertEqual(len(again[1, 0]), 2)
+        self.assertEqual(again[1, 0][1].spinnaker_route, 7)
+
+        # Writing unchanged tables back gives the same file
+        MulticastRoutingTables.read(self._path).write(self._path)
+        tables.write(self._path)
+        MulticastRoutingTables.read(self._path).write(self._path)
+        with open(self._path, "rb") as f:
+            self.assertEqual(f.read(), original)
+
+    @unittest.skipIf(os.name == "nt", "needs POSIX file modes")
+    def test_write_mode(self):
+        umask = os.umask(0o022)
+        try:
+            self._tables().write(self._path)
+        finally:
+            os.umask(umask)
+        self.assertEqual(os.stat(self._path).st_mode & 0o777, 0o644)
+
+    def test_truncated_file(self):
+        self._tables().write(self._path)
+        with open(self._path, "rb") as f:
+            data = f.read()
+
+        # Cut in the index
+        with open(self._path, "wb") as f:
+            f.write(data[:12 + 12 + 6])
+        with self.assertRaises(SpinnMachineException):
+            MulticastRoutingTables.read(self._path)
+
+        # Cut in the entries of the second table
+        with open(self._path, "wb") as f:
+            f.write(data[:12 + 3 * 12 + (3 * 12 + 4) + 8])
+        with self.assertRaises(SpinnMachineException):
+            MulticastRoutingTables.read(self._path)
+
+        # All there
+        with open(self._path, "wb") as f:
+            f.write(data)
+        self.assertEqual(len(MulticastRoutingTables.read(self._path)), 3)
+
+    def test_packed(self):
+        tables = self._tables()
+        tables.write(self._path)
+        read = MulticastRoutingTables.read(self._path)
+        packed = read.get_packed_routing_table(0, 0)
+        self.assertEqual(bytes(packed),
+                         bytes(tables.get_packed_routing_table(0, 0)))
+        keys = struct.unpack_from("<3I", packed, 0)
+        self.assertEqual(keys, (0x100, 0x200, 0x300))
+        masks = struct.unpack_from("<3I", packed, 12)
+        self.assertEqual(masks, (0xFFFFFF00, 0xFFFFFFFF, 0xFFFFFF00))
+        self.assertEqual(bytes(packed[36:]), b"\x00\x01\x00\x00")
+        with self.assertRaises(KeyError):
+            read.get_packed_routing_table(4, 4)
+
+    def test_pickle(self):
+        tables = self._tables()
+        tables.write(self._path)
+        for source in (tables, MulticastRoutingTables.read(self._path)):
+            copy = pickle.loads(pickle.dumps(source))
+            self.assertEqual(list(copy.chip_coordinates),
+                             list(tables.chip_coordinates))
+            for (xy, table) in tables:
+                self.assertEqual(copy[xy], table)
+
+    def test_bad_file(self):
+        with open(self._path, "wb") as f:
+            f.write(b"NOTATABLEFILE")
+        with self.assertRaises(SpinnMachineException):
+            MulticastRoutingTables.read(self._path)
+        with open(self._path, "wb") as f:
+            f.write(b"SM")
+        with self.assertRaises(SpinnMachineException):
+            MulticastRoutingTables.read(self._path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import MulticastTreeBuilder, RoutingTracer, virtual_machine
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+
+class TestMulticastTreeBuilder(unittest.TestCase):
+
+    def test_build_tree(self):
+        builder = MulticastTreeBuilder(virtual_machine(8, 8))
+        routes = builder.build_tree((0, 0, 1), [(3, 0, 2), (3, 0, 5)])
+        # A straight line east, delivering to both cores at the end
+        self.assertEqual(routes, {
+            (0, 0): 1, (1, 0): 1, (2, 0): 1,
+            (3, 0): (1 << 8) | (1 << 11)})
+        self.assertEqual(builder.build_tree((0, 0, 1), [(0, 0, 3)]),
+                         {(0, 0): 1 << 9})
+        self.assertEqual(builder.build_tree((0, 0, 1), []), {})
+
+    def test_avoids_down_chips(self):
+        machine = virtual_machine(8, 8, down_chips=[(1, 0), (1, 1)])
+        builder = MulticastTreeBuilder(machine)
+        routes = builder.build_tree((0, 0, 1), [(2, 0, 1)])
+        self.assertNotIn((1, 0), routes)
+        self.assertNotIn((1, 1), routes)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            builder.build_tree((1, 0, 1), [(2, 0, 1)])
+
+    def test_unreachable(self):
+        machine = virtual_machine(
+            8, 8, down_chips=[(0, 1), (1, 1), (1, 0)], validate=False)
+        builder = MulticastTreeBuilder(machine)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            builder.build_tree((0, 0, 1), [(5, 5, 1)])
+
+    def test_build_routing_tables(self):
+        machine = virtual_machine(8, 8)
+        builder = MulticastTreeBuilder(machine)
+        partitions = [
+            ((0, 0, 1), [(7, 7, 1), (3, 5, 2), (5, 1, 3)], 0x100, 0xFFFFFF00),
+            ((4, 4, 2), [(0, 0, 4), (4, 4, 5)], 0x200, 0xFFFFFF00),
+            ((3, 6, 3), [(3, 6, 4), (4, 7, 4), (7, 3, 1)], 0x300, 0xFFFFFF00)]
+        tables = builder.build_routing_tables(partitions)
+        tracer = RoutingTracer(machine, tables)
+        for (x, y, _), targets, key, _ in partitions:
+            self.assertEqual(tracer.trace((x, y), key), set(targets))
+        parallel = builder.build_routing_tables(partitions, n_processes=2)
+        for xy, table in tables:
+            self.assertEqual(parallel[xy], table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import (
+    MulticastRoutingTable, MulticastRoutingTables, MulticastTreeBuilder,
+    PacketFlowSimulator, virtual_machine)
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+EAST = 0
+
+
+class TestPacketFlowSimulator(unittest.TestCase):
+
+    def _simulator(self, **kwargs):
+        machine = virtual_machine(8, 8)
+        tables = MulticastTreeBuilder(machine).build_routing_tables([
+            ((0, 0, 1), [(3, 0, 2), (3, 0, 3)], 0x100, 0xFFFFFF00)])
+        return PacketFlowSimulator(
+            machine, tables, link_packets_per_second=1e6, router_delay=1e-7,
+            **kwargs)
+
+    def test_uncongested(self):
+        simulator = self._simulator()
+        simulator.run([(0, 0, 1, 0x100, 0.0), (0, 0, 1, 0x100, 1e-3)])
+        self.assertEqual(simulator.n_sent, 2)
+        self.assertEqual(simulator.n_delivered, 4)
+        self.assertEqual(simulator.n_dropped, 0)
+        # Four routers and three links
+        self.assertAlmostEqual(simulator.mean_latency, 4e-7 + 3e-6)
+        self.assertAlmostEqual(simulator.max_latency, 4e-7 + 3e-6)
+
+    def test_congested(self):
+        simulator = self._simulator(max_wait=2.5e-6)
+        simulator.run([(0, 0, 1, 0x100, 0.0)] * 5)
+        # The first link sends one packet per microsecond, so packets that
+        # would wait more than 2.5 microseconds are dropped
+        self.assertEqual(simulator.dropped, {(0, 0, EAST): 2})
+        self.assertEqual(simulator.n_delivered, 6)
+        self.assertAlmostEqual(simulator.max_latency, 4e-7 + 5e-6)
+
+    def test_unroutable(self):
+        simulator = self._simulator()
+        simulator.run([(0, 0, 1, 0x200, 0.0)])
+        self.assertEqual(simulator.dropped, {(0, 0, None): 1})
+        self.assertIsNone(simulator.mean_latency)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            simulator.run([(20, 20, 1, 0x100, 0.0)])
+
+    def test_loop(self):
+        machine = virtual_machine(8, 8)
+        there = MulticastRoutingTable()
+        there.add_route(0x100, 0xFFFFFF00, 1 << EAST)
+        back = MulticastRoutingTable()
+        back.add_route(0x100, 0xFFFFFF00, 1 << 3)
+        tables = MulticastRoutingTables([((0, 0), there), ((1, 0), back)])
+        simulator = PacketFlowSimulator(machine, tables)
+        simulator.run([(0, 0, 1, 0x100, 0.0)])
+        self.assertEqual(simulator.n_dropped, 1)
+        self.assertEqual(simulator.n_delivered, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
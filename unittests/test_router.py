@@ -15,7 +15,8 @@
 
 import unittest
 from spinn_machine import Router, Link, MulticastRoutingEntry
-from spinn_machine.exceptions import SpinnMachineAlreadyExistsException
+from spinn_machine.exceptions import (
+    SpinnMachineAlreadyExistsException, SpinnMachineInvalidParameterException)
 
 
 class TestingRouter(unittest.TestCase):
@@ -81,6 +82,30 @@ class TestingRouter(unittest.TestCase):
         r = Router.convert_routing_table_entry_to_spinnaker_route(e)
         self.assertEqual(r, 11306)
 
+    def test_convert_routes_in_bulk(self):
+        processor_ids = [[4, 5, 7], [], [0, 17], list(range(18))]
+        link_ids = [[1, 3, 5], [0], [], list(range(6))]
+        routes = Router.convert_routing_ids_to_spinnaker_routes(
+            processor_ids, link_ids)
+        self.assertEqual(routes[0], 11306)
+        self.assertEqual(routes[1], 1)
+        self.assertEqual(routes[3], (1 << 24) - 1)
+        self.assertEqual(
+            Router.convert_spinnaker_routes_to_routing_ids(routes),
+            [(tuple(p), tuple(links))
+             for p, links in zip(processor_ids, link_ids)])
+        for route in routes:
+            e = MulticastRoutingEntry(0, 0, spinnaker_route=route)
+            self.assertEqual(
+                Router.convert_routing_table_entry_to_spinnaker_route(e),
+                route)
+        self.assertEqual(Router.convert_spinnaker_route_to_routing_ids(
+            11306), ([4, 5, 7], [1, 3, 5]))
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            Router.convert_routing_ids_to_spinnaker_routes([[18]], [[]])
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            Router.convert_routing_ids_to_spinnaker_route([], [-1])
+
 
 if __name__ == '__main__':
     unittest.main()
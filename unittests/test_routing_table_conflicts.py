@@ -0,0 +1,73 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+import unittest
+from spinn_machine import (
+    MulticastRoutingTable, MulticastRoutingTables, find_conflicting_entries,
+    find_routing_table_conflicts, find_shadowed_entries)
+from spinn_machine.router_compressors.utils import intersect
+
+
+class TestRoutingTableConflicts(unittest.TestCase):
+
+    def _table(self):
+        table = MulticastRoutingTable()
+        table.add_route(0x10, 0xFFFFFFF0, 1)
+        table.add_route(0x12, 0xFFFFFFFF, 2)
+        table.add_route(0x10, 0xFFFFFFF0, 3)
+        table.add_route(0x00, 0xFFFFFF00, 1)
+        table.add_route(0x20, 0xFFFFFFF0, 4)
+        return table
+
+    def test_conflicts(self):
+        table = self._table()
+        self.assertEqual(find_conflicting_entries(table),
+                         [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3), (3, 4)])
+        self.assertEqual(find_shadowed_entries(table),
+                         [(1, 0), (2, 0), (4, 3)])
+
+    def test_matches_scan(self):
+        rng = random.Random(3)
+        table = MulticastRoutingTable()
+        for _ in range(100):
+            mask = 0xFFFFFF00 | rng.getrandbits(8)
+            table.add_route(rng.getrandbits(8) & mask, mask, rng.randrange(4))
+        rows = list(zip(table.keys, table.masks, table.routes))
+        expected = [
+            (i, j) for i in range(len(rows)) for j in range(i + 1, len(rows))
+            if rows[i][2] != rows[j][2] and
+            intersect(rows[i][0], rows[i][1], rows[j][0], rows[j][1])]
+        self.assertEqual(find_conflicting_entries(table), expected)
+        shadowed = list()
+        for j, (key, mask, _) in enumerate(rows):
+            i = next((i for i in range(j) if rows[i][1] & ~mask == 0 and
+                      key & rows[i][1] == rows[i][0]), None)
+            if i is not None:
+                shadowed.append((j, i))
+        self.assertEqual(find_shadowed_entries(table), shadowed)
+
+    def test_machine(self):
+        clean = MulticastRoutingTable()
+        clean.add_route(0x10, 0xFFFFFFF0, 1)
+        tables = MulticastRoutingTables([
+            ((0, 0), clean), ((1, 0), self._table())])
+        problems = find_routing_table_conflicts(tables)
+        self.assertEqual(list(problems), [(1, 0)])
+        self.assertEqual(problems[1, 0][1], [(1, 0), (2, 0), (4, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+import unittest
+from spinn_machine import MulticastRoutingTable, RoutingTableLookup
+
+
+class TestRoutingTableLookup(unittest.TestCase):
+
+    def test_first_match(self):
+        table = MulticastRoutingTable()
+        table.add_route(0x10, 0xFFFFFFF0, 1)
+        table.add_route(0x12, 0xFFFFFFFF, 2)
+        table.add_route(0x10, 0xFFFFFFF0, 3)
+        table.add_route(0x00, 0xFFFFFF00, 4)
+        lookup = RoutingTableLookup(table)
+        self.assertEqual(len(lookup), 4)
+        self.assertEqual(lookup.get_index(0x12), 0)
+        self.assertEqual(lookup.get_route(0x1F), 1)
+        self.assertEqual(lookup.get_route(0x20), 4)
+        self.assertIsNone(lookup.get_index(0x100))
+        self.assertIsNone(lookup.get_route(0x100))
+        self.assertEqual(lookup.get_routes([0x12, 0x20, 0x100]),
+                         [1, 4, None])
+        self.assertEqual(str(lookup),
+                         "[RoutingTableLookup: 4 entries, 3 masks]")
+
+    def test_matches_scan(self):
+        rng = random.Random(7)
+        table = MulticastRoutingTable()
+        for _ in range(200):
+            mask = 0xFFFFFF00 | rng.getrandbits(8)
+            table.add_route(rng.getrandbits(8) & mask, mask, rng.randrange(8))
+        lookup = RoutingTableLookup(table)
+        keys = list(range(256))
+        expected = list()
+        for key in keys:
+            expected.append(next(
+                (i for i, (k, m) in enumerate(zip(table.keys, table.masks))
+                 if key & m == k), None))
+        self.assertEqual(lookup.get_indices(keys), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
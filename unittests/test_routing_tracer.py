@@ -0,0 +1,68 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import (
+    MulticastRoutingTable, MulticastRoutingTables, RoutingTracer,
+    virtual_machine)
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+EAST = 1 << 0
+NORTH = 1 << 2
+SOUTH = 1 << 5
+
+
+def _core(p):
+    return 1 << (6 + p)
+
+
+class TestRoutingTracer(unittest.TestCase):
+
+    def _tracer(self):
+        source = MulticastRoutingTable()
+        source.add_route(0x10, 0xFFFFFFF0, EAST)
+        source.add_route(0x30, 0xFFFFFFF0, EAST | _core(4))
+        middle = MulticastRoutingTable()
+        middle.add_route(0x10, 0xFFFFFFF0, _core(1) | _core(2) | NORTH)
+        middle.add_route(0x30, 0xFFFFFFF0, NORTH)
+        top = MulticastRoutingTable()
+        top.add_route(0x10, 0xFFFFFFF0, _core(3))
+        top.add_route(0x30, 0xFFFFFFF0, SOUTH)
+        tables = MulticastRoutingTables([
+            ((0, 0), source), ((2, 0), middle), ((2, 1), top)])
+        return RoutingTracer(virtual_machine(8, 8), tables)
+
+    def test_trace(self):
+        tracer = self._tracer()
+        # (1, 0) has no table so default routes the packet on to (2, 0)
+        self.assertEqual(tracer.trace((0, 0), 0x11),
+                         {(2, 0, 1), (2, 0, 2), (2, 1, 3)})
+        # Packets that match nothing where they are sent are dropped
+        self.assertEqual(tracer.trace((0, 0), 0x20), set())
+        # Packets going round in a loop are stopped
+        self.assertEqual(tracer.trace((0, 0), 0x30), {(0, 0, 4)})
+        self.assertIsNone(tracer.get_lookup(1, 0))
+
+    def test_trace_keys(self):
+        tracer = self._tracer()
+        keys = [0x11, 0x20, 0x30, 0x1F]
+        self.assertEqual(tracer.trace_keys((0, 0), keys),
+                         [tracer.trace((0, 0), key) for key in keys])
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            tracer.trace((20, 20), 0x10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,8 +13,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
 import unittest
 from spinn_machine import SpiNNakerTriadGeometry
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
 
 
 class TestingGeometry(unittest.TestCase):
@@ -56,6 +58,48 @@ class TestingGeometry(unittest.TestCase):
                     "x at ({},{}): expected ({},{}) but got ({},{})".format(
                         x, y, -px, -py, qx, qy))
 
+    def test_batch(self):
+        g = SpiNNakerTriadGeometry.get_spinn5_geometry()
+        xs = [x for x in range(-3, 30) for _ in range(-2, 27)]
+        ys = [y for _ in range(-3, 30) for y in range(-2, 27)]
+        local_x, local_y = g.get_local_chip_coordinates_batch(xs, ys, 1, 2)
+        self.assertEqual(
+            list(zip(local_x, local_y)),
+            [g.get_local_chip_coordinate(x, y, 1, 2) for x, y in zip(xs, ys)])
+        eth_x, eth_y = g.get_ethernet_chip_coordinates_batch(
+            iter(xs), iter(ys), 24, 24)
+        self.assertEqual(
+            list(zip(eth_x, eth_y)),
+            [g.get_ethernet_chip_coordinates(x, y, 24, 24)
+             for x, y in zip(xs, ys)])
+        self.assertEqual(
+            g.get_ethernet_chip_coordinates_batch([], [], 12, 12),
+            (array("i"), array("i")))
+
+    def test_batch_bad(self):
+        g = SpiNNakerTriadGeometry.get_spinn5_geometry()
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            g.get_local_chip_coordinates_batch([1, 2, 3], [1, 2])
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            g.get_ethernet_chip_coordinates_batch(
+                iter([1]), iter([1, 2]), 12, 12)
+
+        # A zero width is not taken to mean the offsets are wanted
+        with self.assertRaises(ZeroDivisionError):
+            g.get_ethernet_chip_coordinates(5, 3, 0, 12)
+        with self.assertRaises(ZeroDivisionError):
+            g.get_ethernet_chip_coordinates_batch([5], [3], 0, 12)
+
+    def test_other_geometry(self):
+        g = SpiNNakerTriadGeometry(10, 14, [(0, 0), (5, 7)], (2.5, 3.1))
+        self.assertEqual(g.get_local_chip_coordinate(0, 0), (0, 0))
+        self.assertEqual(g.get_local_chip_coordinate(5, 7), (0, 0))
+        self.assertEqual(g.get_local_chip_coordinate(4, 6), (4, 6))
+        self.assertEqual(g.get_ethernet_chip_coordinates(7, 9, 20, 28),
+                         (5, 7))
+        self.assertEqual(g.get_ethernet_chip_coordinates(19, 27, 20, 28),
+                         (15, 21))
+
     def test_get_potential_ethernet_chips(self):
         g = SpiNNakerTriadGeometry.get_spinn5_geometry()
         self.assertEqual(1, len(g.get_potential_ethernet_chips(2, 2)))
@@ -0,0 +1,38 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import virtual_machine
+from spinn_machine.topology import link_adjacency
+
+
+class TestTopology(unittest.TestCase):
+
+    def test_link_adjacency(self):
+        machine = virtual_machine(8, 8, down_links=[(1, 1, 0)])
+        adjacency = link_adjacency(machine)
+        self.assertEqual(len(adjacency), 48)
+        self.assertEqual(
+            adjacency[0, 0], ((0, (1, 0)), (1, (1, 1)), (2, (0, 1))))
+        self.assertEqual(
+            [link for link, _ in adjacency[1, 1]], [1, 2, 3, 4, 5])
+
+        # Links off the edge of the board go nowhere
+        self.assertEqual(
+            adjacency[7, 7], ((3, (6, 7)), (4, (6, 6)), (5, (7, 6))))
+
+
+if __name__ == '__main__':
+    unittest.main()
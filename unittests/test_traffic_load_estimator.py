@@ -0,0 +1,45 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from spinn_machine import (
+    MulticastTreeBuilder, TrafficLoadEstimator, virtual_machine)
+
+EAST = 0
+
+
+class TestTrafficLoadEstimator(unittest.TestCase):
+
+    def test_estimate(self):
+        machine = virtual_machine(8, 8)
+        tables = MulticastTreeBuilder(machine).build_routing_tables([
+            ((0, 0, 1), [(3, 0, 2)], 0x100, 0xFFFFFF00),
+            ((1, 0, 1), [(3, 0, 2), (3, 0, 3)], 0x200, 0xFFFFFF00)])
+        estimator = TrafficLoadEstimator(machine, tables)
+        link_loads, core_loads = estimator.estimate([
+            ((0, 0), 0x100, 10.0), ((0, 0), 0x101, 5.0),
+            ((1, 0), 0x200, 20.0)])
+        self.assertEqual(link_loads, {
+            (0, 0, EAST): 15.0, (1, 0, EAST): 35.0, (2, 0, EAST): 35.0})
+        self.assertEqual(core_loads, {(3, 0, 2): 35.0, (3, 0, 3): 20.0})
+
+        hotspots = TrafficLoadEstimator.hotspots(link_loads, 20.0)
+        self.assertEqual(hotspots, [
+            ((1, 0, EAST), 35.0), ((2, 0, EAST), 35.0)])
+        self.assertEqual(TrafficLoadEstimator.hotspots(core_loads, 40), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
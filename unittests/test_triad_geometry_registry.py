@@ -0,0 +1,130 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from spinn_machine import SpiNNakerTriadGeometry, TriadGeometryRegistry
+from spinn_machine.exceptions import SpinnMachineInvalidParameterException
+
+SPINN5 = (12, 12, [(0, 0), (4, 8), (8, 4)], (3.6, 3.4))
+OTHER = (10, 14, [(0, 0), (5, 7)], (2.5, 3.1))
+
+
+class TestTriadGeometryRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def _check_same(self, geometry, args):
+        made = SpiNNakerTriadGeometry(*args)
+        for x in range(args[0]):
+            for y in range(args[1]):
+                self.assertEqual(geometry.get_local_chip_coordinate(x, y),
+                                 made.get_local_chip_coordinate(x, y))
+
+    def test_lru(self):
+        registry = TriadGeometryRegistry(max_size=2)
+        spinn5 = registry.get_geometry(*SPINN5)
+        self._check_same(spinn5, SPINN5)
+        self.assertIs(registry.get_geometry(
+            12, 12, ((0, 0), (4, 8), (8, 4)), [3.6, 3.4]), spinn5)
+        registry.get_geometry(*OTHER)
+        self.assertEqual(len(registry), 2)
+
+        # Using SPINN5 makes OTHER the one dropped
+        registry.get_geometry(*SPINN5)
+        registry.get_geometry(8, 8, [(0, 0)], (3.5, 3.5))
+        self.assertIn(SPINN5, registry)
+        self.assertNotIn(OTHER, registry)
+        self.assertEqual(len(registry), 2)
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+        self.assertIsNot(registry.get_geometry(*SPINN5), spinn5)
+
+    def test_cache_dir(self):
+        registry = TriadGeometryRegistry(cache_dir=self._dir)
+        registry.get_geometry(*OTHER)
+        files = os.listdir(self._dir)
+        self.assertEqual(len(files), 1)
+        self.assertEqual(os.path.getsize(os.path.join(self._dir, files[0])),
+                         20 + len(repr(TriadGeometryRegistry._key(*OTHER))) +
+                         8 * 10 * 14)
+
+        # A new registry reads the table back rather than working it out
+        other = TriadGeometryRegistry(cache_dir=self._dir)
+        with mock.patch.object(
+                SpiNNakerTriadGeometry, "_offset_table",
+                side_effect=AssertionError("offsets worked out")):
+            geometry = other.get_geometry(*OTHER)
+        self._check_same(geometry, OTHER)
+        self.assertEqual(len(os.listdir(self._dir)), 1)
+
+        # A bad file is made again
+        with open(os.path.join(self._dir, files[0]), "wb") as f:
+            f.write(b"SMTG")
+        other = TriadGeometryRegistry(cache_dir=self._dir)
+        with mock.patch.object(
+                SpiNNakerTriadGeometry, "_offset_table",
+                wraps=SpiNNakerTriadGeometry._offset_table) as offset_table:
+            geometry = other.get_geometry(*OTHER)
+        offset_table.assert_called_once()
+        self._check_same(geometry, OTHER)
+        self.assertEqual(os.path.getsize(os.path.join(self._dir, files[0])),
+                         20 + len(repr(TriadGeometryRegistry._key(*OTHER))) +
+                         8 * 10 * 14)
+
+    @unittest.skipIf(os.name == "nt", "needs POSIX file modes")
+    def test_cache_file_mode(self):
+        umask = os.umask(0o022)
+        try:
+            TriadGeometryRegistry(cache_dir=self._dir).get_geometry(*OTHER)
+        finally:
+            os.umask(umask)
+        files = os.listdir(self._dir)
+        self.assertEqual(len(files), 1)
+        self.assertEqual(
+            os.stat(os.path.join(self._dir, files[0])).st_mode & 0o777, 0o644)
+
+    def test_offset_table_copied(self):
+        registry = TriadGeometryRegistry()
+        geometry = registry.get_geometry(*SPINN5)
+        offset_x, offset_y = geometry.offset_table
+        self.assertIsInstance(offset_x, tuple)
+        self.assertEqual(len(offset_y), 12 * 12)
+        self.assertEqual(geometry.get_local_chip_coordinate(5, 3), (5, 3))
+
+        # Changing a table given to or got from a geometry does not change
+        # the geometry
+        table = (list(offset_x), list(offset_y))
+        copy = SpiNNakerTriadGeometry(*SPINN5, offset_table=table)
+        table[0][3 * 12 + 5] = 0
+        self.assertEqual(copy.get_local_chip_coordinate(5, 3), (5, 3))
+        self.assertEqual(geometry.offset_table, copy.offset_table)
+
+    def test_bad(self):
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            TriadGeometryRegistry(max_size=0)
+        with self.assertRaises(SpinnMachineInvalidParameterException):
+            SpiNNakerTriadGeometry(*SPINN5, offset_table=([0], [0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,12 +15,13 @@
 
 import unittest
 from spinn_machine import (Chip, Link, Machine, machine_from_size, Router,
-                           SDRAM, virtual_machine)
+                           SDRAM, apply_ignores, virtual_machine)
 
 from spinn_machine.exceptions import (
     SpinnMachineException, SpinnMachineAlreadyExistsException,
     SpinnMachineInvalidParameterException)
-from spinn_machine.ignores import IgnoreChip, IgnoreCore, IgnoreLink
+from spinn_machine.ignores import (
+    IgnoreChip, IgnoreCore, IgnoreLink, resolve_ignores)
 from spinn_machine.machine_factory import machine_repair
 from .geometry import (to_xyz, shortest_mesh_path_length,
                        shortest_torus_path_length, minimise_xyz)
@@ -931,6 +932,112 @@ class TestVirtualMachine(unittest.TestCase):
         router = machine.get_chip_at(5, 3).router
         self.assertTrue(router.is_link(3))
 
+    def test_ignores_by_ip(self):
+        down_chips = IgnoreChip.parse_string("1,1,127.0.4.8:2,2")
+        down_cores = IgnoreCore.parse_string("3,3,-5,127.0.8.4")
+        down_links = IgnoreLink.parse_string("0,0,0,127.0.4.8")
+        machine = virtual_machine(
+            12, 12, down_chips=down_chips, down_cores=down_cores,
+            down_links=down_links)
+
+        self.assertFalse(machine.is_chip_at(5, 9))
+        self.assertFalse(machine.is_chip_at(2, 2))
+        self.assertTrue(machine.is_chip_at(1, 1))
+        self.assertFalse(machine.get_chip_at(11, 7).is_processor_with_id(6))
+        self.assertTrue(machine.get_chip_at(3, 3).is_processor_with_id(6))
+        self.assertFalse(machine.get_chip_at(4, 8).router.is_link(0))
+        self.assertTrue(machine.get_chip_at(0, 0).router.is_link(0))
+
+    def test_resolve_ignores(self):
+        machine = virtual_machine(12, 12)
+        self.assertEqual(
+            machine.get_chip_by_ip_address("127.0.8.4"),
+            machine.get_chip_at(8, 4))
+        self.assertIsNone(machine.get_chip_by_ip_address("127.0.1.1"))
+        chips, cores, links = resolve_ignores(
+            machine,
+            IgnoreChip.parse_string("7,7,127.0.4.8:1,2:3,3,127.0.1.1"),
+            [IgnoreCore(0, 1, 2, "127.0.8.4"), (1, 2, 3)],
+            [IgnoreLink(7, 7, 4, "127.0.8.4"), (6, 6, 1)])
+        self.assertEqual(chips, {(11, 3), (1, 2)})
+        self.assertEqual(cores, {(8, 5, 2), (1, 2, 3)})
+        self.assertEqual(links, {(3, 11, 4), (6, 6, 1)})
+
+    def test_apply_ignores(self):
+        machine = virtual_machine(12, 12, down_cores=[(7, 7, 3)])
+        self.assertIs(apply_ignores(machine), machine)
+        self.assertIs(apply_ignores(
+            machine, chips=[IgnoreChip(1, 1, "127.0.9.9"), (12, 12)]), machine)
+
+        new_machine = apply_ignores(
+            machine, chips=IgnoreChip.parse_string("1,1,127.0.4.8:2,2"),
+            cores=IgnoreCore.parse_string("3,3,-5,127.0.8.4:7,7,4"),
+            links=IgnoreLink.parse_string("0,0,0,127.0.4.8"))
+        self.assertEqual(machine.n_chips, 144)
+        self.assertEqual(new_machine.n_chips, 142)
+        self.assertFalse(new_machine.is_chip_at(5, 9))
+        self.assertFalse(new_machine.is_chip_at(2, 2))
+        self.assertFalse(new_machine.is_link_at(5, 8, 2))
+        self.assertFalse(new_machine.is_link_at(4, 8, 0))
+        self.assertFalse(new_machine.is_link_at(5, 8, 3))
+        self.assertTrue(new_machine.is_link_at(5, 8, 0))
+        self.assertFalse(
+            new_machine.get_chip_at(11, 7).is_processor_with_id(6))
+        chip = new_machine.get_chip_at(7, 7)
+        self.assertEqual(
+            [p.processor_id for p in chip.processors if p.processor_id < 6],
+            [0, 1, 2, 5])
+        self.assertEqual(chip.n_user_processors, 15)
+        self.assertTrue(machine.is_link_at(4, 8, 0))
+        self.assertEqual(
+            new_machine.get_chip_by_ip_address("127.0.4.8").ip_address,
+            "127.0.4.8")
+
+    def test_apply_ignores_repair(self):
+        machine = virtual_machine(8, 8)
+        links = [(3, 3, link) for link in range(6)]
+        with self.assertRaises(SpinnMachineException):
+            apply_ignores(machine, links=links)
+        new_machine = apply_ignores(machine, links=links, repair_machine=True)
+        self.assertFalse(new_machine.is_chip_at(3, 3))
+        self.assertEqual(new_machine.n_chips, 47)
+
+    def test_apply_ignores_monitor(self):
+        machine = virtual_machine(8, 8)
+        for core in (IgnoreCore(2, 2, -10), (2, 2, 0)):
+            with self.assertLogs(
+                    "spinn_machine.machine_factory", "WARNING") as logs:
+                self.assertIs(apply_ignores(machine, cores=[core]), machine)
+            self.assertIn("monitor", logs.output[0])
+
+        # Other cores of the same chip are still ignored
+        new_machine = apply_ignores(
+            machine, cores=[IgnoreCore(2, 2, -10), (2, 2, 3)])
+        chip = new_machine.get_chip_at(2, 2)
+        self.assertTrue(chip.is_processor_with_id(0))
+        self.assertTrue(chip.get_processor_with_id(0).is_monitor)
+        self.assertFalse(chip.is_processor_with_id(3))
+
+    def test_repair_removes_links_to_removed_chips(self):
+        down_chips = [(8, 6), (9, 7), (9, 8)]
+        machine = virtual_machine(16, 16, down_chips=down_chips)
+        self.assertTrue(machine.is_link_at(7, 7, 0))
+        with self.assertLogs(
+                "spinn_machine.machine_factory", "WARNING") as logs:
+            repaired = machine_repair(machine, repair_machine=True)
+        self.assertFalse(repaired.is_chip_at(8, 7))
+
+        # The links into the removed chip go with it, so are not reported
+        # as one way links; only the chip itself is reported
+        for link in range(6):
+            x, y = repaired.xy_over_link(8, 7, link)
+            if repaired.is_chip_at(x, y):
+                self.assertFalse(repaired.is_link_at(
+                    x, y, Router.opposite(link)))
+        self.assertEqual(len(logs.output), 2)
+        for output in logs.output:
+            self.assertNotIn("One way links", output)
+
     def test_n_cores_full_wrap(self):
         machine = virtual_machine(12, 12)
         n_cores = sum(